@@ -1,5 +1,44 @@
-from siunits.predefined import *
-from siunits.functions import unit
+import importlib
 
 __package_name__ = 'siunits'
 __version__ = '0.1'
+
+# numpy and the unit types are imported the first time a unit or a function is used, not by `import siunits`
+_exports = {
+    **dict.fromkeys([
+        'kg', 'm', 's', 'A', 'K', 'mol', 'cd',
+        'cm', 'mm', 'g', 'mg', 'minute', 'h', 'Hz', 'N', 'Pa', 'atm', 'L', 'J', 'cal', 'angstrom',
+        'W', 'C', 'V', 'F', 'ohm', 'Wb', 'T', 'H', 'degC', 'degF'
+    ], 'siunits.predefined'),
+    'unit': 'siunits.functions',
+    'Quantity': 'siunits.types',
+    'parse': 'siunits.parser',
+    'parse_many': 'siunits.parser',
+    'UnitParseError': 'siunits.parser',
+    'converter': 'siunits.conversion',
+    'convert_many': 'siunits.batch',
+    'read_csv': 'siunits.reader',
+    'read_lines': 'siunits.reader',
+    'BatchPlan': 'siunits.batch',
+}
+
+def __getattr__(name: str):
+    module = _exports.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(module), name)
+    elif not name.startswith('_'):
+        # prefixed units such as `siunits.km`
+        try:
+            value = getattr(importlib.import_module('siunits.predefined'), name)
+        except AttributeError:
+            raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
+    else:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    globals()[name] = value
+    return value
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_exports})
+
+__all__ = list(_exports)
@@ -0,0 +1,99 @@
+from typing import Any, Mapping
+
+import numpy as np
+from attrs import frozen
+from numpy.typing import ArrayLike, NDArray
+
+from siunits.types import UnitBase, Quantity
+from siunits.conversion import ConversionPlan, conversion_plan
+
+def _bare(unit: 'UnitBase | Quantity') -> UnitBase:
+    if isinstance(unit, Quantity):
+        unit = unit.unit
+    elif not isinstance(unit, UnitBase):
+        raise TypeError(f"Expected a unit, got {type(unit).__name__}")
+
+    # converted values are expressed in the bare unit, the same as `Quantity.to`
+    return unit if unit.multiplier == 1 else (unit ** 1)._with_multiplier(1)
+
+@frozen
+class BatchPlan:
+    """The conversions of a batch of named columns, resolved once and reusable for every later batch.
+
+    `columns` maps each column name to its source unit, its target unit and the plan between them. Columns that
+    convert between the same pair of units share one `ConversionPlan`.
+    """
+
+    columns: Mapping[str, tuple[UnitBase, UnitBase, ConversionPlan]]
+
+    @classmethod
+    def resolve(cls, units: Mapping[str, tuple[UnitBase, 'UnitBase | Quantity']]) -> 'BatchPlan':
+        """Resolves the plans for `{name: (source unit, target unit)}`, once for each distinct pair of units."""
+
+        plans: dict[tuple[int, int], ConversionPlan] = {}
+        columns = {}
+        for name, (source, target) in units.items():
+            source, target = _bare(source), _bare(target)
+            # units are interned, and `columns` keeps them alive, so their ids identify the pair
+            key = (id(source), id(target))
+            plan = plans.get(key)
+            if plan is None:
+                plan = plans[key] = conversion_plan(source, target)
+            columns[name] = (source, target, plan)
+
+        return cls(columns)
+
+    def __call__(self, batch: Mapping[str, 'Quantity | ArrayLike'], *,
+                 out: Mapping[str, NDArray[Any]] | None = None) -> dict[str, Quantity]:
+        """Converts every column of `batch` with its resolved plan.
+
+        A plain array is taken to be in the source unit of its column. A quantity in another unit than the one the
+        plan was resolved for is converted from its own unit.
+
+        :param out: Arrays to write the converted values of some or all columns into, by column name
+        """
+
+        # every output array is checked before any column is written
+        conversions = []
+        for name, values in batch.items():
+            source, target, plan = self.columns[name]
+            if isinstance(values, Quantity):
+                if values.unit is not source:
+                    source, plan = values.unit, conversion_plan(values.unit, target)
+                values = values.value
+
+            buffer = None if out is None else out.get(name)
+            if buffer is not None:
+                values, buffer = np.asarray(values), np.asarray(buffer)
+                dtype = plan.result_type(values)
+                if not np.can_cast(dtype, buffer.dtype, casting='same_kind'):
+                    raise TypeError(f"Cannot convert values of dtype {values.dtype} from '{source}' to '{target}' in "
+                                    f"an array of dtype {buffer.dtype} for column '{name}'; the result is {dtype}")
+            conversions.append((name, values, target, plan, buffer))
+
+        results = {}
+        for name, values, target, plan, buffer in conversions:
+            values = plan(values) if buffer is None else plan(values, out=buffer)
+            results[name] = Quantity._wrap(values, target)
+
+        return results
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+def convert_many(
+        columns: Mapping[str, tuple[Quantity, 'UnitBase | Quantity']]) -> tuple[dict[str, Quantity], BatchPlan]:
+    """Converts `{name: (quantity, target unit)}` in one pass.
+
+    Returns the converted quantities by name, and the `BatchPlan` that converted them; call the plan with
+    `{name: quantity}` to convert later batches with the same units without resolving anything again.
+    """
+
+    for name, (quantity, _) in columns.items():
+        if not isinstance(quantity, Quantity):
+            raise TypeError(f"Column '{name}' is not a Quantity, but {type(quantity).__name__}")
+
+    plan = BatchPlan.resolve({name: (quantity.unit, target) for name, (quantity, target) in columns.items()})
+    return plan({name: quantity for name, (quantity, _) in columns.items()}), plan
+
+__all__ = ['BatchPlan', 'convert_many']
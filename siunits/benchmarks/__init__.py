@@ -0,0 +1,81 @@
+"""Micro-benchmarks for siunits.
+
+Each module exposes a `run()` returning `{case: {metric: value}}` and can be run on its own with `python -m`. Every
+metric is lower-is-better: `time_us` is microseconds per call, `peak_bytes` is transient memory. The whole suite is
+run with `python -m siunits.benchmarks`, which can write the results to JSON and compare them against a baseline.
+"""
+
+import importlib
+import platform
+import sys
+from datetime import datetime, timezone
+from typing import NamedTuple
+
+SUITES = (
+    'algebra', 'arrays', 'conversion', 'measure', 'formatting', 'registry', 'parser', 'reader', 'storage', 'parallel',
+    'threads', 'importtime', 'dispatch', 'allocations'
+)
+
+# smaller problem sizes for a run that finishes in seconds
+_QUICK = {
+    'arrays': {'sizes': (10**3, 10**5)},
+    'conversion': {'size': 10**5},
+    'measure': {'size': 10**5},
+    'reader': {'rows': 10**4},
+    'storage': {'size': 10**5},
+    'parallel': {'size': 10**6},
+    'threads': {'iterations': 2000},
+    'importtime': {'repeat': 2},
+}
+
+class Change(NamedTuple):
+    suite: str
+    case: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float('inf')
+
+def run_suite(suites: tuple[str, ...] = SUITES, quick: bool = False) -> dict:
+    """Runs the given benchmark modules, and returns their results together with a description of the environment."""
+
+    import numpy
+    import siunits
+
+    results = {}
+    for suite in suites:
+        if suite not in SUITES:
+            raise ValueError(f"Unknown benchmark suite '{suite}'")
+
+        module = importlib.import_module(f'{__name__}.{suite}')
+        results[suite] = module.run(**(_QUICK.get(suite, {}) if quick else {}))
+
+    return {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': sys.version.split()[0],
+            'numpy': numpy.__version__,
+            'siunits': siunits.__version__,
+            'platform': platform.platform(),
+            'quick': quick,
+        },
+        'results': results,
+    }
+
+def compare(current: dict, baseline: dict) -> list[Change]:
+    """Pairs up every metric present in both runs."""
+
+    changes = []
+    for suite, cases in current['results'].items():
+        for case, metrics in cases.items():
+            base_metrics = baseline['results'].get(suite, {}).get(case, {})
+            for metric, value in metrics.items():
+                if metric in base_metrics:
+                    changes.append(Change(suite, case, metric, base_metrics[metric], value))
+
+    return changes
+
+__all__ = ['SUITES', 'Change', 'run_suite', 'compare']
@@ -0,0 +1,54 @@
+import argparse
+import json
+import sys
+
+from siunits.benchmarks import SUITES, run_suite, compare
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m siunits.benchmarks', description="Runs the siunits benchmarks.")
+    parser.add_argument('suites', nargs='*', metavar='suite',
+                        help=f"suites to run, all of them by default: {', '.join(SUITES)}")
+    parser.add_argument('-o', '--output', help="write the results to this JSON file")
+    parser.add_argument('-b', '--baseline', help="compare against the results in this JSON file")
+    parser.add_argument('-t', '--threshold', type=float, default=0.25,
+                        help="relative slowdown reported as a regression (default: 0.25)")
+    parser.add_argument('-q', '--quick', action='store_true', help="use smaller array sizes")
+    args = parser.parse_args(argv)
+
+    unknown = [suite for suite in args.suites if suite not in SUITES]
+    if unknown:
+        parser.error(f"unknown suite(s): {', '.join(unknown)} (choose from {', '.join(SUITES)})")
+
+    report = run_suite(tuple(args.suites) or SUITES, quick=args.quick)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    if args.baseline is None:
+        for suite, cases in report['results'].items():
+            print(f"[{suite}]")
+            for case, metrics in cases.items():
+                values = '  '.join(f"{metric}={value:.3f}" for metric, value in metrics.items())
+                print(f"  {case:<40} {values}")
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    regressions = 0
+    for change in compare(report, baseline):
+        flag = ''
+        if change.ratio > 1 + args.threshold:
+            flag = '  REGRESSION'
+            regressions += 1
+        elif change.ratio < 1 - args.threshold:
+            flag = '  improved'
+        print(f"{change.suite:<12} {change.case:<40} {change.metric:<10} "
+              f"{change.baseline:12.3f} -> {change.current:12.3f}  x{change.ratio:5.2f}{flag}")
+
+    print(f"{regressions} regression(s) beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
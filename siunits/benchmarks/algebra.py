@@ -0,0 +1,34 @@
+from siunits.benchmarks._timing import per_call
+
+def run() -> dict[str, dict[str, float]]:
+    from siunits.predefined import kg, m, s, A, N, ohm, atm
+    from siunits.types import ComplexUnit, si_cache_clear
+
+    derived = kg * m / s**2
+    cases = {
+        # scalar unit arithmetic
+        'm * s': lambda: m * s,
+        'm / s': lambda: m / s,
+        'm ** 2': lambda: m ** 2,
+        'kg * m / s**2': lambda: kg * m / s**2,
+        'N == kg * m / s**2': lambda: N == derived,
+        'N + N': lambda: N + N,
+        # construction
+        'ComplexUnit(dict)': lambda: ComplexUnit({kg: 1, m: 2, s: -3, A: -2}),
+        # decomposition
+        'ohm.si() (memoized)': lambda: ohm.si(),
+        'ohm.si() (cold)': lambda: (si_cache_clear(), ohm.si()),
+        'ohm.expand()': lambda: ohm.expand(),
+        'atm.expand()': lambda: atm.expand(),
+    }
+
+    return {name: {'time_us': per_call(stmt)} for name, stmt in cases.items()}
+
+def main():
+    for name, result in run().items():
+        print(f"{name:<24} {result['time_us']:10.3f} us")
+
+if __name__ == '__main__':
+    main()
+
+__all__ = ['run']
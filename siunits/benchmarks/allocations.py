@@ -0,0 +1,51 @@
+import tracemalloc
+
+from siunits.benchmarks._timing import per_call
+
+# expressions of the unit algebra, evaluated with the names of `siunits.predefined`
+EXPRESSIONS = [
+    'kg * m / s**2',
+    'N * m / s',
+    'ohm.expand()',
+    '(kg * m / s**2).si()',
+    'atm.to(Pa)',
+]
+
+def _peak_bytes(code, namespace: dict, number: int) -> float:
+    """The largest amount of memory alive at once while evaluating, averaged over `number` runs, in bytes."""
+
+    total = 0
+    for _ in range(number):
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        eval(code, namespace)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        total += peak - start
+
+    return total / number
+
+def run(number: int = 200) -> dict[str, dict[str, float]]:
+    import siunits.predefined
+
+    namespace = vars(siunits.predefined).copy()
+    results = {}
+
+    for expression in EXPRESSIONS:
+        code = compile(expression, '<benchmark>', 'eval')
+        results[expression] = {
+            'time_us': per_call(lambda: eval(code, namespace)),
+            'peak_bytes': _peak_bytes(code, namespace, number),
+        }
+
+    return results
+
+def main():
+    for expression, result in run().items():
+        print(f"{expression:<24} {result['time_us']:10.2f} us {result['peak_bytes']:10.0f} B")
+
+if __name__ == '__main__':
+    main()
+
+__all__ = ['EXPRESSIONS', 'run']
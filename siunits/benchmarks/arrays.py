@@ -0,0 +1,41 @@
+import numpy as np
+
+from siunits.benchmarks._timing import per_call
+
+SIZES = (10**3, 10**4, 10**5, 10**6, 10**7)
+
+def run(sizes: tuple[int, ...] = SIZES) -> dict[str, dict[str, float]]:
+    from siunits.predefined import m, cm, s
+
+    rng = np.random.default_rng(0)
+    results = {}
+
+    for size in sizes:
+        a = rng.random(size) * m
+        b = rng.random(size) * m
+        c = rng.random(size) * cm
+        t = (rng.random(size) + 1) * s
+
+        cases = {
+            'a + b': lambda: a + b,
+            'a + c (m + cm)': lambda: a + c,
+            'a * t': lambda: a * t,
+            'a / t': lambda: a / t,
+            'sqrt(a * a)': lambda: np.sqrt(a * a),
+            'a < c': lambda: a < c,
+            'sum(a)': lambda: a.sum(),
+            'array * unit': lambda: a.value * m,
+        }
+        for name, stmt in cases.items():
+            results[f'{name} [n={size}]'] = {'time_us': per_call(stmt, repeat=3)}
+
+    return results
+
+def main():
+    for name, result in run().items():
+        print(f"{name:<32} {result['time_us']:14.3f} us")
+
+if __name__ == '__main__':
+    main()
+
+__all__ = ['SIZES', 'run']
@@ -0,0 +1,48 @@
+import numpy as np
+
+from siunits.benchmarks._timing import per_call
+
+def run(size: int = 10**6) -> dict[str, dict[str, float]]:
+    from siunits.predefined import m, cm, h, s, atm, Pa, K, degC, degF
+    from siunits.conversion import conversion_plan, converter, conversion_cache_clear
+    from siunits.batch import convert_many
+
+    source, target = m / h, cm / s
+    scalar = 2 * atm
+    to_pa = converter(atm, Pa)
+    array = np.random.default_rng(0).random(size) * m
+    buffer = np.empty(size)
+    # a record batch: 30 columns of a thousandth of the array size each, in three pairs of units
+    rng = np.random.default_rng(0)
+    pairs = [(m, cm), (m / h, cm / s), (degC, K)]
+    batch = {f'c{i}': (rng.random(max(size // 1000, 1)) * pairs[i % 3][0], pairs[i % 3][1]) for i in range(30)}
+    _, batch_plan = convert_many(batch)
+    quantities = {name: quantity for name, (quantity, _) in batch.items()}
+    temperatures = (20 + 10 * np.random.default_rng(0).random(size)) * degC
+
+    cases = {
+        'atm.to(Pa)': lambda: atm.to(Pa),
+        'conversion_plan (cached)': lambda: conversion_plan(source, target),
+        'conversion_plan (cold)': lambda: (conversion_cache_clear(), conversion_plan(source, target)),
+        'scalar.to(Pa)': lambda: scalar.to(Pa),
+        'converter(atm, Pa)(2.0)': lambda: to_pa(2.0),
+        f'array.to(cm) [n={size}]': lambda: array.to(cm),
+        f'array.to(cm, out=) [n={size}]': lambda: array.to(cm, out=buffer),
+        f'degC.to(K) [n={size}]': lambda: temperatures.to(K),
+        f'degC.to(degF) [n={size}]': lambda: temperatures.to(degF),
+        f'degC - degC [n={size}]': lambda: temperatures - temperatures,
+        'batch: .to() per column [30 columns]': lambda: {name: q.to(t) for name, (q, t) in batch.items()},
+        'batch: convert_many [30 columns]': lambda: convert_many(batch),
+        'batch: BatchPlan reuse [30 columns]': lambda: batch_plan(quantities),
+    }
+
+    return {name: {'time_us': per_call(stmt)} for name, stmt in cases.items()}
+
+def main():
+    for name, result in run().items():
+        print(f"{name:<36} {result['time_us']:12.3f} us")
+
+if __name__ == '__main__':
+    main()
+
+__all__ = ['run']
@@ -0,0 +1,79 @@
+from typing import Any
+
+from siunits.utils import BinaryDispatch
+from siunits.types import Unit, ComplexUnit
+from siunits.benchmarks._timing import per_call
+
+# %% no-op dispatchers
+
+def _table_noop() -> BinaryDispatch:
+    f = BinaryDispatch('noop')
+
+    @f.register
+    def f(a: Unit, b: Unit):
+        return None
+    @f.register
+    def f(a: Unit, b: int | float):
+        return None
+    @f.register
+    def f(a: ComplexUnit, b: Unit):
+        return None
+    @f.register
+    def f(a: Any, b: Any):
+        return None
+
+    return f
+
+def _plum_noop():
+    try:
+        from plum import dispatch
+    except ImportError:
+        return None
+
+    @dispatch
+    def f(a: Unit, b: Unit):
+        return None
+    @dispatch
+    def f(a: Unit, b: int | float):
+        return None
+    @dispatch
+    def f(a: ComplexUnit, b: Unit):
+        return None
+    @dispatch
+    def f(a: Any, b: Any):
+        return None
+
+    return f
+
+# %% run
+
+def run(number: int | None = None) -> dict[str, dict[str, float]]:
+    from siunits.predefined import m, s, kg
+
+    ms = m / s
+    cases = {}
+
+    # dispatch overhead alone: the implementations do nothing
+    table = _table_noop()
+    cases['table_noop'] = lambda: table(m, s)
+    plum = _plum_noop()
+    if plum is not None:
+        cases['plum_noop'] = lambda: plum(m, s)
+
+    # real operations, dispatch included
+    cases['unit * unit'] = lambda: m * s
+    cases['unit / unit'] = lambda: m / s
+    cases['unit ** 2'] = lambda: m ** 2
+    cases['unit == unit'] = lambda: m == s
+    cases['complex * unit'] = lambda: ms * kg
+
+    return {name: {'time_us': per_call(stmt, number)} for name, stmt in cases.items()}
+
+def main():
+    for name, result in run().items():
+        print(f"{name:<16} {result['time_us']:10.3f} us")
+
+if __name__ == '__main__':
+    main()
+
+__all__ = ['run']
@@ -0,0 +1,31 @@
+import numpy as np
+
+from siunits.benchmarks._timing import per_call
+
+def run() -> dict[str, dict[str, float]]:
+    from siunits.predefined import kg, m, s, A, ohm
+
+    unit = kg * m**2 / (A**2 * s**3)
+    scalar = 9.81 * (m / s**2)
+    array = np.arange(10.) * ohm
+
+    cases = {
+        'str(Unit)': lambda: str(ohm),
+        'str(ComplexUnit)': lambda: str(unit),
+        'repr(ComplexUnit)': lambda: repr(unit),
+        'ComplexUnit latex': lambda: unit._repr_latex_(),
+        'Quantity.to_string() scalar': lambda: scalar.to_string(),
+        'Quantity.to_string(fmt=latex)': lambda: scalar.to_string(fmt='latex'),
+        'Quantity.to_string() [n=10]': lambda: array.to_string(),
+    }
+
+    return {name: {'time_us': per_call(stmt)} for name, stmt in cases.items()}
+
+def main():
+    for name, result in run().items():
+        print(f"{name:<32} {result['time_us']:10.3f} us")
+
+if __name__ == '__main__':
+    main()
+
+__all__ = ['run']
@@ -0,0 +1,79 @@
+import re
+import subprocess
+import sys
+import time
+
+# what a short-lived process typically does: import the package, then use a unit or two
+STATEMENTS = {
+    'import siunits': 'import siunits',
+    'import siunits.predefined': 'import siunits.predefined',
+    'siunits.N': 'import siunits; siunits.N',
+    "siunits.parse('kN*m')": "import siunits; siunits.parse('kN*m')",
+    'from siunits.predefined import *': 'from siunits.predefined import *',
+}
+
+_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)')
+
+def _importtime(code: str) -> tuple[float, int]:
+    """Runs `code` in a fresh interpreter under `-X importtime`.
+
+    Returns the cumulative time of the imports made after start-up, in microseconds, and how many modules they load.
+    """
+
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], check=True, capture_output=True,
+                            text=True)
+
+    total = 0
+    modules = 0
+    started = False
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match is None:
+            continue
+
+        _, cumulative, indent, name = match.groups()
+        # the interpreter's own start-up imports come first; the measured code starts at the first siunits import
+        started = started or name.split('.')[0] == 'siunits'
+        if not started:
+            continue
+
+        modules += 1
+        if not indent:
+            total += int(cumulative)
+
+    return total, modules
+
+def _wall(code: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', code], check=True)
+    return time.perf_counter() - start
+
+def run(repeat: int = 5) -> dict[str, dict[str, float]]:
+    """Import cost of the package in a fresh interpreter.
+
+    `time_us` is the cumulative time reported by `python -X importtime` for the imports the statement makes, and
+    `wall_us` is the wall time of the whole statement less the start-up time of the interpreter itself.
+    """
+
+    startup = min(_wall('pass') for _ in range(repeat))
+
+    results = {}
+    for name, code in STATEMENTS.items():
+        runs = [_importtime(code) for _ in range(repeat)]
+        results[name] = {
+            'time_us': min(total for total, _ in runs),
+            'wall_us': (min(_wall(code) for _ in range(repeat)) - startup) * 1e6,
+            'modules': runs[0][1],
+        }
+
+    return results
+
+def main():
+    for name, result in run().items():
+        print(f"{name:<36} {result['time_us'] / 1000:8.1f} ms  {result['wall_us'] / 1000:8.1f} ms wall  "
+              f"{result['modules']:4d} modules")
+
+if __name__ == '__main__':
+    main()
+
+__all__ = ['STATEMENTS', 'run']
@@ -0,0 +1,36 @@
+import numpy as np
+
+from siunits.benchmarks._timing import per_call
+
+def run(size: int = 10**7) -> dict[str, dict[str, float]]:
+    from siunits.measure import Measure
+
+    C = Measure()
+    F = 9/5 * C + 32
+    K = (F - 32) * 5/9 + 273.15
+    dB = 10 * np.log10(C)
+    log = np.random.default_rng(0).random(size) * 40
+
+    # what the same scales cost as nested closures, evaluated step by step
+    nested_F = lambda x: x * (9/5) + 32
+    nested_K = lambda x: (nested_F(x) - 32) * 5 / 9 + 273.15
+
+    cases = {
+        'F(100)': lambda: F(100),
+        'K(100)': lambda: K(100),
+        f'F(array) [n={size}]': lambda: F(log),
+        f'K(array) [n={size}]': lambda: K(log),
+        f'dB(array) [n={size}]': lambda: dB(log),
+        f'nested closures K(array) [n={size}]': lambda: nested_K(log),
+    }
+
+    return {name: {'time_us': per_call(stmt, repeat=3)} for name, stmt in cases.items()}
+
+def main():
+    for name, result in run().items():
+        print(f"{name:<40} {result['time_us']:12.3f} us")
+
+if __name__ == '__main__':
+    main()
+
+__all__ = ['run']
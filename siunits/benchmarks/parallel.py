@@ -0,0 +1,33 @@
+import os
+
+import numpy as np
+
+from siunits.benchmarks._timing import per_call
+
+def _transform(q):
+    # a CPU-heavy, unit-aware map: several transcendental passes per element
+    from siunits.predefined import s
+    return np.sqrt(np.exp(np.sin(q.value) ** 2) + np.log1p(np.abs(q.value))) * q / (2 * s)
+
+def run(size: int = 10**7) -> dict[str, dict[str, float]]:
+    from siunits.predefined import km
+    from siunits.parallel import map_chunks
+
+    q = np.random.default_rng(0).random(size) * km
+    workers = os.cpu_count() or 1
+
+    cases = {
+        f'serial [n={size}]': lambda: _transform(q),
+        f'map_chunks, {workers} workers [n={size}]': lambda: map_chunks(_transform, q, workers=workers),
+    }
+
+    return {name: {'time_us': per_call(stmt, number=1, repeat=3)} for name, stmt in cases.items()}
+
+def main():
+    for name, result in run().items():
+        print(f"{name:<40} {result['time_us'] / 1000:10.3f} ms")
+
+if __name__ == '__main__':
+    main()
+
+__all__ = ['run']
@@ -0,0 +1,25 @@
+from siunits.benchmarks._timing import per_call
+
+_EXPRESSIONS = ('kg*m/s^2', 'kN·m', 'μmol/L', 'J/(mol⋅K)', 'm²/s')
+
+def run() -> dict[str, dict[str, float]]:
+    from siunits.parser import _Parser, parse, parse_many
+
+    headers = list(_EXPRESSIONS) * 200
+
+    cases = {}
+    for expression in _EXPRESSIONS:
+        cases[f"uncached '{expression}'"] = lambda e=expression: _Parser(e).parse()
+        cases[f"parse('{expression}')"] = lambda e=expression: parse(e)
+    cases[f"parse_many({len(headers)} headers)"] = lambda: parse_many(headers)
+
+    return {name: {'time_us': per_call(stmt)} for name, stmt in cases.items()}
+
+def main():
+    for name, result in run().items():
+        print(f"{name:<32} {result['time_us']:10.3f} us")
+
+if __name__ == '__main__':
+    main()
+
+__all__ = ['run']
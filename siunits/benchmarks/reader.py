@@ -0,0 +1,31 @@
+from siunits.benchmarks._timing import per_call
+
+def run(rows: int = 10**5) -> dict[str, dict[str, float]]:
+    from siunits.predefined import kPa, Pa, m
+    from siunits.reader import read_csv
+
+    cells = ['p,x'] + [f'{i * 0.1:.1f} kPa,{i} m' for i in range(rows)]
+    header = ['p [kPa],x [m]'] + [f'{i * 0.1:.1f},{i}' for i in range(rows)]
+
+    def by_hand():
+        # what reading looks like without the reader: split every line and multiply lists by units
+        p, x = zip(*(line.split(',') for line in header[1:]))
+        return [float(v) for v in p] * kPa, [float(v) for v in x] * m
+
+    cases = {
+        f'read_csv, units in cells [rows={rows}]': lambda: list(read_csv(cells)),
+        f'read_csv, units in header [rows={rows}]': lambda: list(read_csv(header)),
+        f'read_csv, to=Pa [rows={rows}]': lambda: list(read_csv(header, to={'p': Pa})),
+        f'split and list * unit [rows={rows}]': by_hand,
+    }
+
+    return {name: {'time_us': per_call(stmt, number=1)} for name, stmt in cases.items()}
+
+def main():
+    for name, result in run().items():
+        print(f"{name:<40} {result['time_us'] / 1000:10.3f} ms")
+
+if __name__ == '__main__':
+    main()
+
+__all__ = ['run']
@@ -0,0 +1,22 @@
+from siunits.benchmarks._timing import per_call
+
+def run() -> dict[str, dict[str, float]]:
+    from siunits.functions import unit
+
+    cases = {
+        "unit.find('m')": lambda: unit.find('m'),
+        "unit.find('H')": lambda: unit.find('H'),
+        "unit.find_all('T')": lambda: unit.find_all('T'),
+        "unit['Pa']": lambda: unit['Pa'],
+    }
+
+    return {name: {'time_us': per_call(stmt)} for name, stmt in cases.items()}
+
+def main():
+    for name, result in run().items():
+        print(f"{name:<24} {result['time_us']:10.3f} us")
+
+if __name__ == '__main__':
+    main()
+
+__all__ = ['run']
@@ -0,0 +1,43 @@
+import os
+import pickle
+import tempfile
+
+import numpy as np
+
+from siunits.benchmarks._timing import per_call
+
+def run(size: int = 10**7) -> dict[str, dict[str, float]]:
+    from siunits.predefined import kPa
+    from siunits.types import Quantity
+
+    q = np.random.default_rng(0).random(size) * kPa
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'q.npy')
+        plain = os.path.join(directory, 'plain.npy')
+        q.save(path)
+        np.save(plain, q.value)
+
+        cases = {
+            f'Quantity.save [n={size}]': lambda: q.save(path),
+            f'Quantity.load (mmap) [n={size}]': lambda: Quantity.load(path),
+            f'Quantity.load (read) [n={size}]': lambda: Quantity.load(path, mmap_mode=None),
+            f'np.load and Quantity() [n={size}]': lambda: Quantity(np.load(plain), kPa),
+            f'pickle round trip, protocol 4 [n={size}]': lambda: pickle.loads(pickle.dumps(q, protocol=4)),
+            f'pickle round trip, protocol 5 out of band [n={size}]': lambda: _out_of_band(q),
+        }
+
+        return {name: {'time_us': per_call(stmt, repeat=3)} for name, stmt in cases.items()}
+
+def _out_of_band(q):
+    buffers = []
+    data = pickle.dumps(q, protocol=5, buffer_callback=buffers.append)
+    return pickle.loads(data, buffers=buffers)
+
+def main():
+    for name, result in run().items():
+        print(f"{name:<40} {result['time_us']:12.3f} us")
+
+if __name__ == '__main__':
+    main()
+
+__all__ = ['run']
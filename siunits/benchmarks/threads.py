@@ -0,0 +1,60 @@
+import threading
+import time
+
+import numpy as np
+
+THREADS = (1, 2, 4, 8)
+
+def _workload(iterations: int) -> None:
+    from siunits.predefined import kg, m, s, cm, N, J
+    from siunits.parser import parse
+    from siunits.functions import unit
+
+    q = np.arange(16.) * m
+    for _ in range(iterations):
+        kg * m / s**2
+        (N * m).to(J)
+        q.to(cm)
+        parse('kN·m/s²')
+        unit.find('kPa')
+
+def _wall(threads: int, iterations: int) -> float:
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        barrier.wait()
+        _workload(iterations // threads)
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    return time.perf_counter() - start
+
+def run(iterations: int = 20000, repeat: int = 3) -> dict[str, dict[str, float]]:
+    """Wall time of a fixed amount of unit-heavy work split across threads.
+
+    Every case does the same total work, so on a free-threaded build the time should fall as threads are added, and
+    with the GIL it should stay flat rather than grow from contention.
+    """
+
+    _workload(10)    # build everything the workload touches before timing
+    return {
+        f'unit workload, {threads} threads': {
+            'time_us': min(_wall(threads, iterations) for _ in range(repeat)) * 1e6
+        }
+        for threads in THREADS
+    }
+
+def main():
+    for name, result in run().items():
+        print(f"{name:<32} {result['time_us'] / 1000:10.3f} ms")
+
+if __name__ == '__main__':
+    main()
+
+__all__ = ['THREADS', 'run']
@@ -1,51 +1,161 @@
-from siunits.utils import ArithmeticDict, pretty, SMALL_SPACE, MULTIPLY_SIGN, MULTIPLY_SIGN_LATEX
-from attrs import define, asdict
+from decimal import Decimal
+from fractions import Fraction
+from numbers import Integral, Rational, Real
+from operator import add, sub, mul, truediv
+from typing import Iterator
+
+from siunits.utils import pretty, SMALL_SPACE, MULTIPLY_SIGN, MULTIPLY_SIGN_LATEX
+
+# exponents are kept as small rationals: physical dimensions never need more than this
+_MAX_DENOMINATOR = 1000
+
+def _exponent(value: Real) -> int | Fraction:
+    """Normalizes an exponent to an `int`, or to a `Fraction` when it is not integral."""
+
+    if isinstance(value, Integral):
+        return int(value)
+    elif isinstance(value, Rational | Decimal):
+        value = Fraction(value)
+    elif isinstance(value, Real):
+        value = Fraction(float(value)).limit_denominator(_MAX_DENOMINATOR)
+    else:
+        raise TypeError(f"Unsupported type '{type(value)}' for dimension exponent")
+
+    return value.numerator if value.denominator == 1 else value
 
 # @commutative
-@define(frozen=True, hash=True)
 class Dimension:
-    length: int | float = 0
-    mass: int | float = 0
-    time: int | float = 0
-    current: int | float = 0
-    temperature: int | float = 0
-    amount: int | float = 0
-    intensity: int | float = 0
+    """Exponents of the seven SI base dimensions.
+
+    A dimension is stored as a fixed-width tuple of exponents and interned, so equal dimensions are always the same
+    object. The hash is computed once, and equality is an identity check.
+    """
+
+    __slots__ = ('_exponents', '_hash')
+
+    _fields: tuple[str, ...] = ('length', 'mass', 'time', 'current', 'temperature', 'amount', 'intensity')
+    _instances: dict[tuple[int | Fraction, ...], 'Dimension'] = {}
+
+    _exponents: tuple[int | Fraction, ...]
+    _hash: int
+
+    def __new__(cls, length: Real = 0, mass: Real = 0, time: Real = 0, current: Real = 0, temperature: Real = 0,
+                amount: Real = 0, intensity: Real = 0) -> 'Dimension':
+        return cls._from_exponents((length, mass, time, current, temperature, amount, intensity))
+
+    @classmethod
+    def _from_exponents(cls, exponents: Iterator[Real] | tuple[Real, ...]) -> 'Dimension':
+        # equal numbers hash alike, so a known dimension is found before normalizing its exponents
+        exponents = tuple(exponents)
+        try:
+            return cls._instances[exponents]
+        except KeyError:
+            pass
+
+        key = tuple(map(_exponent, exponents))
+        try:
+            return cls._instances[key]
+        except KeyError:
+            pass
+
+        instance = super().__new__(cls)
+        object.__setattr__(instance, '_exponents', key)
+        object.__setattr__(instance, '_hash', hash(key))
+        return cls._instances.setdefault(key, instance)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"'{self.__class__.__name__}' object is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"'{self.__class__.__name__}' object is immutable")
+
+    def __reduce__(self):
+        return self.__class__._from_exponents, (self._exponents,)
+
+    def __copy__(self) -> 'Dimension':
+        return self
+
+    def __deepcopy__(self, memo=None) -> 'Dimension':
+        return self
+
+    # fields
+    length = property(lambda self: self._exponents[0])
+    mass = property(lambda self: self._exponents[1])
+    time = property(lambda self: self._exponents[2])
+    current = property(lambda self: self._exponents[3])
+    temperature = property(lambda self: self._exponents[4])
+    amount = property(lambda self: self._exponents[5])
+    intensity = property(lambda self: self._exponents[6])
+
+    def __iter__(self) -> Iterator[int | Fraction]:
+        return iter(self._exponents)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        elif isinstance(other, Dimension):
+            # dimensions are interned, so two distinct instances are never equal
+            return False
+        else:
+            return NotImplemented
+
+    def __ne__(self, other) -> bool:
+        if self is other:
+            return False
+        elif isinstance(other, Dimension):
+            return True
+        else:
+            return NotImplemented
 
     def __add__(self, other: 'Dimension') -> 'Dimension':
-        return Dimension(length=self.length + other.length, mass=self.mass + other.mass, time=self.time + other.time,
-                         current=self.current + other.current, temperature=self.temperature + other.temperature,
-                         amount=self.amount + other.amount, intensity=self.intensity + other.intensity)
+        if not isinstance(other, Dimension):
+            return NotImplemented
+        elif other is dimensionless:
+            return self
+        elif self is dimensionless:
+            return other
+
+        return Dimension._from_exponents(map(add, self._exponents, other._exponents))
 
     def __sub__(self, other: 'Dimension') -> 'Dimension':
-        return Dimension(length=self.length - other.length, mass=self.mass - other.mass, time=self.time - other.time,
-                         current=self.current - other.current, temperature=self.temperature - other.temperature,
-                         amount=self.amount - other.amount, intensity=self.intensity - other.intensity)
+        if not isinstance(other, Dimension):
+            return NotImplemented
+        elif other is dimensionless:
+            return self
+
+        return Dimension._from_exponents(map(sub, self._exponents, other._exponents))
 
     def __mul__(self, other: 'Dimension | int | float') -> 'Dimension':
-        if isinstance(other, int | float):
-            return Dimension(length=self.length * other, mass=self.mass * other, time=self.time * other,
-                             current=self.current * other, temperature=self.temperature * other,
-                             amount=self.amount * other, intensity=self.intensity * other)
+        if isinstance(other, Dimension):
+            return Dimension._from_exponents(map(mul, self._exponents, other._exponents))
+        elif isinstance(other, Real):
+            if other == 1:
+                return self
+            elif other == 0:
+                return dimensionless
+
+            return Dimension._from_exponents(e * other for e in self._exponents)
         else:
-            return Dimension(length=self.length * other.length, mass=self.mass * other.mass,
-                             time=self.time * other.time,
-                             current=self.current * other.current, temperature=self.temperature * other.temperature,
-                             amount=self.amount * other.amount, intensity=self.intensity * other.intensity)
+            return NotImplemented
 
     def __rmul__(self, other):
         return self.__mul__(other)
 
     def __truediv__(self, other: 'Dimension | int | float') -> 'Dimension':
-        if isinstance(other, int | float):
-            return Dimension(length=self.length / other, mass=self.mass / other, time=self.time / other,
-                             current=self.current / other, temperature=self.temperature / other,
-                             amount=self.amount / other, intensity=self.intensity / other)
+        if isinstance(other, Dimension):
+            return Dimension._from_exponents(map(truediv, self._exponents, other._exponents))
+        elif isinstance(other, Real):
+            if other == 1:
+                return self
+
+            return Dimension._from_exponents(
+                Fraction(e, other) if isinstance(other, Integral) else e / other for e in self._exponents
+            )
         else:
-            return Dimension(length=self.length / other.length, mass=self.mass / other.mass,
-                             time=self.time / other.time,
-                             current=self.current / other.current, temperature=self.temperature / other.temperature,
-                             amount=self.amount / other.amount, intensity=self.intensity / other.intensity)
+            return NotImplemented
 
     def __str__(self) -> str:
         symbols = {
@@ -61,7 +171,10 @@ class Dimension:
         front = []
         back = []
 
-        for k, v in asdict(self).items():
+        for k, v in zip(self._fields, self._exponents):
+            if isinstance(v, Fraction):
+                v = float(v)
+
             if v > 0:
                 if v == 1:
                     front.append(symbols[k])
@@ -101,7 +214,10 @@ class Dimension:
         front = []
         back = []
 
-        for k, v in asdict(self).items():
+        for k, v in zip(self._fields, self._exponents):
+            if isinstance(v, Fraction):
+                v = float(v)
+
             if v > 0:
                 if v == 1:
                     front.append(symbols[k])
@@ -1,13 +1,39 @@
 from siunits.predefined import Unit, FixedUnit
 from siunits.types import UnitBase, ComplexUnit, Quantity
+from siunits.prefixes import resolve_prefixed
 from abc import ABC
 
+def _lookup(symbol: str) -> list[Unit]:
+    """Units whose symbol or alias is `symbol`, in order of creation; symbols come before aliases.
+
+    A symbol that is neither, such as `kPa`, may be an SI prefix on one, and the prefixed unit is created for it.
+    `Δ` before the symbol of an offset unit, as in `Δ°C`, is its delta unit.
+    """
+
+    found = Unit._lookup(symbol)
+    if not found:
+        generated = resolve_prefixed(symbol) or _resolve_delta(symbol)
+        if generated is not None:
+            found = [generated]
+
+    return found
+
+def _resolve_delta(symbol: str) -> Unit | None:
+    if not symbol.startswith('Δ'):
+        return None
+
+    for unit in _lookup(symbol[1:]):
+        if unit.offset != 0:
+            return unit.delta
+
+    return None
+
 class UnitRegistry(ABC):
     def find(self, symbol: str) -> Unit:
         """Find a unit with the given symbol.
 
         Args:
-            symbol (str): The symbol of the unit to find.
+            symbol (str): The symbol or alias of the unit to find.
 
         Raises:
             KeyError: If no unit with the given symbol is found.
@@ -16,17 +42,17 @@ class UnitRegistry(ABC):
             Unit: The unit with the given symbol.
         """
         
-        for k in Unit._instances:
-            if k[1] == symbol:
-                return Unit._instances[k]
+        found = _lookup(symbol)
+        if len(found) == 0:
+            raise KeyError(f"No unit with symbol '{symbol}'")
 
-        raise KeyError(f"No unit with symbol '{symbol}'")
+        return found[0]
     
     def find_all(self, symbol: str) -> list[Unit]:
         """Find all units with the given symbol.
 
         Args:
-            symbol (str): The symbol of the units to find.
+            symbol (str): The symbol or alias of the units to find.
 
         Raises:
             KeyError: If no unit with the given symbol is found.
@@ -35,15 +61,28 @@ class UnitRegistry(ABC):
             list[Unit]: The units with the given symbol.
         """
         
-        found: list[Unit] = []
-        for k in Unit._instances:
-            if k[1] == symbol:
-                found.append(Unit._instances[k])
-
+        found = _lookup(symbol)
         if len(found) == 0:
             raise KeyError(f"No unit with symbol '{symbol}'")
         
-        return found
+        return list(found)
+
+    def alias(self, name: str, value: Unit) -> Unit:
+        """Make a unit also findable by another name.
+
+        Args:
+            name (str): The alias.
+            value (Unit): The unit to find by the alias.
+
+        Returns:
+            Unit: The given unit.
+        """
+
+        if not isinstance(value, Unit):
+            raise TypeError(f"Unsupported type '{type(value)}' for value")
+
+        value._add_alias(name)
+        return value
 
     def set(self, symbol: str, value: UnitBase | Quantity, **kwargs) -> FixedUnit:
         """Set a unit with the given symbol and value.
@@ -55,13 +94,14 @@ class UnitRegistry(ABC):
                 - offset (float): The offset of the unit.  <br>
                 - multiplier (float): The multiplier of the unit. <br>
                 - latex_symbol (str): The LaTeX symbol of the unit.
+                - aliases (tuple[str, ...]): Other names to find the unit by.
 
         Returns:
             FixedUnit: The set unit.
         """
         
         if isinstance(value, Quantity):
-            return FixedUnit(symbol, value.to_complex_unit(), **kwargs)
+            return FixedUnit(symbol, value._to_complex_unit(), **kwargs)
         elif isinstance(value, ComplexUnit):
             return FixedUnit(symbol, value, **kwargs)
         elif isinstance(value, FixedUnit):
@@ -75,17 +115,13 @@ class UnitRegistry(ABC):
         return self.set(symbol, value)
     
     def __getitem__(self, symbol: str) -> Unit | list[Unit]:
-        found: list[Unit] = []
-        for k in Unit._instances:
-            if k[1] == symbol:
-                found.append(Unit._instances[k])
-
+        found = _lookup(symbol)
         if len(found) == 0:
             raise KeyError(f"No unit with symbol '{symbol}'")
         elif len(found) == 1:
             return found[0]
         else:
-            return found
+            return list(found)
         
     __str__ = __repr__ = lambda self: self.__class__.__name__
 
@@ -1,27 +1,381 @@
 import numpy as np
-from attrs import define
+from attrs import define, field, frozen
 
-from typing import overload, Callable
+from typing import Any, overload, Callable
 from math import log
 
+# %% expression tree
+
+@frozen
+class Variable:
+    """The value a `Measure` is called with."""
+
+    def __str__(self) -> str:
+        return 'x'
+
+@frozen
+class Constant:
+    value: Any
+
+    def __str__(self) -> str:
+        return f'{self.value}'
+
+@frozen
+class Affine:
+    """`operand * scale + offset`. Chains of additions and multiplications by constants fold into one of these."""
+
+    operand: 'Node'
+    scale: Any = 1
+    offset: Any = 0
+
+    def __str__(self) -> str:
+        operand = f'{self.operand}' if isinstance(self.operand, Variable | Apply) else f'({self.operand})'
+        term = operand if self.scale == 1 else f'{self.scale} * {operand}'
+        if self.offset == 0:
+            return term
+        elif isinstance(self.offset, int | float) and self.offset < 0:
+            return f'{term} - {-self.offset}'
+        return f'{term} + {self.offset}'
+
+@frozen
+class Apply:
+    """A function, usually a NumPy ufunc, applied to the values of its operands."""
+
+    func: Callable
+    operands: tuple['Node', ...]
+    kwargs: tuple[tuple[str, Any], ...] = ()
+
+    def __str__(self) -> str:
+        name = getattr(self.func, '__name__', repr(self.func))
+        args = [f'{operand}' for operand in self.operands] + [f'{k}={v!r}' for k, v in self.kwargs]
+        return f"{name}({', '.join(args)})"
+
+Node = Variable | Constant | Affine | Apply
+
+def _affine(node: Node, scale, offset) -> Node:
+    if isinstance(node, Constant):
+        return Constant(node.value * scale + offset)
+    elif isinstance(node, Affine):
+        return _affine(node.operand, node.scale * scale, node.offset * scale + offset)
+    elif scale == 1 and offset == 0:
+        return node
+    return Affine(node, scale, offset)
+
+def _parts(node: Node) -> tuple[Node, Any, Any]:
+    """`node` as `(operand, scale, offset)`."""
+
+    if isinstance(node, Affine):
+        return node.operand, node.scale, node.offset
+    return node, 1, 0
+
+def _apply(func: Callable, *operands: Node, **kwargs) -> Node:
+    """Builds `func(*operands)`, folding constants and affine chains as it goes."""
+
+    if all(isinstance(operand, Constant) for operand in operands):
+        return Constant(func(*(operand.value for operand in operands), **kwargs))
+
+    if not kwargs:
+        if func is np.positive:
+            return operands[0]
+        elif func is np.negative:
+            return _affine(operands[0], -1, 0)
+        elif func is np.subtract:
+            return _apply(np.add, operands[0], _affine(operands[1], -1, 0))
+        elif func is np.add:
+            a, b = operands
+            if isinstance(b, Constant):
+                return _affine(a, 1, b.value)
+            elif isinstance(a, Constant):
+                return _affine(b, 1, a.value)
+
+            # a * x + b + c * x + d is (a + c) * x + (b + d)
+            (x, s1, o1), (y, s2, o2) = _parts(a), _parts(b)
+            if x is y or isinstance(x, Variable) and isinstance(y, Variable):
+                return _affine(x, s1 + s2, o1 + o2)
+        elif func is np.multiply:
+            a, b = operands
+            if isinstance(b, Constant):
+                return _affine(a, b.value, 0)
+            elif isinstance(a, Constant):
+                return _affine(b, a.value, 0)
+        elif func is np.true_divide and isinstance(operands[1], Constant):
+            operand, scale, offset = _parts(operands[0])
+            return _affine(operand, scale / operands[1].value, offset / operands[1].value)
+
+    return Apply(func, operands, tuple(kwargs.items()))
+
+# %% evaluation
+
+def _result_dtype(func: np.ufunc, args: list, kwargs: dict) -> np.dtype | None:
+    """The dtype of `func(*args)`, or `None` if it cannot be told without calling it."""
+
+    if kwargs:
+        return None
+
+    # Python numbers are passed as their type, so they do not widen the dtype of an array, the same as in the call
+    dtypes = tuple(type(a) if type(a) in (int, float, complex) else np.asarray(a).dtype for a in args)
+    try:
+        return func.resolve_dtypes((*dtypes, None))[-1]
+    except (TypeError, ValueError):
+        return None
+
+def _into(func: np.ufunc, args: list, buffer: np.ndarray | None, **kwargs):
+    """Calls the ufunc `func`, writing into `buffer` when the result has its dtype.
+
+    A comparison or a predicate such as `isfinite` returns booleans, so it gets an array of its own.
+    """
+
+    if buffer is not None and _result_dtype(func, args, kwargs) == buffer.dtype:
+        return func(*args, out=buffer, **kwargs)
+
+    return func(*args, **kwargs)
+
+def _evaluate(node: Node, x) -> tuple[Any, bool]:
+    """Evaluates `node` at `x`, and tells whether the result is a temporary array that may be overwritten.
+
+    Temporaries are reused as the output of the next operation, so an affine step costs no allocation and a chain of
+    ufuncs over an array allocates once.
+    """
+
+    if isinstance(node, Variable):
+        return x, False
+    elif isinstance(node, Constant):
+        return node.value, False
+    elif isinstance(node, Affine):
+        value, owned = _evaluate(node.operand, x)
+        if not isinstance(value, np.ndarray):
+            return value * node.scale + node.offset, False
+
+        buffer = value if owned else None
+        if node.scale != 1:
+            value = _into(np.multiply, [value, node.scale], buffer)
+            buffer = value
+        if node.offset != 0:
+            value = _into(np.add, [value, node.offset], buffer)
+        return value, True
+    else:
+        args = []
+        buffer = None
+        for operand in node.operands:
+            value, owned = _evaluate(operand, x)
+            if owned and buffer is None:
+                buffer = value
+            args.append(value)
+
+        kwargs = dict(node.kwargs)
+        if isinstance(node.func, np.ufunc) and node.func.nout == 1 and 'out' not in kwargs:
+            shape = np.broadcast_shapes(*(np.shape(a) for a in args))
+            result = _into(node.func, args, buffer if buffer is not None and buffer.shape == shape else None,
+                           **kwargs)
+            return result, isinstance(result, np.ndarray)
+
+        # any other function may return its argument, so its result is never overwritten
+        return node.func(*args, **kwargs), False
+
+# %% inversion
+
+# ufuncs of one argument and their inverses
+_INVERSES: dict[Callable, Callable[[Node], Node]] = {
+    np.log10: lambda y: _apply(np.power, Constant(10), y),
+    np.cbrt: lambda y: _apply(np.power, y, Constant(3)),
+    np.reciprocal: lambda y: _apply(np.reciprocal, y),
+}
+for _f, _g in [
+    (np.exp, np.log), (np.exp2, np.log2), (np.expm1, np.log1p), (np.sqrt, np.square),
+    (np.sin, np.arcsin), (np.cos, np.arccos), (np.tan, np.arctan),
+    (np.sinh, np.arcsinh), (np.cosh, np.arccosh), (np.tanh, np.arctanh), (np.deg2rad, np.rad2deg),
+]:
+    _INVERSES[_f] = lambda y, g=_g: _apply(g, y)
+    _INVERSES[_g] = lambda y, f=_f: _apply(f, y)
+
+def _contains_variable(node: Node) -> bool:
+    if isinstance(node, Variable):
+        return True
+    elif isinstance(node, Affine):
+        return _contains_variable(node.operand)
+    elif isinstance(node, Apply):
+        return any(_contains_variable(operand) for operand in node.operands)
+    return False
+
+def _invert(node: Node, y: Node) -> Node | None:
+    """The tree computing `x` from `y = node(x)`, or `None` if there is no closed form.
+
+    The tree is unwound from the outside in; this works whenever `x` appears in a single operand at every step.
+    """
+
+    if isinstance(node, Variable):
+        return y
+    elif isinstance(node, Affine):
+        if node.scale == 0:
+            return None
+        return _invert(node.operand, _affine(y, 1 / node.scale, -node.offset / node.scale))
+    elif not isinstance(node, Apply) or node.kwargs:
+        return None
+
+    if isinstance(node.func, _NumericalInverse):
+        return _invert(node.operands[0], _substitute(node.func.forward, y))
+
+    if len(node.operands) == 1:
+        inverse = _INVERSES.get(node.func)
+        return None if inverse is None else _invert(node.operands[0], inverse(y))
+
+    if len(node.operands) != 2:
+        return None
+
+    (u, c), i = node.operands, 0
+    if isinstance(u, Constant):
+        (c, u), i = node.operands, 1
+    if not isinstance(c, Constant) or _contains_variable(c):
+        return None
+
+    if node.func is np.true_divide:
+        # u / c = y gives u = y * c, and c / u = y gives u = c / y
+        y = _affine(y, c.value, 0) if i == 0 else _apply(np.true_divide, c, y)
+    elif node.func is np.power:
+        # u ** p = y gives u = y ** (1 / p), and b ** u = y gives u = log(y) / log(b)
+        y = _apply(np.power, y, Constant(1 / c.value)) if i == 0 else _affine(_apply(np.log, y), 1 / np.log(c.value), 0)
+    else:
+        # additions and multiplications by constants are already folded into affine steps
+        return None
+
+    return _invert(u, y)
+
+def _substitute(node: Node, value: Node) -> Node:
+    """`node` with `value` in place of the variable."""
+
+    if isinstance(node, Variable):
+        return value
+    elif isinstance(node, Affine):
+        return _affine(_substitute(node.operand, value), node.scale, node.offset)
+    elif isinstance(node, Apply):
+        return _apply(node.func, *(_substitute(operand, value) for operand in node.operands), **dict(node.kwargs))
+    return node
+
+# refinement stops when the bracket is this tight relative to the root, or after this many steps
+_TOLERANCE = 4 * np.finfo(float).eps
+_MAX_ITERATIONS = 100
+
+@define(eq=False)
+class _NumericalInverse:
+    """The inverse of a monotonic `forward` tree on `[lower, upper]`, found by vectorized root finding.
+
+    `forward` is tabulated once on a grid, which is kept. Every value is bracketed by binary search on the table and
+    refined with the Illinois variant of regula falsi, every element at once.
+    """
+
+    forward: Node
+    lower: float
+    upper: float
+    samples: int = 1025
+    _table: tuple[np.ndarray, np.ndarray] | None = field(default=None, init=False, repr=False)
+
+    __name__ = 'inverse'
+
+    def table(self) -> tuple[np.ndarray, np.ndarray]:
+        if self._table is None:
+            x = np.linspace(self.lower, self.upper, self.samples)
+            y = np.asarray(_evaluate(self.forward, x)[0], dtype=float)
+
+            steps = np.diff(y)
+            if np.all(steps < 0):
+                x, y = x[::-1], y[::-1]
+            elif not np.all(steps > 0):
+                raise ValueError(f"'{self.forward}' is not monotonic on [{self.lower}, {self.upper}]")
+
+            self._table = (x, y)
+
+        return self._table
+
+    def __call__(self, y):
+        xs, ys = self.table()
+        y = np.asarray(y, dtype=float)
+        if np.any((y < ys[0]) | (y > ys[-1])):
+            raise ValueError(f"Value outside the range [{ys[0]}, {ys[-1]}] of '{self.forward}'")
+
+        i = np.clip(np.searchsorted(ys, y), 1, len(ys) - 1)
+        a, b = xs[i - 1], xs[i]
+        fa, fb = ys[i - 1] - y, ys[i] - y
+
+        for _ in range(_MAX_ITERATIONS):
+            done = (fb == 0) | (np.abs(b - a) <= _TOLERANCE * np.maximum(np.abs(b), 1))
+            if np.all(done):
+                break
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                c = np.where(fb == fa, b, (a * fb - b * fa) / (fb - fa))
+            c = np.where(done, b, c)
+            fc = np.asarray(_evaluate(self.forward, c)[0], dtype=float) - y
+
+            # keep the root bracketed; halving the stale end's value stops it from stalling the bracket
+            same = np.sign(fc) == np.sign(fb)
+            a, fa = np.where(same, a, b), np.where(same, fa / 2, fb)
+            b, fb = c, fc
+
+        return b[()]
+
+# %% Measure
+
+def _node(value) -> Node:
+    if isinstance(value, Measure):
+        return value.node
+    elif isinstance(value, Variable | Constant | Affine | Apply):
+        return value
+    elif callable(value):
+        # a plain converter function, as in `Measure(lambda x: ...)`
+        return Apply(value, (Variable(),))
+    return Constant(value)
+
 @define
 class Measure:
-    converter: Callable[[float], float] = lambda x: x
+    """A scale of measurement defined by how it is computed from a value, such as `9/5 * C + 32` from Celsius.
+
+    Arithmetic and NumPy ufuncs on a Measure build an expression tree (`node`) instead of nesting closures. Additions
+    and multiplications by constants fold into a single affine step, and calling the Measure on an array evaluates the
+    tree in one vectorized pass that reuses its temporary arrays.
+    """
+
+    # `converter` is the name the argument had when a Measure held a single function, as in `Measure(converter=f)`
+    node: Node = field(factory=Variable, converter=_node, alias='converter')
 
     def __call__(self, x: float) -> float:
-        return self.converter(x)
+        return _evaluate(self.node, x)[0]
+
+    @property
+    def converter(self) -> Callable[[float], float]:
+        return self.__call__
+
+    def __str__(self) -> str:
+        return f'{self.node}'
+
+    def inverse(self, domain: tuple[float, float] | None = None, samples: int = 1025) -> 'Measure':
+        """The Measure that undoes this one, so that `F.inverse()(F(x))` is `x`.
+
+        Affine steps, powers, `exp`, the logarithms and other invertible ufuncs are inverted analytically. Any other
+        tree needs `domain`, an interval on which it is monotonic, and is then inverted numerically: the tree is
+        tabulated once on `samples` points and every value is refined from its bracket in a vectorized loop.
+
+        Raises:
+            ValueError: If there is no closed form and no `domain`, or the tree is not monotonic on `domain`.
+        """
+
+        inverse = _invert(self.node, Variable())
+        if inverse is not None:
+            return Measure(inverse)
+        elif domain is None:
+            raise ValueError(f"'{self}' has no closed-form inverse; pass the domain on which it is monotonic")
+
+        lower, upper = domain
+        return Measure(Apply(_NumericalInverse(self.node, lower, upper, samples), (Variable(),)))
 
     def __pos__(self) -> 'Measure':
         return self
 
     def __neg__(self) -> 'Measure':
-        return Measure(lambda x: -self.converter(x))
+        return Measure(_apply(np.negative, self.node))
 
     def __add__(self, other) -> 'Measure':
-        if isinstance(other, (int, float)):
-            return Measure(lambda x: self.converter(x) + other)
-        elif isinstance(other, Measure):
-            return Measure(lambda x: self.converter(x) + other.converter(x))
+        if isinstance(other, (int, float, Measure)):
+            return Measure(_apply(np.add, self.node, _node(other)))
         else:
             return NotImplemented
 
@@ -34,26 +388,31 @@ class Measure:
     def __rsub__(self, other: 'Measure | int | float') -> 'Measure':
         return (-self).__add__(other)
 
-    def __mul__(self, other: int | float) -> 'Measure':
-        return Measure(lambda x: self.converter(x) * other)
+    def __mul__(self, other: 'Measure | int | float') -> 'Measure':
+        return Measure(_apply(np.multiply, self.node, _node(other)))
 
     def __rmul__(self, other: int | float) -> 'Measure':
-        return self.__mul__(other)
+        return Measure(_apply(np.multiply, _node(other), self.node))
 
-    def __truediv__(self, other: int | float) -> 'Measure':
-        return Measure(lambda x: self.converter(x) / other)
+    def __truediv__(self, other: 'Measure | int | float') -> 'Measure':
+        return Measure(_apply(np.true_divide, self.node, _node(other)))
 
     def __rtruediv__(self, other: int | float) -> 'Measure':
-        return Measure(lambda x: other / self.converter(x))
+        return Measure(_apply(np.true_divide, _node(other), self.node))
 
     def __pow__(self, power: int | float) -> 'Measure':
-        return Measure(lambda x: self.converter(x) ** power)
+        if isinstance(power, int | float) and power == 1:
+            return self
+        return Measure(_apply(np.power, self.node, _node(power)))
 
     def __rpow__(self, base: int | float) -> 'Measure':
-        return Measure(lambda x: base ** self.converter(x))
+        return Measure(_apply(np.power, _node(base), self.node))
 
     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs) -> 'Measure':
-        return Measure(lambda x: ufunc(self.converter(x), *inputs[1:], **kwargs))
+        if method != '__call__' or 'out' in kwargs:
+            return NotImplemented
+
+        return Measure(_apply(ufunc, *(_node(value) for value in inputs), **kwargs))
 
 if __name__ == '__main__':
     C = Measure()
@@ -62,10 +421,12 @@ if __name__ == '__main__':
     dB = 10 * np.log10(C)
     pH = -np.log10(C)
     custom = np.exp(C) + 1
-    
+
     print(C(100))
     print(K(100))  # 373.15
     print(F(100))  # 212.0
     print(dB(100))  # 20.0
     print(pH(4.5e-4))  # ~ 3.35
     print(custom(1))  # ~ 3.71828
+
+__all__ = ['Measure', 'Variable', 'Constant', 'Affine', 'Apply']
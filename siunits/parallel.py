@@ -0,0 +1,111 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable
+
+import numpy as np
+from numpy.typing import NDArray
+
+from siunits.types import UnitBase, Quantity
+
+# an array in shared memory, as sent to the workers: the name of the block, its shape and its dtype
+_Block = tuple[str, tuple[int, ...], str]
+
+# blocks a worker has attached to, so each is mapped once per worker rather than once per chunk
+_attached: dict[str, SharedMemory] = {}
+
+def _share(array: NDArray[Any]) -> tuple[SharedMemory, NDArray[Any]]:
+    memory = SharedMemory(create=True, size=max(array.nbytes, 1))
+    try:
+        shared = np.ndarray(array.shape, array.dtype, buffer=memory.buf)
+        shared[...] = array
+    except BaseException:
+        shared = None
+        memory.close()
+        memory.unlink()
+        raise
+    return memory, shared
+
+def _attach(block: _Block) -> NDArray[Any]:
+    name, shape, dtype = block
+    memory = _attached.get(name)
+    if memory is None:
+        # workers share the resource tracker of the parent, which unlinks the block, so attaching here is tracked once
+        memory = _attached[name] = SharedMemory(name=name)
+    return np.ndarray(shape, np.dtype(dtype), buffer=memory.buf)
+
+def _run(fn: Callable, source: _Block, unit: UnitBase, target: _Block, target_unit: UnitBase | None, start: int,
+         stop: int) -> None:
+    chunk = Quantity._wrap(_attach(source)[start:stop], unit)
+    out = _attach(target)[start:stop]
+
+    result = fn(chunk)
+    if target_unit is None:
+        out[...] = result
+    else:
+        result.to(target_unit, out=out)
+
+def _bounds(length: int, chunks: int) -> list[tuple[int, int]]:
+    edges = np.linspace(0, length, min(chunks, length) + 1).astype(int)
+    return [(int(a), int(b)) for a, b in zip(edges[:-1], edges[1:]) if b > a]
+
+def map_chunks(fn: Callable[[Quantity], Quantity | NDArray[Any]], quantity: Quantity, *, workers: int | None = None,
+               chunks: int | None = None, mp_context: BaseContext | None = None) -> Quantity | NDArray[Any]:
+    """Applies `fn` to chunks of `quantity` along its first axis in a pool of processes, and joins the results.
+
+    The values are placed in shared memory once, and each worker calls `fn` on a `Quantity` viewing its chunk
+    without a copy, writing the result into a shared output array. `fn` must be picklable and must map a chunk of
+    `n` rows to `n` rows. The unit and dtype of the result are found once, in this process, by calling `fn` on the
+    first row; every chunk is converted into that unit.
+
+    :param workers: The number of processes, `os.cpu_count()` by default
+    :param chunks: The number of chunks, four per worker by default
+    :param mp_context: The multiprocessing context of the pool
+    """
+
+    if not isinstance(quantity, Quantity) or quantity.ndim == 0:
+        raise TypeError("map_chunks takes a Quantity with at least one dimension")
+    if quantity.dtype.hasobject:
+        raise TypeError("Cannot share a quantity of Python objects")
+
+    workers = workers or os.cpu_count() or 1
+    chunks = chunks or 4 * workers
+
+    sample = fn(quantity[:1])
+    target_unit = sample.unit if isinstance(sample, Quantity) else None
+    sample = np.asarray(sample)
+    if sample.ndim == 0 or len(sample) != 1:
+        raise ValueError("fn must map a chunk of n rows to n rows")
+
+    source_memory, source = _share(quantity.value)
+    memories = [source_memory]
+    target = None
+    try:
+        # created in here, so the source block is released even when this one cannot be
+        target_memory = SharedMemory(create=True, size=max(len(quantity) * sample[0].nbytes, 1))
+        memories.append(target_memory)
+        target = np.ndarray((len(quantity), *sample.shape[1:]), sample.dtype, buffer=target_memory.buf)
+        source_block = (source_memory.name, source.shape, source.dtype.str)
+        target_block = (target_memory.name, target.shape, target.dtype.str)
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as pool:
+            tasks = [
+                pool.submit(_run, fn, source_block, quantity.unit, target_block, target_unit, start, stop)
+                for start, stop in _bounds(len(quantity), chunks)
+            ]
+            for task in tasks:
+                task.result()
+
+        # the blocks are released below, so the result is copied out of them
+        result = target.copy()
+    finally:
+        # views into a block must be gone before it can be closed
+        source = target = None
+        for memory in memories:
+            memory.close()
+            memory.unlink()
+
+    return result if target_unit is None else Quantity._wrap(result, target_unit)
+
+__all__ = ['map_chunks']
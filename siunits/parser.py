@@ -0,0 +1,225 @@
+import re
+from fractions import Fraction
+from typing import Iterable
+
+from siunits.types import UnitBase, ComplexUnit, _one
+from siunits.functions import unit as _registry
+from siunits.utils import LRUCache, CacheInfo
+
+class UnitParseError(ValueError):
+    def __init__(self, expression: str, position: int, message: str = 'Invalid unit expression') -> None:
+        self.expression = expression
+        self.position = position
+        super().__init__(f"{message} at position {position} in '{expression}'")
+
+_SUPERSCRIPTS = {
+    '⁰': '0', '¹': '1', '²': '2', '³': '3', '⁴': '4', '⁵': '5', '⁶': '6', '⁷': '7', '⁸': '8', '⁹': '9',
+    '⁻': '-', '⁺': '+', '⸍': '/'
+}
+
+_TOKEN = re.compile(r"""
+    (?P<space>\s+)
+  | (?P<number>\d+(?:\.\d+)?)
+  | (?P<symbol>(?:°|(?![⁰¹²³⁴⁵⁶⁷⁸⁹])[^\W\d_])+)
+  | (?P<superscript>[⁰¹²³⁴⁵⁶⁷⁸⁹⁻⁺⸍]+)
+  | (?P<power>\*\*|\^)
+  | (?P<multiply>[*·⋅×])
+  | (?P<op>[/()+-])
+""", re.VERBOSE)
+
+def _tokenize(expression: str) -> list[tuple[str, str, int]]:
+    tokens = []
+    position = 0
+    while position < len(expression):
+        match = _TOKEN.match(expression, position)
+        if match is None:
+            raise UnitParseError(expression, position, f"Unexpected character '{expression[position]}'")
+
+        kind = match.lastgroup
+        if kind == 'op':
+            kind = match.group()
+        if kind != 'space':
+            tokens.append((kind, match.group(), position))
+        position = match.end()
+
+    tokens.append(('end', '', len(expression)))
+    return tokens
+
+def _number(text: str) -> int | float:
+    return float(text) if '.' in text else int(text)
+
+class _Parser:
+    """A recursive descent parser over the grammar
+
+        expression := factor (('*' | '·' | '⋅' | '×' | '/')? factor)*
+        factor     := atom (('^' | '**') exponent | superscript)?
+        atom       := symbol | '1' | '(' expression ')'
+        exponent   := sign? (number | '(' sign? number ('/' number)? ')')
+
+    Multiplication and division are left-associative and bind equally, so `J/mol/K` is `J / (mol ⋅ K)`.
+    Juxtaposed factors are multiplied, as in `kg m/s^2`.
+    """
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.tokens = _tokenize(expression)
+        self.index = 0
+
+    def peek(self) -> tuple[str, str, int]:
+        return self.tokens[self.index]
+
+    def take(self, kind: str | None = None) -> tuple[str, str, int]:
+        token = self.tokens[self.index]
+        if kind is not None and token[0] != kind:
+            self.fail(token, f"Expected '{kind}'")
+        self.index += 1
+        return token
+
+    def fail(self, token: tuple[str, str, int], message: str):
+        if token[0] == 'end':
+            message = f"{message}, found end of expression"
+        else:
+            message = f"{message}, found '{token[1]}'"
+        raise UnitParseError(self.expression, token[2], message)
+
+    def parse(self) -> ComplexUnit:
+        if self.peek()[0] == 'end':
+            raise UnitParseError(self.expression, 0, 'Empty unit expression')
+
+        result = self.parse_expression()
+        token = self.peek()
+        if token[0] != 'end':
+            self.fail(token, 'Unexpected token')
+
+        if not isinstance(result, ComplexUnit):
+            result = result**1
+
+        # the depth of a product records how it was built; every spelling of a unit gets the same one
+        depth = max((u.depth for u in result.records), default=0) + 1
+        return ComplexUnit._from_terms(result.terms, result.dimension, result.offset, result.multiplier, depth)
+
+    def parse_expression(self) -> UnitBase:
+        result = self.parse_factor()
+        while True:
+            kind = self.peek()[0]
+            if kind == 'multiply':
+                self.take()
+                result = result * self.parse_factor()
+            elif kind == '/':
+                self.take()
+                result = result / self.parse_factor()
+            elif kind in ('symbol', '(', 'number'):
+                result = result * self.parse_factor()
+            else:
+                return result
+
+    def parse_factor(self) -> UnitBase:
+        result = self.parse_atom()
+        token = self.peek()
+        if token[0] == 'power':
+            self.take()
+            result = result**self.parse_exponent()
+        elif token[0] == 'superscript':
+            self.take()
+            result = result**self.parse_superscript(token)
+        return result
+
+    def parse_atom(self) -> UnitBase:
+        token = self.take()
+        if token[0] == 'symbol':
+            try:
+                return _registry.find(token[1])
+            except KeyError:
+                raise UnitParseError(self.expression, token[2], f"Unknown unit '{token[1]}'") from None
+        elif token[0] == 'number':
+            if _number(token[1]) != 1:
+                raise UnitParseError(self.expression, token[2], 'Numeric factors are not supported')
+            return _one
+        elif token[0] == '(':
+            result = self.parse_expression()
+            self.take(')')
+            return result
+        else:
+            self.fail(token, 'Expected a unit')
+
+    def parse_signed(self) -> int | float:
+        sign = 1
+        if self.peek()[0] in ('-', '+'):
+            sign = -1 if self.take()[0] == '-' else 1
+        return sign * _number(self.take('number')[1])
+
+    def parse_exponent(self) -> int | float | Fraction:
+        if self.peek()[0] in ('-', '+') and self.tokens[self.index + 1][0] == '(':
+            sign = -1 if self.take()[0] == '-' else 1
+        else:
+            sign = 1
+
+        if self.peek()[0] != '(':
+            return sign * self.parse_signed()
+
+        self.take('(')
+        exponent = self.parse_signed()
+        if self.peek()[0] == '/':
+            self.take()
+            denominator = self.take('number')
+            if _number(denominator[1]) == 0:
+                raise UnitParseError(self.expression, denominator[2], 'Zero denominator in exponent')
+            exponent = Fraction(exponent) / Fraction(denominator[1])
+            if exponent.denominator == 1:
+                exponent = exponent.numerator
+        self.take(')')
+        return sign * exponent
+
+    def parse_superscript(self, token: tuple[str, str, int]) -> int | Fraction:
+        text = ''.join(_SUPERSCRIPTS[c] for c in token[1])
+        try:
+            exponent = Fraction(text)
+        except (ValueError, ZeroDivisionError):
+            raise UnitParseError(self.expression, token[2], f"Invalid exponent '{token[1]}'") from None
+        return exponent.numerator if exponent.denominator == 1 else exponent
+
+_parsed: LRUCache[str, ComplexUnit] = LRUCache(maxsize=1024)
+
+def parse(expression: str) -> ComplexUnit:
+    """Builds the unit written in `expression`, such as `kg*m/s^2`, `kN·m` or `μmol/L`.
+
+    Symbols are looked up in the unit registry, and a symbol that is not registered may be an SI prefix followed by
+    one that is. Parsed expressions are cached, so a repeated string is only parsed once.
+
+    Raises:
+        UnitParseError: If the expression is malformed or names an unknown unit.
+    """
+
+    return _parsed.get(expression, lambda: _Parser(expression).parse())
+
+def parse_many(expressions: Iterable[str]) -> list[ComplexUnit]:
+    """Parses every expression, such as the column headers of a table, parsing each distinct string once."""
+
+    seen: dict[str, ComplexUnit] = {}
+    result = []
+    for expression in expressions:
+        if expression not in seen:
+            seen[expression] = parse(expression)
+        result.append(seen[expression])
+
+    return result
+
+def parse_cache_info() -> CacheInfo:
+    """Returns the hit, miss and size statistics of the parsed expression cache."""
+
+    return _parsed.info()
+
+def parse_cache_clear() -> None:
+    """Drops every cached expression and resets the statistics."""
+
+    _parsed.clear()
+
+def set_parse_cache_size(maxsize: int) -> None:
+    """Sets how many parsed expressions are kept, evicting the least recently used ones that no longer fit."""
+
+    _parsed.resize(maxsize)
+
+__all__ = [
+    'UnitParseError', 'parse', 'parse_many',
+    'parse_cache_info', 'parse_cache_clear', 'set_parse_cache_size'
+]
@@ -1,20 +1,18 @@
+import sys
+from typing import Callable
+
 from siunits.types import Unit, FixedUnit
 from siunits.dimension import Dimension
+from siunits.prefixes import prefixed, resolve_prefixed
 
 # kilogram
 kg = Unit('kg', Dimension(mass=1))
-g = FixedUnit('g', kg**1, multiplier=1e-3)
-mg = FixedUnit('mg', kg**1, multiplier=1e-6)
 
 # meter
 m = Unit('m', Dimension(length=1))
-cm = FixedUnit('cm', m**1, multiplier=1e-2)
-mm = FixedUnit('mm', m**1, multiplier=1e-3)
 
 # second
 s = Unit('s', Dimension(time=1))
-minute = FixedUnit('min', s**1, multiplier=60)
-h = FixedUnit('h', s**1, multiplier=3600)
 
 # ampere
 A = Unit('A', Dimension(current=1))
@@ -31,25 +29,69 @@ cd = Unit('cd', Dimension(intensity=1))
 # dimensionless
 one = Unit('1', Dimension())
 
-N = FixedUnit('N', kg * m / s**2)
-Pa = FixedUnit('Pa', N / m**2)
-atm = FixedUnit('atm', Pa**1, multiplier=101325)
-L = FixedUnit('L', cm**3, multiplier=1000)
-J = FixedUnit('J', N * m)
-cal = FixedUnit('cal', J**1, multiplier=4.184)
-angstrom = FixedUnit('Å', m**1, multiplier=1e-10, latex_symbol='\\r{A}')
-
-W = FixedUnit("W", J / s)
-C = FixedUnit("C", A * s)
-V = FixedUnit("V", J / C)
-F = FixedUnit("F", C / V)
-ohm = FixedUnit("Ω", V / A, latex_symbol='\\Omega')
-Wb = FixedUnit("Wb", V * s)
-T = FixedUnit("T", Wb / m**2)
-H = FixedUnit("H", Wb / A)
+# derived units are built the first time they are used, through the module: `u.N` below builds N if it is not yet
+_definitions: dict[str, Callable] = {
+    'g': lambda u: FixedUnit('g', u.kg**1, multiplier=1e-3),
+    'mg': lambda u: prefixed('m', u.g),
+
+    'cm': lambda u: prefixed('c', u.m),
+    'mm': lambda u: prefixed('m', u.m),
+
+    'minute': lambda u: FixedUnit('min', u.s**1, multiplier=60, aliases=('minute',)),
+    'h': lambda u: FixedUnit('h', u.s**1, multiplier=3600),
+    'Hz': lambda u: FixedUnit('Hz', u.s**-1),
+
+    'N': lambda u: FixedUnit('N', u.kg * u.m / u.s**2),
+    'Pa': lambda u: FixedUnit('Pa', u.N / u.m**2),
+    'atm': lambda u: FixedUnit('atm', u.Pa**1, multiplier=101325),
+    'L': lambda u: FixedUnit('L', u.cm**3, multiplier=1000),
+    'J': lambda u: FixedUnit('J', u.N * u.m),
+    'cal': lambda u: FixedUnit('cal', u.J**1, multiplier=4.184),
+    'angstrom': lambda u: FixedUnit('Å', u.m**1, multiplier=1e-10, latex_symbol='\\r{A}', aliases=('angstrom',)),
+
+    'W': lambda u: FixedUnit("W", u.J / u.s),
+    'C': lambda u: FixedUnit("C", u.A * u.s),
+    'V': lambda u: FixedUnit("V", u.J / u.C),
+    'F': lambda u: FixedUnit("F", u.C / u.V),
+    'ohm': lambda u: FixedUnit("Ω", u.V / u.A, latex_symbol='\\Omega', aliases=('ohm',)),
+    'Wb': lambda u: FixedUnit("Wb", u.V * u.s),
+    'T': lambda u: FixedUnit("T", u.Wb / u.m**2),
+    'H': lambda u: FixedUnit("H", u.Wb / u.A),
+
+    # temperatures on an offset scale; differences between them are in Δ°C and Δ°F, see `UnitBase.delta`
+    'degC': lambda u: FixedUnit('°C', u.K**1, offset=273.15, latex_symbol='{}^{\\circ}C', aliases=('degC', 'celsius')),
+    'degF': lambda u: FixedUnit('°F', u.K**1, offset=459.67 * 5 / 9, multiplier=5 / 9, latex_symbol='{}^{\\circ}F',
+                                aliases=('degF', 'fahrenheit')),
+}
+
+# names of the derived units whose symbol is not their name
+_names = {'min': 'minute', 'Å': 'angstrom', 'Ω': 'ohm', '°C': 'degC', '°F': 'degF'}
+
+def __getattr__(name: str):
+    try:
+        definition = _definitions[name]
+    except KeyError:
+        # every other prefixed unit, such as `km`, `ns` or `kPa`, is created on first access
+        unit = resolve_prefixed(name)
+        if unit is None:
+            raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
+
+        return unit
+
+    unit = definition(sys.modules[__name__])
+    globals()[name] = unit
+    return unit
+
+def _load(symbol: str) -> None:
+    # registry lookups go through here, so a derived unit is found by its symbol before it is first used by name
+    name = _names.get(symbol, symbol)
+    if name in _definitions and name not in globals():
+        __getattr__(name)
+
+Unit._loaders.append(_load)
 
 __all__ = [
     'kg', 'm', 's', 'A', 'K', 'mol', 'cd',
-    'cm', 'mm', 'g', 'mg', 'minute', 'h', 'N', 'Pa', 'atm', 'L', 'J', 'cal', 'angstrom',
-    'W', 'C', 'V', 'F', 'ohm', 'Wb', 'T', 'H'
-]
\ No newline at end of file
+    'cm', 'mm', 'g', 'mg', 'minute', 'h', 'Hz', 'N', 'Pa', 'atm', 'L', 'J', 'cal', 'angstrom',
+    'W', 'C', 'V', 'F', 'ohm', 'Wb', 'T', 'H', 'degC', 'degF'
+]
@@ -0,0 +1,83 @@
+from siunits.types import Unit, FixedUnit
+
+# SI prefixes and their powers of ten
+_EXPONENTS: dict[str, int] = {
+    'Q': 30, 'R': 27, 'Y': 24, 'Z': 21, 'E': 18, 'P': 15, 'T': 12, 'G': 9, 'M': 6, 'k': 3, 'h': 2, 'da': 1,
+    'd': -1, 'c': -2, 'm': -3, 'μ': -6, 'n': -9, 'p': -12, 'f': -15, 'a': -18, 'z': -21, 'y': -24, 'r': -27, 'q': -30,
+}
+PREFIXES: dict[str, float] = {prefix: 10.0 ** exponent for prefix, exponent in _EXPONENTS.items()}
+
+# `µ` (micro sign) and `u` are accepted spellings of `μ`
+_ALIASES = {'µ': 'μ', 'u': 'μ'}
+_LONGEST_FIRST = sorted({*PREFIXES, *_ALIASES}, key=len, reverse=True)
+
+# units that never take a prefix: the kilogram already has one, and the rest are not decimal units
+_UNPREFIXABLE = {'kg', '1', 'min', 'h'}
+
+# prefixed units are created the first time they are asked for, and kept here by (prefix, unit ordinal)
+_generated: dict[tuple[str, int], Unit] = {}
+_generated_ids: set[int] = set()
+
+def prefixed(prefix: str, unit: Unit) -> Unit:
+    """Returns `unit` scaled by an SI prefix, creating it the first time it is asked for.
+
+    The gram is defined from the kilogram, so its prefixes are too: `prefixed('k', g)` is `kg` itself, and
+    `prefixed('m', g)` is `kg` with multiplier `1e-6`.
+
+    >>> prefixed('k', N)
+    <FixedUnit[L ⋅ M / T^2] 'kN'>
+    """
+
+    prefix = _ALIASES.get(prefix, prefix)
+    if prefix not in PREFIXES:
+        raise KeyError(f"Unknown SI prefix '{prefix}'")
+    if not prefixable(unit):
+        raise ValueError(f"Unit '{unit.symbol}' cannot take a prefix")
+
+    key = (prefix, unit.ordinal)
+    try:
+        return _generated[key]
+    except KeyError:
+        pass
+
+    if unit.symbol == 'g' and isinstance(unit, FixedUnit):
+        kilogram, = unit.base.records
+        exponent = _EXPONENTS[prefix] - 3
+        result = kilogram if exponent == 0 else FixedUnit(prefix + 'g', kilogram**1, multiplier=10.0 ** exponent)
+    else:
+        result = FixedUnit(prefix + unit.symbol, unit**1, multiplier=PREFIXES[prefix])
+
+    # marked as generated before it is published, so no thread can see it as prefixable
+    _generated_ids.add(id(result))
+    _generated[key] = result
+    return result
+
+def prefixable(unit: Unit) -> bool:
+    """Whether `unit` may take an SI prefix."""
+
+    return unit.symbol not in _UNPREFIXABLE and unit.offset == 0 and id(unit) not in _generated_ids
+
+def split_prefix(symbol: str) -> list[tuple[str, str]]:
+    """The ways `symbol` splits into a known prefix and the rest, longest prefix first."""
+
+    splits = []
+    for prefix in _LONGEST_FIRST:
+        if symbol.startswith(prefix) and len(symbol) > len(prefix):
+            splits.append((prefix, symbol[len(prefix):]))
+
+    return splits
+
+def resolve_prefixed(symbol: str) -> Unit | None:
+    """The prefixed unit written as `symbol`, such as `kPa` or `μs`, or `None` if `symbol` is not one.
+
+    The part after the prefix is looked up by symbol, then by alias, so `kohm` is `kΩ`.
+    """
+
+    for prefix, rest in split_prefix(symbol):
+        for unit in Unit._lookup(rest):
+            if prefixable(unit):
+                return prefixed(prefix, unit)
+
+    return None
+
+__all__ = ['PREFIXES', 'prefixed', 'prefixable', 'split_prefix', 'resolve_prefixed']
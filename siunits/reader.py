@@ -0,0 +1,219 @@
+import csv
+import re
+from os import PathLike
+from typing import Any, IO, Iterable, Iterator, Mapping
+
+import numpy as np
+from attrs import define, field
+
+from siunits.types import UnitBase, Quantity, _one
+from siunits.conversion import ConversionPlan, conversion_plan
+from siunits.parser import parse, UnitParseError
+
+# a number, optionally followed by its unit: `12.5 kPa`, `-3e2m/s`, `nan`
+_CELL = re.compile(r'\s*([-+]?(?:(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?|nan|inf(?:inity)?))\s*(.*?)\s*$',
+                   re.IGNORECASE)
+# a header that carries the unit of its column: `pressure [kPa]`, or `pressure (kPa)` when the parentheses hold a unit
+_HEADER = re.compile(r'\s*(.*?)\s*(?:\[([^\]]*)\]|\(([^)]*)\))\s*$')
+
+Key = str | int
+
+def _unit(unit: 'UnitBase | str') -> UnitBase:
+    return parse(unit) if isinstance(unit, str) else unit
+
+@define(eq=False)
+class _Column:
+    """The state of one column while reading: its unit, resolved once, and the plans for the cells in other units."""
+
+    key: Key
+    index: int
+    unit: UnitBase | None = None
+    target: UnitBase | None = None
+    # the unit text of the cells that need no conversion, and the plans for any other unit text seen in the column
+    text: str | None = None
+    plans: dict[str, ConversionPlan] = field(factory=dict)
+
+    def resolve(self, text: str) -> None:
+        if self.unit is None:
+            self.unit = parse(text) if text else _one
+            self.text = text
+        else:
+            # the unit came from the header or the caller; the cells may still spell it the same way
+            self.text = text if not text or self.plan(text) == ConversionPlan(1, 0) else ''
+
+    def plan(self, text: str) -> ConversionPlan:
+        plan = self.plans.get(text)
+        if plan is None:
+            plan = self.plans[text] = conversion_plan(parse(text) if text else _one, self.unit)
+        return plan
+
+def _open(source: 'str | PathLike | IO[str] | Iterable[str]') -> tuple[Iterable[str], IO[str] | None]:
+    if isinstance(source, str | PathLike):
+        file = open(source, newline='', encoding='utf-8')
+        return file, file
+    return source, None
+
+def read_csv(source: 'str | PathLike | IO[str] | Iterable[str]', *, chunk_size: int = 65536, delimiter: str = ',',
+             header: bool = True, columns: Iterable[Key] | None = None,
+             units: Mapping[Key, 'UnitBase | str'] | None = None,
+             to: Mapping[Key, 'UnitBase | str'] | None = None) -> Iterator[dict[Key, Quantity]]:
+    """Reads delimited text whose cells look like `12.5 kPa`, yielding up to `chunk_size` rows at a time.
+
+    Each chunk is a dict of one `Quantity` array per column, so at most one chunk is held in memory. The unit of a
+    column comes from `units`, else from its header (`pressure [kPa]` or `pressure (kPa)`), else from its first
+    cell, and is parsed once; cells with another unit are converted into it, and cells without one are taken to be
+    in it. Empty cells are read as NaN.
+
+    :param source: A path, an open text file or any iterable of lines
+    :param header: Whether the first line names the columns. Without one, columns are keyed by their position
+    :param columns: The columns to read, by name or position; every column by default
+    :param units: The unit of some columns, by name or position, overriding the header and the cells
+    :param to: Units to convert some columns into as they are read
+    """
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+
+    lines, file = _open(source)
+    try:
+        selected: list[_Column] | None = None
+        chunk: list[list[str]] = []
+        numbers: list[int] = []
+
+        for number, row in enumerate(csv.reader(lines, delimiter=delimiter), start=1):
+            if selected is None:
+                selected = _columns(row, header, columns, units, to)
+                if header:
+                    continue
+
+            if row:
+                chunk.append(row)
+                numbers.append(number)
+            if len(chunk) == chunk_size:
+                yield _chunk(selected, chunk, numbers)
+                chunk, numbers = [], []
+
+        if chunk:
+            yield _chunk(selected, chunk, numbers)
+    finally:
+        if file is not None:
+            file.close()
+
+def read_lines(source: 'str | PathLike | IO[str] | Iterable[str]', *, chunk_size: int = 65536,
+               unit: 'UnitBase | str | None' = None, to: 'UnitBase | str | None' = None) -> Iterator[Quantity]:
+    """Reads one value per line, such as `12.5 kPa`, yielding a `Quantity` array of up to `chunk_size` values.
+
+    The unit is `unit`, or else that of the first line; see `read_csv`.
+    """
+
+    for chunk in read_csv(source, chunk_size=chunk_size, delimiter='\t', header=False, columns=[0],
+                          units=None if unit is None else {0: unit}, to=None if to is None else {0: to}):
+        yield chunk[0]
+
+def _columns(first: list[str], header: bool, columns: Iterable[Key] | None, units: Mapping[Key, Any] | None,
+             to: Mapping[Key, Any] | None) -> list[_Column]:
+    """The columns to read, keyed by name when the first row is a header, otherwise by position."""
+
+    found: dict[Key, _Column] = {}
+    for index, cell in enumerate(first):
+        if not header:
+            found[index] = _Column(index, index)
+            continue
+
+        match = _HEADER.match(cell)
+        if match is None:
+            found[cell.strip()] = _Column(cell.strip(), index)
+            continue
+
+        name, square, round = match.groups()
+        if square is not None:
+            text = square.strip()
+            found[name] = _Column(name, index, parse(text) if text else _one)
+            continue
+
+        # any other parenthetical, such as `temperature (outdoor)`, is part of the name
+        try:
+            unit = parse(round.strip())
+        except UnitParseError:
+            found[cell.strip()] = _Column(cell.strip(), index)
+        else:
+            found[name] = _Column(name, index, unit)
+
+    if columns is None:
+        selected = list(found.values())
+    else:
+        by_index = list(found.values())
+        selected = []
+        for key in columns:
+            if key in found:
+                selected.append(found[key])
+            elif isinstance(key, int) and 0 <= key < len(by_index):
+                column = by_index[key]
+                column.key = key
+                selected.append(column)
+            else:
+                raise KeyError(f"No column '{key}'")
+
+    for column in selected:
+        if units is not None and column.key in units:
+            column.unit = _unit(units[column.key])
+        if to is not None and column.key in to:
+            target = _unit(to[column.key])
+            # converted values are expressed in the bare unit, the same as `Quantity.to`
+            column.target = target if target.multiplier == 1 else (target ** 1)._with_multiplier(1)
+
+    return selected
+
+def _values(column: _Column, cells: list[str], numbers: list[int]) -> np.ndarray:
+    if column.text is not None or column.unit is not None:
+        # cells that are plain numbers, such as those under a header with a unit, are read by numpy in one go
+        try:
+            values = np.array(cells, dtype=float)
+        except ValueError:
+            pass
+        else:
+            if column.text is None:
+                column.resolve('')
+            return values
+
+    values = np.empty(len(cells))
+    for i, cell in enumerate(cells):
+        values[i] = _value(column, cell, numbers[i])
+    return values
+
+def _value(column: _Column, cell: str, line: int) -> float:
+    number, _, text = cell.strip().partition(' ')
+    try:
+        value = float(number)
+    except ValueError:
+        match = _CELL.match(cell)
+        if match is None:
+            if not cell.strip():
+                return np.nan
+            raise ValueError(f"Cannot read '{cell}' in column '{column.key}' on line {line} as a quantity") from None
+
+        number, text = match.groups()
+        value = float(number)
+    else:
+        text = text.strip()
+
+    if column.text is None:
+        column.resolve(text)
+    if not text or text == column.text:
+        return value
+    return column.plan(text)(value)
+
+def _chunk(selected: list[_Column], rows: list[list[str]], numbers: list[int]) -> dict[Key, Quantity]:
+    chunk = {}
+    for column in selected:
+        index = column.index
+        values = _values(column, [row[index] if index < len(row) else '' for row in rows], numbers)
+        unit = column.unit if column.unit is not None else _one
+        if column.target is not None:
+            conversion_plan(unit, column.target)(values, out=values)
+            unit = column.target
+        chunk[column.key] = Quantity._wrap(values, unit)
+
+    return chunk
+
+__all__ = ['read_csv', 'read_lines']
@@ -0,0 +1,101 @@
+import json
+import re
+import struct
+from fractions import Fraction
+from os import PathLike
+from typing import Literal
+
+import numpy as np
+
+from siunits.types import UnitBase, Unit, Quantity
+from siunits.conversion import ConversionPlan, conversion_plan
+from siunits.parser import parse
+
+# the unit rides in a comment after the header dict of the .npy file, which numpy's own reader skips over
+_UNIT = re.compile(r'#\s*siunits:\s*(".*?(?<!\\)")')
+_MAGIC = b'\x93NUMPY'
+_ALIGN = 64
+
+def unit_expression(unit: UnitBase) -> str:
+    """The unit as an expression `parse` reads back: every symbol with its exponent, such as `kg*m*s^-2`."""
+
+    unit = unit ** 1
+    factors = []
+    for ordinal, exponent in unit.terms:
+        symbol = Unit._by_ordinal[ordinal].symbol
+        if exponent == 1:
+            factors.append(symbol)
+        elif isinstance(exponent, Fraction) or isinstance(exponent, float) and not exponent.is_integer():
+            exponent = Fraction(exponent).limit_denominator()
+            factors.append(f'{symbol}^({exponent.numerator}/{exponent.denominator})')
+        else:
+            factors.append(f'{symbol}^{int(exponent)}')
+
+    return '*'.join(factors) or '1'
+
+def _header(array: np.ndarray, expression: str) -> bytes:
+    fields = np.lib.format.header_data_from_array_1_0(array)
+    header = '{' + ''.join(f'{key!r}: {value!r}, ' for key, value in sorted(fields.items())) + '}'
+    header += f'  # siunits: {json.dumps(expression)}'
+
+    # magic, version and the length of the header come first, and the data starts on an aligned offset
+    for version, size in ((1, 2), (2, 4)):
+        padding = -(len(_MAGIC) + 2 + size + len(header) + 1) % _ALIGN
+        length = len(header) + padding + 1
+        if length < 256 ** size:
+            break
+
+    return (_MAGIC + bytes([version, 0]) + struct.pack('<H' if size == 2 else '<I', length)
+            + (header + ' ' * padding + '\n').encode('latin1'))
+
+def save(path: str | PathLike, quantity: Quantity) -> None:
+    """Writes `quantity` to `path` as a `.npy` file whose header also holds the expression of its unit.
+
+    The file is an ordinary `.npy` file that `np.load` reads as a plain array. The values are written from the
+    quantity's own buffer, without a copy unless it is not contiguous.
+    """
+
+    array = quantity.value
+    if array.dtype.hasobject:
+        raise ValueError("Cannot save a quantity of Python objects")
+
+    expression = unit_expression(quantity.unit)
+    if conversion_plan(parse(expression), quantity.unit) != ConversionPlan(1, 0):
+        raise ValueError(f"The unit '{quantity.unit}' does not read back from '{expression}'")
+
+    with open(path, 'wb') as f:
+        f.write(_header(array, expression))
+        if array.flags.c_contiguous:
+            array.tofile(f)
+        elif array.flags.f_contiguous:
+            array.T.tofile(f)
+        else:
+            np.ascontiguousarray(array).tofile(f)
+
+def _read_unit(path: str | PathLike) -> UnitBase:
+    with open(path, 'rb') as f:
+        magic = f.read(len(_MAGIC) + 2)
+        if magic[:len(_MAGIC)] != _MAGIC:
+            raise ValueError(f"'{path}' is not a .npy file")
+
+        major = magic[-2]
+        size = 2 if major == 1 else 4
+        length, = struct.unpack('<H' if size == 2 else '<I', f.read(size))
+        header = f.read(length).decode('utf8' if major >= 3 else 'latin1')
+
+    match = _UNIT.search(header)
+    if match is None:
+        raise ValueError(f"'{path}' has no unit; it was not written by Quantity.save")
+    return parse(json.loads(match.group(1)))
+
+def load(path: str | PathLike, mmap_mode: Literal['r', 'r+', 'c'] | None = 'r') -> Quantity:
+    """Reads a quantity written by `save`.
+
+    With `mmap_mode`, the default, the file is memory-mapped and the quantity is a view over the mapped buffer, so
+    nothing is read into memory until it is used; with `None`, the values are read into memory.
+    """
+
+    unit = _read_unit(path)
+    return Quantity._wrap(np.load(path, mmap_mode=mmap_mode), unit)
+
+__all__ = ['unit_expression', 'save', 'load']
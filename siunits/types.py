@@ -1,19 +1,21 @@
+import importlib
 import re
+import threading
 from abc import abstractmethod
-from copy import deepcopy
-from typing import TypeVar, Any, Self, Literal, TypeAlias, Union, overload
-from functools import total_ordering
+from typing import TypeVar, Any, Callable, Literal, NamedTuple, TypeAlias, Union
 from fractions import Fraction
 from decimal import Decimal
-from copy import deepcopy
+from types import MappingProxyType
+from os import PathLike
+from weakref import WeakValueDictionary
 
 import numpy as np
 from numpy.typing import NDArray
-from plum import dispatch
 
 from siunits.dimension import Dimension, DimensionError, dimensionless
+from siunits.conversion import conversion_plan
 from siunits.utils import (
-    ArithmeticDict, product, pretty, superscript,
+    ArithmeticDict, BinaryDispatch, LRUCache, product, pretty, superscript,
     SMALL_SPACE, MULTIPLY_SIGN, SMALL_SPACE_LATEX, MULTIPLY_SIGN_LATEX
 )
 
@@ -24,27 +26,175 @@ QuantityLike: TypeAlias = Union['Quantity', 'UnitBase']
 
 # %% UnitBase
 
+def _normalize_multiplier(value: Number) -> Number:
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+
+    return value
+
+def _canonical_scale(value: Number) -> Number:
+    # SI scales reached through different paths can differ in the last bits, e.g. 1000 cm^3 and L
+    if isinstance(value, float):
+        return float(f"{value:.12g}")
+
+    return value
+
+# held while a unit is created or registered; lookups of existing units take no lock
+_registry_lock = threading.RLock()
+# held while a ComplexUnit is published
+_intern_lock = threading.Lock()
+
+# results of `UnitBase.to`, by the ids of the two units and the SI cache generation
+_conversions: LRUCache[tuple, tuple] = LRUCache(maxsize=1024)
+
+class _CanonicalForm:
+    """The SI decomposition of a unit: the exponents of its base units, its SI scale and its offset.
+
+    Forms are interned while any unit or cached conversion plan holds one, so equal forms are one object, and compare
+    and hash by identity. Units hold their form strongly and the table holds it weakly, so the form of a scale that is
+    no longer used, such as that of `m + cm`, goes away with its last unit.
+    """
+
+    __slots__ = ('terms', 'scale', 'offset', '__weakref__')
+
+    def __init__(self, terms: tuple, scale: Number, offset: Number):
+        self.terms = terms
+        self.scale = scale
+        self.offset = offset
+
+    def __repr__(self) -> str:
+        return f"<_CanonicalForm {self.terms} scale={self.scale} offset={self.offset}>"
+
+_canonical_forms: 'WeakValueDictionary[tuple, _CanonicalForm]' = WeakValueDictionary()
+
+class SICacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    generation: int
+
+class _SICache:
+    """Bookkeeping of the per-unit SI decomposition cache.
+
+    Every unit memoizes its `si()` and canonical form together with the generation they were computed in. Anything
+    that changes a decomposition (redefining a `FixedUnit`, the only change a unit allows) starts a new generation,
+    which invalidates all memoized decompositions at once.
+
+    The generation only moves under the registry lock, so no invalidation is lost. The hit and miss counters are not
+    synchronized and may undercount under contention.
+    """
+
+    def __init__(self):
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def invalidate(self) -> None:
+        with _registry_lock:
+            self.generation += 1
+
+    def info(self) -> SICacheInfo:
+        return SICacheInfo(self.hits, self.misses, self.generation)
+
+    def clear(self) -> None:
+        self.invalidate()
+        self.hits = 0
+        self.misses = 0
+
+_si_cache = _SICache()
+
+def si_cache_info() -> SICacheInfo:
+    """Returns the hit and miss statistics of the SI decomposition cache."""
+
+    return _si_cache.info()
+
+def si_cache_clear() -> None:
+    """Invalidates every memoized SI decomposition and resets the statistics."""
+
+    _si_cache.clear()
+
 class UnitBase:
+    # numpy defers every binary operator to the unit, so `array * unit` builds a Quantity instead of an object array
+    __array_ufunc__ = None
+
+    # set once a unit is built; from then on it is immutable, so anything derived from it can be memoized and shared
+    _frozen = False
+
     def __init__(self, dimension: Dimension, offset: Number = 0, multiplier: Number = 1, depth: int = 0):
         self.dimension = dimension
         self.offset = offset
         self._multiplier = multiplier
         self.depth = depth
+        self._si_memo = None
+        self._canonical_form = None
+
+    def __setattr__(self, name: str, value) -> None:
+        if self._frozen:
+            raise AttributeError(f"'{self.__class__.__name__}' object is immutable")
+        object.__setattr__(self, name, value)
 
     @property
     def multiplier(self):
         return self._multiplier
 
-    @multiplier.setter
-    def multiplier(self, value: Number):
-        if isinstance(value, float) and value.is_integer():
-            value = int(value)
+    def _memoized_si(self) -> 'UnitBase':
+        memo = self._si_memo
+        if memo is not None and memo[0] == _si_cache.generation:
+            _si_cache.hits += 1
+            return memo[1]
+
+        _si_cache.misses += 1
+        generation = _si_cache.generation
+        ret = self._si()
+        object.__setattr__(self, '_si_memo', (generation, ret))
+        return ret
+
+    def _canonical(self) -> _CanonicalForm | None:
+        """Returns the interned canonical form of the unit, or `None` if its scale is not hashable.
+
+        Two units are equal if and only if their canonical forms are the same object.
+        """
+
+        memo = self._canonical_form
+        if memo is not None and memo[0] == _si_cache.generation:
+            return memo[1]
+
+        generation = _si_cache.generation
+        si = self.si()
+        if isinstance(si, ComplexUnit):
+            terms = si.terms
+        else:
+            terms = ((si.ordinal, 1),)
+
+        key = (terms, _canonical_scale(si.multiplier), self.offset)
+        try:
+            canonical = _canonical_forms.get(key)
+        except TypeError:   # e.g. an array multiplier of a Quantity
+            canonical = None
+        else:
+            if canonical is None:
+                # `WeakValueDictionary.setdefault` is not atomic, and two threads must not both publish a form
+                with _intern_lock:
+                    canonical = _canonical_forms.setdefault(key, _CanonicalForm(*key))
 
-        self._multiplier = value
+        object.__setattr__(self, '_canonical_form', (generation, canonical))
+        return canonical
 
     def __eq__(self, other):
         return _eq(self, other)
 
+    def __hash__(self) -> int:
+        # equal units share one canonical form, so `N`, `N**1` and `kg*m/s**2` hash alike
+        canonical = self._canonical()
+        if canonical is None:
+            raise TypeError(f"unhashable {self.__class__.__name__}: {self.multiplier!r}")
+
+        if self.multiplier == 0:    # todo: offset, 0K, 0C의 경우처럼 0이여도 다른 경우가 있을 수 있음
+            return hash(0)
+        elif self.dimension == dimensionless:
+            # a dimensionless unit equals its scale as a number
+            return hash(canonical.scale)
+        return hash(canonical)
+
     def __add__(self, other: 'UnitBase | Quantity'):
         return _add(self, other)
 
@@ -99,9 +249,12 @@ class UnitBase:
     def __contains__(self, unit: 'UnitBase') -> bool:
         pass
 
-    @abstractmethod
+    # units are immutable values, so copies share the original
+    def __copy__(self):
+        return self
+
     def __deepcopy__(self, memo=None):
-        pass
+        return self
 
     @abstractmethod
     def __format__(self, format_spec: str) -> str:
@@ -119,20 +272,46 @@ class UnitBase:
     def si(self):
         pass
 
-    # test: 테스트 필요
+    @property
+    def delta(self) -> 'UnitBase':
+        """The unit of a difference between two values in this unit: the same scale, without the offset.
+
+        Units without an offset are their own delta; the delta of `°C` is `Δ°C`, which equals `K`.
+        """
+
+        if self.offset == 0:
+            return self
+
+        return self._delta()
+
+    @abstractmethod
+    def _delta(self) -> 'UnitBase':
+        pass
+
     def to(self, other: 'UnitBase') -> 'UnitBase':
+        # the entry holds both units, so neither id can be reused while it is cached
+        key = (id(self), id(other), _si_cache.generation)
+        return _conversions.get(key, lambda: (self, other, self._to(other)))[2]
+
+    def _to(self, other: 'UnitBase') -> 'UnitBase':
         if self.dimension != other.dimension:
             raise DimensionError(self.dimension, other.dimension, "Cannot convert units with different dimensions")
 
-        ret = deepcopy(other**1)
-        ret.multiplier = self.si().multiplier / other.si().multiplier
-        return ret
+        return (other**1)._with_multiplier(conversion_plan(self, other).scale)
 
 U = TypeVar('U', bound=UnitBase)
 
 # %% Unit
 class Unit(UnitBase):
     _instances: dict[tuple, 'Unit'] = {}
+    # every unit ever created, indexed by its ordinal; ComplexUnit refers to units by ordinal
+    _by_ordinal: list['Unit'] = []
+    # units by symbol and by alias, in order of creation
+    # the indexes are read without a lock: writers replace a tuple instead of appending to a list, under `_registry_lock`
+    _by_symbol: dict[str, tuple['Unit', ...]] = {}
+    _by_alias: dict[str, tuple['Unit', ...]] = {}
+    # called with a symbol before it is looked up, so units that are built on demand exist by then
+    _loaders: list[Callable[[str], None]] = []
 
     def __new__(cls, symbol: str, dimension: Dimension, offset: Number = 0, multiplier: Number = 1, *args,
                 **kwargs):
@@ -141,28 +320,83 @@ class Unit(UnitBase):
         # if len(cls._instances) > 7:
         #     raise ValueError("SI units should be defined only once")
 
-        if key not in cls._instances:
-            cls._instances[key] = super().__new__(cls)
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls._intern(key, symbol, dimension, offset, multiplier, *args, **kwargs)
+        return instance
 
-        return cls._instances[key]
+    @classmethod
+    def _intern(cls, key: tuple, symbol: str, *args, **kwargs) -> 'Unit':
+        """Creates the unit for `key` under the registry lock, unless another thread just did.
 
-    def __init__(self, symbol: str, dimension: Dimension, offset: Number = 0, multiplier: Number = 1, *, latex_symbol: str | None = None):
-        super().__init__(dimension, offset, multiplier)
-        self.symbol = symbol
-        self.latex_symbol = symbol if latex_symbol is None else latex_symbol
+        The unit is initialized before it is published in `_instances` and the symbol index, so lookups, which take
+        no lock, never see a unit that is only partly built.
+        """
 
-    def __hash__(self) -> int:  # type: ignore
-        if self.multiplier == 0:    # todo: offset, 0K, 0C의 경우처럼 0이여도 다른 경우가 있을 수 있음
-            return hash(0)
-        elif self.dimension == dimensionless:
-            return hash(self.multiplier)
-        else:
-            return hash((self.symbol, self.dimension, self.offset, self.multiplier))
+        with _registry_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = object.__new__(cls)
+                instance.ordinal = len(Unit._by_ordinal)
+                Unit._by_ordinal.append(instance)
+                instance.__init__(symbol, *args, **kwargs)
+                object.__setattr__(instance, '_frozen', True)
 
-    def __deepcopy__(self, memo=None):
-        if memo is None:
-            memo = {}
-        return Unit(self.symbol, self.dimension, self.offset, self.multiplier, latex_symbol=self.latex_symbol)
+                Unit._by_symbol[symbol] = (*Unit._by_symbol.get(symbol, ()), instance)
+                cls._instances[key] = instance
+
+            return instance
+
+    def __init__(self, symbol: str, dimension: Dimension, offset: Number = 0, multiplier: Number = 1, *,
+                 latex_symbol: str | None = None, aliases: tuple[str, ...] = ()):
+        # `Unit(...)` with the arguments of an existing unit returns it, and may only give it more aliases
+        if not self._frozen:
+            super().__init__(dimension, offset, multiplier)
+            self.symbol = symbol
+            self.latex_symbol = symbol if latex_symbol is None else latex_symbol
+
+        for alias in aliases:
+            self._add_alias(alias)
+
+    def _add_alias(self, alias: str) -> None:
+        with _registry_lock:
+            units = Unit._by_alias.get(alias, ())
+            if not any(unit is self for unit in units):
+                Unit._by_alias[alias] = (*units, self)
+
+    def _bare(self) -> 'Unit':
+        # the unit without its multiplier, which a ComplexUnit folds into its own
+        if self.multiplier == 1:
+            return self
+        return Unit(self.symbol, self.dimension, self.offset, latex_symbol=self.latex_symbol)
+
+    @staticmethod
+    def _lookup(symbol: str) -> list['Unit']:
+        """Units whose symbol or alias is `symbol`, in order of creation; symbols come before aliases."""
+
+        for loader in Unit._loaders:
+            loader(symbol)
+
+        found = [*Unit._by_symbol.get(symbol, ())]
+        aliased = Unit._by_alias.get(symbol)
+
+        if aliased:
+            found += [u for u in aliased if not any(u is f for f in found)]
+
+        return found
+
+    def _definition(self) -> tuple:
+        return self.dimension, self.offset, self.multiplier
+
+    def __reduce__(self):
+        # by symbol, so an unpickled unit is the one already interned here; only a unit that another process may
+        # not know by its symbol carries its definition
+        if _portable(self):
+            return _unpickle_unit, (self.symbol,)
+        return _unpickle_unit, (self.symbol, self._definition(), self.__class__, self.latex_symbol)
+
+    def _delta(self) -> 'Unit':
+        return Unit('Δ' + self.symbol, self.dimension, 0, self.multiplier, latex_symbol='\\Delta ' + self.latex_symbol)
 
     def __lt__(self, other) -> bool:
         if not isinstance(other, Unit):
@@ -210,32 +444,126 @@ class Unit(UnitBase):
 
 # %% ComplexUnit
 class ComplexUnit(UnitBase):
-    def __init__(self, records: ArithmeticDict[Unit], offset: Number = 0, multiplier: Number = 1):
+    # ComplexUnits are immutable and hash-consed: constructing an equal one returns the existing instance.
+    _instances: 'WeakValueDictionary[tuple, ComplexUnit]' = WeakValueDictionary()
+
+    def __new__(cls, records: ArithmeticDict[Unit] | dict[Unit, Number], offset: Number = 0, multiplier: Number = 1,
+                depth: int | None = None):
         """
         :param records: A dictionary of units and their exponents
+        :param depth: The depth of the unit, defaults to one more than the deepest unit in records
         """
 
         # set properties
         dimension = sum((unit.dimension * exponent for unit, exponent in records.items()), start=Dimension())
         offset = offset  # TODO: offset 자동 계산
         multiplier = multiplier * product((unit.multiplier ** exponent for unit, exponent in records.items()))
-        depth = max((unit.depth for unit in records.keys()), default=0) + 1
-
-        # call super constructor
-        super().__init__(dimension, offset, multiplier, depth)
+        if depth is None:
+            depth = max((unit.depth for unit in records.keys()), default=0) + 1
 
-        # set records
-        _records: dict[Unit, Number] = {}
+        # set terms
+        terms = []
         for unit, exponent in records.items():
             if exponent != 0:
-                _records[unit] = exponent
-                unit.multiplier = 1
+                # the multiplier of the unit is already in `multiplier`; the shared unit itself is left as it is
+                terms.append((unit._bare().ordinal, exponent))
+        terms.sort()
+
+        return cls._from_terms(tuple(terms), dimension, offset, multiplier, depth)
+
+    @classmethod
+    def _from_terms(cls, terms: tuple[tuple[int, Number], ...], dimension: Dimension, offset: Number,
+                    multiplier: Number, depth: int) -> 'ComplexUnit':
+        """Returns the interned unit for `terms`, a tuple of `(unit ordinal, exponent)` pairs sorted by ordinal.
+
+        The units in `terms` must have a multiplier of 1; it is not folded in again.
+        """
+
+        multiplier = _normalize_multiplier(multiplier)
+
+        # intern
+        key = (terms, offset, multiplier, depth)
+        try:
+            instance = cls._instances.get(key)
+        except TypeError:   # e.g. an array multiplier of a Quantity, which is never interned
+            key = None
+            instance = None
+
+        if instance is not None:
+            return instance
+
+        instance = super().__new__(cls)
+        instance.__dict__.update(
+            dimension=dimension, offset=offset, _multiplier=multiplier, depth=depth, terms=terms,
+            _records=None, _si_memo=None, _canonical_form=None, _formatted=None
+        )
+
+        if key is not None:
+            # `WeakValueDictionary.setdefault` is not atomic, and two threads must not both publish a unit
+            with _intern_lock:
+                instance = cls._instances.setdefault(key, instance)
+
+        return instance
+
+    def __init__(self, *args, **kwargs):
+        # everything is set up in `__new__`, so that interned instances are never re-initialized
+        pass
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"'{self.__class__.__name__}' object is immutable")
+
+    @property
+    def multiplier(self):
+        return self._multiplier
+
+    @property
+    def records(self) -> MappingProxyType:
+        """The units and their exponents, in display order."""
+
+        if self._records is None:
+            by_ordinal = Unit._by_ordinal
+            records = {by_ordinal[ordinal]: exponent for ordinal, exponent in self.terms}
+            object.__setattr__(self, '_records', MappingProxyType(dict(sorted(records.items()))))
+
+        return self._records
+
+    def _with_multiplier(self, multiplier: Number) -> 'ComplexUnit':
+        if multiplier is self._multiplier:
+            return self
+
+        return ComplexUnit._from_terms(self.terms, self.dimension, self.offset, multiplier, self.depth)
+
+    def _delta(self) -> 'ComplexUnit':
+        if len(self.terms) == 1 and self.terms[0][1] == 1:
+            # the first power of an offset unit, such as a quantity in °C: its delta is Δ°C
+            delta = Unit._by_ordinal[self.terms[0][0]].delta ** 1
+            return delta._with_multiplier(delta.multiplier * self.multiplier)
+
+        return ComplexUnit._from_terms(self.terms, self.dimension, 0, self.multiplier, self.depth)
+
+    def __reduce__(self):
+        # as an expression such as `kg*m*s^-2`, unless one of the units in it needs its definition
+        if all(_portable(unit) for unit in self.records):
+            from siunits.storage import unit_expression
+            return _unpickle_complex_unit, (unit_expression(self), self.offset, self.multiplier, self.depth)
+        return ComplexUnit, (dict(self.records), self.offset, self.multiplier, self.depth)
 
-        # optimize records
-        self.records: ArithmeticDict[Unit] = ArithmeticDict[Unit](_records)
+    def _memoized_format(self, key: str | None, build: Callable[[], str]) -> str:
+        # the unit never changes, so each spelling of it is built once
+        formatted = self._formatted
+        if formatted is None:
+            formatted = {}
+            object.__setattr__(self, '_formatted', formatted)
+
+        text = formatted.get(key)
+        if text is None:
+            text = formatted[key] = build()
+        return text
 
-    # test: 테스트 필요
     def __format__(self, format_spec: str) -> str:
+        return self._memoized_format(format_spec, lambda: self._format(format_spec))
+
+    def _format(self, format_spec: str) -> str:
         precision: int | None = None
 
         if format_spec != "":
@@ -278,6 +606,9 @@ class ComplexUnit(UnitBase):
         return formula
 
     def _repr_latex_(self) -> str:
+        return self._memoized_format(None, self._latex)
+
+    def _latex(self) -> str:
         front = []
         back = []
         multiplier_string = pretty(self.multiplier, LaTeX=True)
@@ -320,11 +651,6 @@ class ComplexUnit(UnitBase):
     def __contains__(self, unit: UnitBase) -> bool:
         return unit in self.records
 
-    def __deepcopy__(self, memo=None):
-        if memo is None:
-            memo = {}
-        return ComplexUnit(deepcopy(self.records, memo), self.offset, self.multiplier)
-
     def expand(self):
         """
         records: {(depth 4): 2, (depth 2): 1, (depth 2): 2, (depth 3): 1}
@@ -335,34 +661,37 @@ class ComplexUnit(UnitBase):
         function 'expand' is flatten the records by merging the same depth records
         """
 
-        expanded = deepcopy(self.records)
-        keys_sorted_by_depth = sorted(self.records.keys(), key=lambda x: x.depth, reverse=True)
+        records = self.records
 
-        if len(keys_sorted_by_depth) > 0:
-            most_key, most_value = keys_sorted_by_depth[0], self.records[keys_sorted_by_depth[0]]
+        if len(records) > 0:
+            # the first of the deepest units, in display order
+            most_key = max(records, key=lambda x: x.depth)
+            most_value = records[most_key]
 
             if most_key.depth != 0:
                 most_key_expanded = most_key.expand()
 
+                expanded = dict(records)
+                del expanded[most_key]
                 if isinstance(most_key_expanded, ComplexUnit):
                     for key, value in most_key_expanded.records.items():
-                        expanded[key] += value * most_value
+                        expanded[key] = expanded.get(key, 0) + value * most_value
                 else:
-                    expanded[most_key_expanded] += most_value
-
-                del expanded[most_key]
+                    expanded[most_key_expanded] = expanded.get(most_key_expanded, 0) + most_value
 
                 return ComplexUnit(expanded, self.offset, self.multiplier * most_key_expanded.multiplier ** most_value)
 
-        return ComplexUnit(expanded, self.offset, self.multiplier)
+        return ComplexUnit(records, self.offset, self.multiplier)
+
+    def si(self):
+        return self._memoized_si()
 
-    def si(self):        
+    def _si(self):
         _dict = ComplexUnit(ArithmeticDict())
         for unit, exponent in self.records.items():
             _dict *= unit.si() ** exponent
         
-        _dict.multiplier *= self.multiplier
-        return _dict
+        return _dict._with_multiplier(_dict.multiplier * self.multiplier)
 
 # %% FixedUnit
 class FixedUnit(Unit):
@@ -370,34 +699,83 @@ class FixedUnit(Unit):
                 **kwargs):
         key = (cls, symbol, base.dimension, base.offset, base.multiplier)
 
-        if key not in cls._instances:
-            cls._instances[key] = super(Unit, cls).__new__(cls)
-
-        return cls._instances[key]
-
-    def __init__(self, symbol: str, base: ComplexUnit, offset: Number = 0, multiplier: Number = 1, *, latex_symbol: str | None = None):
-        super().__init__(symbol, base.dimension, offset, 1, latex_symbol=latex_symbol)
-
-        base.multiplier *= multiplier   # FixedUnit의 multiplier는 항상 1, base의 multiplier에만 곱해준다.
-        self.base = base
-        self.depth = base.depth + 1
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls._intern(key, symbol, base, offset, multiplier, *args, **kwargs)
+        return instance
+
+    def __init__(self, symbol: str, base: ComplexUnit, offset: Number = 0, multiplier: Number = 1, *,
+                 latex_symbol: str | None = None, aliases: tuple[str, ...] = ()):
+        base = base._with_multiplier(base.multiplier * multiplier)    # FixedUnit의 multiplier는 항상 1, base의 multiplier에만 곱해준다.
+
+        if not self._frozen:
+            super().__init__(symbol, base.dimension, offset, 1, latex_symbol=latex_symbol)
+            self.base = base
+            self.depth = base.depth + 1
+        elif base is not self.base or offset != self.offset or latex_symbol not in (None, self.latex_symbol):
+            self._redefine(base, offset, self.latex_symbol if latex_symbol is None else latex_symbol)
+
+        # aliases are published last, once the unit is complete
+        for alias in aliases:
+            self._add_alias(alias)
+
+    def _redefine(self, base: ComplexUnit, offset: Number, latex_symbol: str) -> None:
+        # the one change a unit allows: its symbol is defined again, with a new base of the same dimension, offset or
+        # LaTeX symbol
+        with _registry_lock:
+            object.__setattr__(self, 'base', base)
+            object.__setattr__(self, 'depth', base.depth + 1)
+            object.__setattr__(self, 'offset', offset)
+            object.__setattr__(self, 'latex_symbol', latex_symbol)
+
+            # every decomposition and conversion through it is stale
+            _si_cache.invalidate()
 
     def __contains__(self, unit: UnitBase) -> bool:
         return unit in self.base
 
-    def __deepcopy__(self, memo=None):
-        if memo is None:
-            memo = {}
-        return FixedUnit(self.symbol, deepcopy(self.base, memo), self.offset, self.multiplier, latex_symbol=self.latex_symbol)
+    def _definition(self) -> tuple:
+        return self.base, self.offset
+
+    def _delta(self) -> 'FixedUnit':
+        return FixedUnit('Δ' + self.symbol, self.base, latex_symbol='\\Delta ' + self.latex_symbol)
 
     def expand(self):
-        ret = self.base
-        ret.multiplier *= self.multiplier
-        return ret
+        return self.base._with_multiplier(self.base.multiplier * self.multiplier)
 
     def si(self):
+        return self._memoized_si()
+
+    def _si(self):
         return self.base.si()
 
+def _portable(unit: Unit) -> bool:
+    # predefined units, and prefixes on them, are found by their symbol in any process
+    predefined = importlib.import_module('siunits.predefined')
+    prefixes = importlib.import_module('siunits.prefixes')
+
+    if id(unit) in prefixes._generated_ids:
+        return any(generated is unit and _portable(Unit._by_ordinal[ordinal])
+                   for (_, ordinal), generated in list(prefixes._generated.items()))
+
+    name = predefined._names.get(unit.symbol, unit.symbol)
+    return name in predefined.__all__ and getattr(predefined, name) is unit
+
+def _unpickle_unit(symbol: str, definition: tuple | None = None, cls: type[Unit] = Unit,
+                   latex_symbol: str | None = None) -> Unit:
+    if definition is None:
+        return importlib.import_module('siunits.functions').unit.find(symbol)
+
+    for unit in Unit._lookup(symbol):
+        if type(unit) is cls and unit.symbol == symbol and unit._definition() == definition:
+            return unit
+
+    return cls(symbol, *definition, latex_symbol=latex_symbol)
+
+def _unpickle_complex_unit(expression: str, offset, multiplier, depth: int) -> ComplexUnit:
+    parsed = importlib.import_module('siunits.parser').parse(expression)
+    return ComplexUnit._from_terms(parsed.terms, parsed.dimension, offset, multiplier, depth)
+
 # %% Quantity
 
 # @total_ordering
@@ -520,17 +898,208 @@ class FixedUnit(Unit):
 #         _cp = self.to_complex_unit().to(other.to_complex_unit() if isinstance(other, Quantity) else other)
 #         return Quantity(1, _cp)
 
-@total_ordering
+# %% numpy interop
+
+# ufuncs whose operands must share a dimension; the result is in the unit of the first operand
+_SAME_UNIT = {
+    np.add, np.subtract, np.maximum, np.minimum, np.fmax, np.fmin, np.hypot, np.remainder, np.fmod, np.nextafter
+}
+# ufuncs whose operands must share a dimension, and whose result is a plain array
+_SAME_UNIT_PLAIN = {
+    np.equal, np.not_equal, np.less, np.less_equal, np.greater, np.greater_equal, np.arctan2
+}
+# unary ufuncs that keep the unit of their operand
+_KEEP_UNIT = {
+    np.negative, np.positive, np.absolute, np.fabs, np.rint, np.floor, np.ceil, np.trunc, np.conjugate
+}
+# unary ufuncs that accept any unit, and return a plain array
+_ANY_UNIT_PLAIN = {
+    np.isnan, np.isinf, np.isfinite, np.signbit, np.sign
+}
+# ufuncs that only make sense on pure numbers
+_DIMENSIONLESS = {
+    np.exp, np.exp2, np.expm1, np.log, np.log2, np.log10, np.log1p, np.sin, np.cos, np.tan, np.arcsin, np.arccos,
+    np.arctan, np.sinh, np.cosh, np.tanh, np.arcsinh, np.arccosh, np.arctanh, np.deg2rad, np.rad2deg
+}
+# unary ufuncs that raise the unit to a fixed power
+_POWER = {
+    np.sqrt: 0.5, np.square: 2, np.cbrt: Fraction(1, 3), np.reciprocal: -1
+}
+# reductions that keep the unit of their operand
+_REDUCE_KEEP_UNIT = {
+    np.add, np.maximum, np.minimum, np.fmax, np.fmin
+}
+
+# ufuncs that scale the unit of their operands
+_SCALING = {np.multiply, np.matmul, np.divide, np.floor_divide}
+# ufuncs that are not defined for absolute values in an offset unit, even with a bare number: `2 * 20 °C` is not 40 °C
+_NOT_ABSOLUTE = {*_SCALING, *_POWER, np.power, np.negative, np.absolute, np.fabs}
+
+# numpy functions whose own implementation is right for quantities: they only move elements around, reduce through
+# the ufuncs above, or return no values in the unit (shapes, indices, flags); any other function is refused
+_ARRAY_FUNCTIONS = {
+    np.reshape, np.ravel, np.transpose, np.swapaxes, np.moveaxis, np.squeeze, np.expand_dims, np.atleast_1d,
+    np.atleast_2d, np.atleast_3d, np.broadcast_to, np.broadcast_arrays, np.flip, np.fliplr, np.flipud, np.roll,
+    np.rot90, np.take, np.take_along_axis, np.repeat, np.tile, np.copy, np.sort, np.partition, np.diagonal, np.split,
+    np.array_split, np.unique, np.append, np.empty_like, np.zeros_like,
+    np.sum, np.cumsum, np.prod, np.max, np.min, np.amax, np.amin, np.ptp, np.median, np.diff, np.round, np.around,
+    np.shape, np.ndim, np.size, np.shares_memory, np.may_share_memory, np.result_type, np.argmax, np.argmin,
+    np.argsort, np.argpartition, np.nonzero, np.flatnonzero, np.argwhere, np.count_nonzero
+}
+
+_one = ComplexUnit(ArithmeticDict())
+
+class OffsetUnitError(ValueError):
+    """Raised for arithmetic that has no meaning on absolute values in an offset unit, such as `20 °C + 30 °C`."""
+
+def _absolute(unit: UnitBase | None) -> bool:
+    return unit is not None and unit.offset != 0
+
+def _offset_sum(ufunc: np.ufunc, values: list, units: list) -> tuple[list, UnitBase]:
+    """`np.add` and `np.subtract` with an absolute value in an offset unit among the operands.
+
+    An absolute value plus or minus a difference is absolute, and the difference of two absolute values is a
+    difference in the delta unit of the first. Differences only scale, so they are converted without the offset.
+    """
+
+    a, b = units
+    if ufunc is np.add:
+        if _absolute(a) and _absolute(b):
+            raise OffsetUnitError(f"Cannot add two absolute values in '{a}' and '{b}'; add a difference instead")
+
+        target = a if _absolute(a) else b
+        return [v if u is target else _convert(v, u, target.delta) for v, u in zip(values, units)], target
+    elif _absolute(a) and _absolute(b):
+        return [values[0], _convert(values[1], b, a)], a.delta
+    elif _absolute(a):
+        return [values[0], _convert(values[1], b, a.delta)], a
+    else:
+        raise OffsetUnitError(f"Cannot subtract an absolute value in '{b}' from a difference")
+
+def _convert(value, unit: UnitBase | None, target: UnitBase):
+    """Expresses the raw `value` in `unit` in `target`. A bare number (`unit` is None) counts as dimensionless."""
+
+    if value is None:
+        return value
+    elif unit is None:
+        if target.dimension != dimensionless:
+            if np.ndim(value) == 0 and value == 0:    # zero is zero in every unit
+                return value
+            raise DimensionError(dimensionless, target.dimension, "Cannot mix quantities with bare numbers")
+        unit = _one
+
+    if unit is target:
+        return value
+
+    if unit.dimension != target.dimension:
+        raise DimensionError(unit.dimension, target.dimension, "Operands have different dimensions")
+
+    plan = conversion_plan(unit, target)
+    if plan.scale == 1 and plan.offset == 0:
+        return value
+    return plan(value)
+
+def _ufunc_unit(ufunc: np.ufunc, values: list, units: list) -> tuple[list, UnitBase | None]:
+    """Returns the converted raw operands of `ufunc` and the unit of its result, or `None` for a plain result."""
+
+    if any(_absolute(u) for u in units):
+        if ufunc is np.add or ufunc is np.subtract:
+            return _offset_sum(ufunc, values, units)
+
+        if ufunc in _NOT_ABSOLUTE:
+            raise OffsetUnitError(f"'{ufunc.__name__}' is not defined for absolute values in an offset unit; "
+                                  "convert to an absolute scale such as K, or use the delta unit")
+
+    if ufunc in _SAME_UNIT or ufunc in _SAME_UNIT_PLAIN:
+        target = next(u for u in units if u is not None)
+        values = [_convert(v, u, target) for v, u in zip(values, units)]
+        return values, (None if ufunc in _SAME_UNIT_PLAIN else target)
+    elif ufunc in _KEEP_UNIT:
+        return values, units[0]
+    elif ufunc in _ANY_UNIT_PLAIN:
+        return values, None
+    elif ufunc in _DIMENSIONLESS:
+        return [_convert(v, u, _one) for v, u in zip(values, units)], None
+    elif ufunc in _POWER:
+        return values, units[0] ** _POWER[ufunc]
+    elif ufunc is np.multiply or ufunc is np.matmul:
+        a, b = units
+        return values, (a if b is None else b if a is None else a * b)
+    elif ufunc is np.divide or ufunc is np.floor_divide:
+        a, b = units
+        return values, (a if b is None else b ** -1 if a is None else a / b)
+    elif ufunc is np.power:
+        base, exponent = values
+        exponent = _convert(exponent, units[1], _one)
+        if units[0] is None:
+            return [base, exponent], None
+
+        if np.ndim(exponent) != 0:
+            raise TypeError("Quantities can only be raised to a scalar power")
+        if isinstance(exponent, np.generic | np.ndarray):
+            exponent = exponent.item()
+        return [base, exponent], units[0] ** exponent
+    else:
+        raise TypeError(f"'{ufunc.__name__}' is not supported for quantities")
+
+def _reduce_unit(ufunc: np.ufunc, method: str, array, unit: UnitBase, kwargs: dict) -> UnitBase:
+    """Returns the unit of the result of `ufunc.reduce`, `accumulate` or `reduceat` over `array` in `unit`."""
+
+    if ufunc is np.add and _absolute(unit):
+        # the same rule as `20 °C + 30 °C`; an average is defined, and `np.mean` does not sum in the offset unit
+        raise OffsetUnitError(f"Cannot sum absolute values in '{unit}'; take their mean, or sum differences in "
+                              f"'{unit.delta}'")
+    elif ufunc in _REDUCE_KEEP_UNIT:
+        return unit
+    elif ufunc is not np.multiply:
+        raise TypeError(f"'{ufunc.__name__}.{method}' is not supported for quantities")
+    elif unit == _one:
+        return unit
+    elif method != 'reduce':
+        raise TypeError(f"'multiply.{method}' of a quantity in '{unit}' has a different unit for every element")
+
+    where = kwargs.get('where', True)
+    if where is not True and not np.all(where):
+        raise TypeError("'multiply.reduce' with 'where' has a different unit for every element")
+
+    # the product of n values in a unit is in that unit to the n
+    axis = kwargs.get('axis', 0)
+    shape = np.shape(array)
+    if axis is None:
+        n = int(np.prod(shape, dtype=int))
+    else:
+        n = int(np.prod([shape[a] for a in (axis if isinstance(axis, tuple) else (axis,))], dtype=int))
+    return unit ** n
+
+_HANDLED_FUNCTIONS: dict[Any, Any] = {}
+
+def _implements(np_function):
+    """Registers an implementation of a numpy function for `Quantity`, as described in NEP 18."""
+
+    def decorator(func):
+        _HANDLED_FUNCTIONS[np_function] = func
+        return func
+
+    return decorator
+
 class Quantity(np.ndarray):
     # create instance
-    def __new__(cls: type['Quantity'], value: ArrayLike | Number, unit: UnitBase) -> 'Quantity':
-        _multiplier = unit.multiplier
-        unit.multiplier = 1
+    def __new__(cls: type['Quantity'], value: ArrayLike | Number, unit: UnitBase, *, copy: bool = True) -> 'Quantity':
+        # without a copy, an array in a unit without a multiplier is viewed as it is, e.g. a memory-mapped one
+        return cls._wrap(np.array(value) if copy else np.asarray(value), unit)
 
-        obj = (np.asarray(value) * _multiplier).view(cls)
-        obj._unit = unit
+    @classmethod
+    def _wrap(cls, value: NDArray[Any], unit: UnitBase) -> 'Quantity':
+        """Views `value` as a quantity in `unit` without copying, unless the multiplier of `unit` has to be folded in."""
+
+        if unit.multiplier != 1:
+            value = value * unit.multiplier
+            unit = (unit ** 1)._with_multiplier(1)
 
+        obj = np.asarray(value).view(cls)
+        obj._unit = unit
         return obj
+
     def __array_finalize__(self, obj: NDArray[Any] | None) -> None:
         if obj is None:
             return
@@ -539,6 +1108,54 @@ class Quantity(np.ndarray):
         if _unit is not None:
             self._unit = _unit
 
+    def __array_ufunc__(self, ufunc: np.ufunc, method: str, *inputs, out=None, **kwargs):
+        values = [x.view(np.ndarray) if isinstance(x, Quantity) else x for x in inputs]
+        units = [x.unit if isinstance(x, Quantity) else None for x in inputs]
+
+        if method in ('__call__', 'outer') and ufunc.nout == 1:
+            values, unit = _ufunc_unit(ufunc, values, units)
+        elif method in ('reduce', 'accumulate', 'reduceat'):
+            unit = _reduce_unit(ufunc, method, values[0], units[0], kwargs)
+        else:
+            return NotImplemented
+
+        if out is not None:
+            kwargs['out'] = tuple(o.view(np.ndarray) if isinstance(o, Quantity) else o for o in out)
+
+        result = getattr(ufunc, method)(*values, **kwargs)
+
+        if unit is None:
+            return result
+        elif out is not None and isinstance(out[0], Quantity):
+            if unit.multiplier != 1:
+                result *= unit.multiplier
+                unit = (unit ** 1)._with_multiplier(1)
+            out[0]._unit = unit
+            return out[0]
+        else:
+            return Quantity._wrap(result, unit)
+
+    def __array_function__(self, func, types, args, kwargs):
+        handler = _HANDLED_FUNCTIONS.get(func)
+        if handler is None:
+            if func not in _ARRAY_FUNCTIONS:
+                # numpy's own implementation would keep the unit of the input, which is wrong for most functions
+                raise TypeError(f"'{func.__name__}' is not supported for quantities")
+            return super().__array_function__(func, types, args, kwargs)
+        if not all(issubclass(t, np.ndarray) for t in types):
+            return NotImplemented
+
+        return handler(*args, **kwargs)
+
+    def __getitem__(self, key) -> 'Quantity':
+        ret = super().__getitem__(key)
+        if not isinstance(ret, np.ndarray):     # a single element comes back as a numpy scalar
+            return Quantity._wrap(np.asarray(ret), self.unit)
+        return ret
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
     # properties
     @property
     def unit(self) -> UnitBase:
@@ -558,16 +1175,50 @@ class Quantity(np.ndarray):
 
     # private methods
     def _to_complex_unit(self) -> ComplexUnit:
-        _cp = self.unit ** 1
-        _cp.multiplier = self.value
-        return _cp
+        return (self.unit ** 1)._with_multiplier(self.value.item() if self.ndim == 0 else self.value)
+    def _value_string(self, precision: int | None = None, LaTeX: bool = False) -> str:
+        if self.ndim == 0:
+            return pretty(self.value.item(), precision, LaTeX=LaTeX)
+
+        return np.array2string(self.value, precision=precision, separator=', ')
     def _repr_latex_(self) -> str:
         return self.to_string(fmt="latex")
 
     # public methods
     def to_numpy(self) -> NDArray[Any]:
-        return self.value * self.unit
+        # [1, 2, 3] m -> [1m, 2m, 3m]
+        ret = np.empty(self.shape, dtype=object)
+        for index in np.ndindex(self.shape):
+            ret[index] = self[index]
+        return ret
     
+    # the methods of ndarray sum through `np.add.reduce`, which an offset unit refuses; see `_mean`
+    def mean(self, *args, **kwargs) -> 'Quantity':
+        return np.mean(self, *args, **kwargs)
+
+    def std(self, *args, **kwargs) -> 'Quantity':
+        return np.std(self, *args, **kwargs)
+
+    def var(self, *args, **kwargs) -> 'Quantity':
+        return np.var(self, *args, **kwargs)
+
+    def dot(self, b, out=None) -> 'Quantity':
+        # the method of ndarray would keep the unit of self
+        return np.dot(self, b, out=out)
+
+    def save(self, path: 'str | PathLike') -> None:
+        """Writes the quantity to a `.npy` file, with the expression of its unit in the header. See `siunits.storage`."""
+
+        from siunits.storage import save
+        save(path, self)
+
+    @classmethod
+    def load(cls, path: 'str | PathLike', mmap_mode: Literal['r', 'r+', 'c'] | None = 'r') -> 'Quantity':
+        """Reads a quantity written by `save`, as a view over the memory-mapped file unless `mmap_mode` is None."""
+
+        from siunits.storage import load
+        return load(path, mmap_mode)
+
     @classmethod
     def from_numpy(cls, array: NDArray[Any]) -> 'Quantity':
         if len(array.shape) == 0:
@@ -585,137 +1236,158 @@ class Quantity(np.ndarray):
         
         raise TypeError(f"Cannot create Quantity from {array}")
     
-    @overload
-    def to_string(self, *, fmt: Literal['latex'], precision: int | None = None) -> str:
-        _cp = self._to_complex_unit()
-
-        front = []
-        back = []
-        multiplier_string = pretty(_cp.multiplier, LaTeX=True, precision=precision)
-
-        for unit, exponent in _cp.records.items():
-            if exponent > 0:
-                if exponent == 1:
-                    front.append(unit.symbol)
+    def to_string(self, *, fmt: Literal['latex', 'unicode'] | None = None, precision: int | None = None) -> str:
+        _cp = self.unit ** 1
+        show_value = self.ndim != 0 or self.value.item() != 1
+
+        if fmt == 'latex':
+            front = []
+            back = []
+            multiplier_string = self._value_string(precision, LaTeX=True)
+
+            for unit, exponent in _cp.records.items():
+                if exponent > 0:
+                    if exponent == 1:
+                        front.append(unit.symbol)
+                    else:
+                        front.append(f"{unit.symbol}^{{{pretty(exponent)}}}")
                 else:
-                    front.append(f"{unit.symbol}^{{{pretty(exponent)}}}")
+                    if exponent == -1:
+                        back.append(unit.symbol)
+                    else:
+                        back.append(f"{unit.symbol}^{{{pretty(-exponent)}}}")
+
+            if front and back:
+                formula = f'\\dfrac{{{MULTIPLY_SIGN_LATEX.join(front)}}}{{{MULTIPLY_SIGN_LATEX.join(back)}}}'
+                if show_value:
+                    formula = f'{multiplier_string}{SMALL_SPACE_LATEX}{formula}'
+            elif front:
+                formula = f'{MULTIPLY_SIGN_LATEX.join(front)}'
+                if show_value:
+                    formula = f'{multiplier_string}{SMALL_SPACE_LATEX}{formula}'
+            elif back:
+                formula = f'\\dfrac{{{multiplier_string}}}{{{MULTIPLY_SIGN_LATEX.join(back)}}}'
             else:
-                if exponent == -1:
-                    back.append(unit.symbol)
+                formula = f'{multiplier_string}'
+
+            return f'$\\mathrm {{{formula}}}$'
+        elif fmt == 'unicode':
+            front = []
+            back = []
+            multiplier_string = self._value_string(precision)
+
+            for unit, exponent in _cp.records.items():
+                if exponent > 0:
+                    if exponent == 1:
+                        front.append(unit.symbol)
+                    else:
+                        front.append(f"{unit.symbol}{superscript(exponent)}")
                 else:
-                    back.append(f"{unit.symbol}^{{{pretty(-exponent)}}}")
-
-        if front and back:
-            formula = f'\\dfrac{{{MULTIPLY_SIGN_LATEX.join(front)}}}{{{MULTIPLY_SIGN_LATEX.join(back)}}}'
-            if _cp.multiplier != 1:
-                formula = f'{multiplier_string}{SMALL_SPACE_LATEX}{formula}'
-        elif front:
-            formula = f'{MULTIPLY_SIGN_LATEX.join(front)}'
-            if _cp.multiplier != 1:
-                formula = f'{multiplier_string}{SMALL_SPACE_LATEX}{formula}'
-        elif back:
-            formula = f'\\dfrac{{{multiplier_string}}}{{{MULTIPLY_SIGN_LATEX.join(back)}}}'
-        else:
-            formula = f'{multiplier_string}'
-
-        return f'$\\mathrm {{{formula}}}$'
-    @overload
-    def to_string(self, *, fmt: Literal['unicode'], precision: int | None = None) -> str:
-        _cp = self._to_complex_unit()
-
-        front = []
-        back = []
-        multiplier_string = pretty(_cp.multiplier, precision)
-
-        for unit, exponent in _cp.records.items():
-            if exponent > 0:
-                if exponent == 1:
-                    front.append(unit.symbol)
-                else:
-                    front.append(f"{unit.symbol}{superscript(exponent)}")
+                    if exponent == -1:
+                        back.append(unit.symbol)
+                    else:
+                        back.append(f"{unit.symbol}{superscript(-exponent)}")
+
+            if front and back:
+                formula = f'{(SMALL_SPACE + MULTIPLY_SIGN + SMALL_SPACE).join(front)}{SMALL_SPACE}/{SMALL_SPACE}{(SMALL_SPACE + MULTIPLY_SIGN + SMALL_SPACE).join(back)}'
+                if show_value:
+                    formula = f"{multiplier_string}{SMALL_SPACE}{formula}"
+            elif front:
+                formula = f'{(SMALL_SPACE + MULTIPLY_SIGN + SMALL_SPACE).join(front)}'
+                if show_value:
+                    formula = f"{multiplier_string}{SMALL_SPACE}{formula}"
+            elif back:
+                formula = f'{multiplier_string}{SMALL_SPACE}/{SMALL_SPACE}{(SMALL_SPACE + MULTIPLY_SIGN + SMALL_SPACE).join(back)}'
             else:
-                if exponent == -1:
-                    back.append(unit.symbol)
+                formula = f'{multiplier_string}'
+
+            return formula
+        elif fmt is None:
+            front = []
+            back = []
+            multiplier_string = self._value_string(precision)
+
+            for unit, exponent in _cp.records.items():
+                if exponent > 0:
+                    if exponent == 1:
+                        front.append(unit.symbol)
+                    else:
+                        front.append(f"{unit.symbol}^{pretty(exponent)}")
                 else:
-                    back.append(f"{unit.symbol}{superscript(-exponent)}")
-
-        if front and back:
-            formula = f'{(SMALL_SPACE + MULTIPLY_SIGN + SMALL_SPACE).join(front)}{SMALL_SPACE}/{SMALL_SPACE}{(SMALL_SPACE + MULTIPLY_SIGN + SMALL_SPACE).join(back)}'
-            if _cp.multiplier != 1:
-                formula = f"{multiplier_string}{SMALL_SPACE}{formula}"
-        elif front:
-            formula = f'{(SMALL_SPACE + MULTIPLY_SIGN + SMALL_SPACE).join(front)}'
-            if _cp.multiplier != 1:
-                formula = f"{multiplier_string}{SMALL_SPACE}{formula}"
-        elif back:
-            formula = f'{multiplier_string}{SMALL_SPACE}/{SMALL_SPACE}{(SMALL_SPACE + MULTIPLY_SIGN + SMALL_SPACE).join(back)}'
-        else:
-            formula = f'{multiplier_string}'
-
-        return formula
-    @overload
-    def to_string(self, *, fmt: None = None, precision: int | None = None) -> str:
-        _cp = self._to_complex_unit()
-
-        front = []
-        back = []
-        multiplier_string = pretty(_cp.multiplier, precision)
-
-        for unit, exponent in _cp.records.items():
-            if exponent > 0:
-                if exponent == 1:
-                    front.append(unit.symbol)
-                else:
-                    front.append(f"{unit.symbol}^{pretty(exponent)}")
+                    if exponent == -1:
+                        back.append(unit.symbol)
+                    else:
+                        back.append(f"{unit.symbol}^{pretty(-exponent)}")
+
+            if front and back:
+                formula = f'{(SMALL_SPACE + MULTIPLY_SIGN + SMALL_SPACE).join(front)}{SMALL_SPACE}/{SMALL_SPACE}{(SMALL_SPACE + MULTIPLY_SIGN + SMALL_SPACE).join(back)}'
+                if show_value:
+                    formula = f"{multiplier_string}{SMALL_SPACE}{formula}"
+            elif front:
+                formula = f'{(SMALL_SPACE + MULTIPLY_SIGN + SMALL_SPACE).join(front)}'
+                if show_value:
+                    formula = f"{multiplier_string}{SMALL_SPACE}{formula}"
+            elif back:
+                formula = f'{multiplier_string}{SMALL_SPACE}/{SMALL_SPACE}{(SMALL_SPACE + MULTIPLY_SIGN + SMALL_SPACE).join(back)}'
             else:
-                if exponent == -1:
-                    back.append(unit.symbol)
-                else:
-                    back.append(f"{unit.symbol}^{pretty(-exponent)}")
+                formula = f'{multiplier_string}'
 
-        if front and back:
-            formula = f'{(SMALL_SPACE + MULTIPLY_SIGN + SMALL_SPACE).join(front)}{SMALL_SPACE}/{SMALL_SPACE}{(SMALL_SPACE + MULTIPLY_SIGN + SMALL_SPACE).join(back)}'
-            if _cp.multiplier != 1:
-                formula = f"{multiplier_string}{SMALL_SPACE}{formula}"
-        elif front:
-            formula = f'{(SMALL_SPACE + MULTIPLY_SIGN + SMALL_SPACE).join(front)}'
-            if _cp.multiplier != 1:
-                formula = f"{multiplier_string}{SMALL_SPACE}{formula}"
-        elif back:
-            formula = f'{multiplier_string}{SMALL_SPACE}/{SMALL_SPACE}{(SMALL_SPACE + MULTIPLY_SIGN + SMALL_SPACE).join(back)}'
+            return formula
         else:
-            formula = f'{multiplier_string}'
-
-        return formula
-    @dispatch
-    def to_string(self, *, fmt, precision):
-        return NotImplemented
+            raise ValueError(f"Invalid format '{fmt}'")
     
     def decompose(self) -> 'Quantity':
+        if _absolute(self.unit):
+            # the values are converted, offset included; the expanded unit keeps only the scale
+            return self.to(self.unit.expand().delta)
         _cp = self._to_complex_unit().expand()
         return Quantity(1, _cp)
     def compose(self) -> list['Quantity']:
         # TODO: implement
         return []
     def si(self) -> 'Quantity':
+        if _absolute(self.unit):
+            # the SI unit has no offset, so the values are converted, offset included: 20 °C is 293.15 K
+            return self.to(self.unit.si())
         _cp = self._to_complex_unit().si()
         return Quantity(1, _cp)
     
-    @overload
-    def to(self, unit: UnitBase) -> 'Quantity':
+    def to(self, unit: 'UnitBase | Quantity', *, out: NDArray[Any] | None = None, inplace: bool = False) -> 'Quantity':
+        """Converts the quantity to `unit`.
+
+        :param out: An array to write the converted values into, instead of allocating a new one
+        :param inplace: Convert the values in place, the same as `out=self`
+        """
+
+        if isinstance(unit, Quantity):
+            unit = unit.unit
+        elif not isinstance(unit, UnitBase):
+            return NotImplemented
+
         if self.unit.dimension != unit.dimension:
             raise DimensionError(self.unit.dimension, unit.dimension, "Cannot convert between different dimensions")
 
-        return Quantity(1, self._to_complex_unit().to(unit))
-    @overload
-    def to(self, unit: 'Quantity') -> 'Quantity':
-        if self.unit.dimension != unit.unit.dimension:
-            raise DimensionError(self.unit.dimension, unit.unit.dimension, "Cannot convert between different dimensions")
+        if unit.multiplier != 1:
+            # convert into the bare unit, so the result never has to be scaled a second time
+            unit = (unit ** 1)._with_multiplier(1)
 
-        return Quantity(1, self._to_complex_unit().to(unit._to_complex_unit()))
-    @dispatch
-    def to(self, unit):
-        return NotImplemented
+        plan = conversion_plan(self.unit, unit)
+        if inplace:
+            out = self
+        if out is None:
+            return Quantity._wrap(plan(self.value), unit)
+
+        target = out.view(np.ndarray) if isinstance(out, Quantity) else out
+        dtype = plan.result_type(self.value)
+        if not np.can_cast(dtype, target.dtype, casting='same_kind'):
+            raise TypeError(f"Cannot convert values of dtype {self.dtype} from '{self.unit}' to '{unit}' in an array "
+                            f"of dtype {target.dtype}; the result is {dtype}")
+        plan(self.value, out=target)
+
+        if isinstance(out, Quantity):
+            out._unit = unit
+            return out
+        return Quantity._wrap(target, unit)
 
     # magic methods
     def __str__(self) -> str:
@@ -726,125 +1398,137 @@ class Quantity(np.ndarray):
         if format_spec == "":
             return self.to_string()
         elif format_spec == 'latex':
-            return self.to_string(format='latex')
+            return self.to_string(fmt='latex')
         elif format_spec == 'unicode':
-            return self.to_string(format='unicode')
+            return self.to_string(fmt='unicode')
         else:
             return f"{format(self.value, format_spec)} {self.unit}"
     def __deepcopy__(self, memodict=None):
-        if memodict is None:
-            memodict = {}
-        return Quantity(deepcopy(self.value), deepcopy(self.unit))
+        return Quantity._wrap(self.value.copy(), self.unit)
+    def __reduce_ex__(self, protocol: int):
+        # the values pickle as a plain array, which protocol 5 sends out of band, without a copy
+        return _unpickle_quantity, (self.value, self.unit)
     def __contains__(self, item):
         return NotImplemented
 
     # conversion operators
-    @overload
-    def __lshift__(self, other: UnitBase) -> 'Quantity':
+    def __lshift__(self, other: 'UnitBase | Quantity') -> 'Quantity':
         return self.to(other)
-    @overload
-    def __lshift__(self, other: 'Quantity') -> 'Quantity':
-        return self.to(other._to_complex_unit())
-    @dispatch
-    def __lshift__(self, other):
-        return NotImplemented
     
     def __rshift__(self, other):
         return NotImplemented
 
-    # unary operators
-    def __pos__(self) -> Self:
-        return self
-    def __neg__(self) -> 'Quantity':
-        return Quantity(-self.value, self.unit)
-    def __abs__(self) -> 'Quantity':
-        return Quantity(abs(self.value), self.unit)
-
-    # arithmetic operators
-    def __eq__(self, other: QuantityLike) -> NDArray[np.bool]:
-        other <<= self
-        return self.value.__eq__(other.value)
-    def __lt__(self, other: QuantityLike) -> NDArray[np.bool]:
-        other <<= self
-        return self.value.__lt__(other.value)
-    
-    def __radd__(self, other) -> 'Quantity':
-        return self.__add__(other)
-    def __rsub__(self, other) -> 'Quantity':
-        return -self.__sub__(other)
-    def __rmul__(self, other) -> 'Quantity':
-        return self.__mul__(other)
-    def __rtruediv__(self, other) -> 'Quantity':
-        return self.__truediv__(other) ** -1
-    
-    @overload
-    def __add__(self, other: 'Quantity') -> 'Quantity':
-        if self.ndim != 0:
-            # [1, 2, 3] m + [2, 3, 4] m -> [1m, 2m, 3m] + [2m, 3m, 4m]
-            return Quantity.from_numpy(self.to_numpy() + other.to_numpy())
-        else:
-            return _add(self, other)
-    @overload
-    def __add__(self, other: Any) -> 'Quantity':
-        if self.ndim != 0:
-            # [1, 2, 3] m + kg -> [1m, 2m, 3m] + kg
-            return Quantity.from_numpy(self.to_numpy() + other)
-        else:
-            return _add(self, other)
-    @dispatch
-    def __add__(self, other):
-        pass
-    
-    @overload
-    def __sub__(self, other: 'Quantity') -> 'Quantity':
-        if self.ndim != 0:
-            return Quantity.from_numpy(self.to_numpy() - other.to_numpy())
-        else:
-            return _sub(self, other)
-    @overload
-    def __sub__(self, other: Any) -> 'Quantity':
-        if self.ndim != 0:
-            return Quantity.from_numpy(self.to_numpy() - other)
-        else:
-            return _sub(self, other)
-    @dispatch
-    def __sub__(self, other):
-        pass
-    
-    @overload
-    def __mul__(self, other: 'Quantity') -> 'Quantity':
-        if self.ndim != 0:
-            return Quantity.from_numpy(self.to_numpy() * other.to_numpy())
-        else:
-            return _mul(self, other)
-    @overload
-    def __mul__(self, other: Any) -> 'Quantity':
-        if self.ndim != 0:
-            return Quantity.from_numpy(self.to_numpy() * other)
-        else:
-            return _mul(self, other)
-    @dispatch
-    def __mul__(self, other):
-        pass
-    
-    @overload
-    def __truediv__(self, other: 'Quantity') -> 'Quantity':
-        if self.ndim != 0:
-            return Quantity.from_numpy(self.to_numpy() / other.to_numpy())
-        else:
-            return _div(self, other)    
-    @overload
-    def __truediv__(self, other: Any) -> 'Quantity':
-        if self.ndim != 0:
-            return Quantity.from_numpy(self.to_numpy() / other)
-        else:
-            return _div(self, other)
-    @dispatch
-    def __truediv__(self, other):
-        pass
+def _unpickle_quantity(value: NDArray[Any], unit: UnitBase) -> Quantity:
+    return Quantity._wrap(value, unit)
+
+def _common_unit(arrays) -> tuple[list, UnitBase]:
+    """Returns the raw values of `arrays` expressed in the unit of the first quantity among them, and that unit."""
+
+    target = next(a.unit for a in arrays if isinstance(a, Quantity))
+    return [
+        _convert(a.view(np.ndarray), a.unit, target) if isinstance(a, Quantity) else _convert(a, None, target)
+        for a in arrays
+    ], target
+
+@_implements(np.concatenate)
+def _concatenate(arrays, *args, **kwargs) -> Quantity:
+    values, unit = _common_unit(arrays)
+    return Quantity._wrap(np.concatenate(values, *args, **kwargs), unit)
+
+@_implements(np.stack)
+def _stack(arrays, *args, **kwargs) -> Quantity:
+    values, unit = _common_unit(arrays)
+    return Quantity._wrap(np.stack(values, *args, **kwargs), unit)
+
+@_implements(np.hstack)
+def _hstack(arrays, *args, **kwargs) -> Quantity:
+    values, unit = _common_unit(arrays)
+    return Quantity._wrap(np.hstack(values, *args, **kwargs), unit)
+
+@_implements(np.vstack)
+def _vstack(arrays, *args, **kwargs) -> Quantity:
+    values, unit = _common_unit(arrays)
+    return Quantity._wrap(np.vstack(values, *args, **kwargs), unit)
+
+@_implements(np.where)
+def _where(condition, x, y) -> Quantity:
+    (x, y), unit = _common_unit([x, y])
+    return Quantity._wrap(np.where(condition, x, y), unit)
+
+def _statistic(func, a, unit: UnitBase, args, kwargs) -> Quantity:
+    """Applies `func` to the raw values of `a`, and gives the result `unit`."""
+
+    out = kwargs.get('out')
+    if isinstance(out, Quantity):
+        func(a.view(np.ndarray), *args, **{**kwargs, 'out': out.view(np.ndarray)})
+        out._unit = unit
+        return out
+    return Quantity._wrap(np.asarray(func(a.view(np.ndarray), *args, **kwargs)), unit)
+
+# numpy computes these through `np.add.reduce`, which refuses absolute values in an offset unit; an average is
+# defined for them, and the spread around it is a difference
+@_implements(np.mean)
+def _mean(a, *args, **kwargs) -> Quantity:
+    return _statistic(np.mean, a, a.unit, args, kwargs)
+
+@_implements(np.std)
+def _std(a, *args, **kwargs) -> Quantity:
+    return _statistic(np.std, a, a.unit.delta, args, kwargs)
+
+@_implements(np.var)
+def _var(a, *args, **kwargs) -> Quantity:
+    return _statistic(np.var, a, a.unit.delta ** 2, args, kwargs)
+
+@_implements(np.cumprod)
+def _cumprod(a, axis=None, dtype=None, out=None) -> Quantity:
+    # numpy's own wrapper would retry on a plain array after the TypeError, and keep the unit of `a`
+    if axis is None:
+        a, axis = a.ravel(), 0
+    return np.multiply.accumulate(a, axis=axis, dtype=dtype, out=out)
+
+@_implements(np.clip)
+def _clip(a, a_min=None, a_max=None, out=None, **kwargs) -> Quantity:
+    (a, a_min, a_max), unit = _common_unit([a, a_min, a_max])
+    if isinstance(out, Quantity):
+        np.clip(a, a_min, a_max, out=out.view(np.ndarray), **kwargs)
+        out._unit = unit
+        return out
+    return Quantity._wrap(np.asarray(np.clip(a, a_min, a_max, out=out, **kwargs)), unit)
+
+@_implements(np.isclose)
+def _isclose(a, b, rtol: float = 1e-05, atol=0, equal_nan: bool = False) -> NDArray[np.bool_]:
+    (a, b, atol), _ = _common_unit([a, b, atol])
+    return np.isclose(a, b, rtol=rtol, atol=atol, equal_nan=equal_nan)
+
+@_implements(np.allclose)
+def _allclose(a, b, rtol: float = 1e-05, atol=0, equal_nan: bool = False) -> bool:
+    return bool(np.all(_isclose(a, b, rtol=rtol, atol=atol, equal_nan=equal_nan)))
+
+@_implements(np.dot)
+def _dot(a, b, out=None) -> Quantity:
+    units = [x.unit for x in (a, b) if isinstance(x, Quantity)]
+    unit = units[0] if len(units) == 1 else units[0] * units[1]
+    values = np.dot(np.asarray(a), np.asarray(b), out.view(np.ndarray) if isinstance(out, Quantity) else out)
+    if isinstance(out, Quantity):
+        out._unit = unit
+        return out
+    return Quantity._wrap(np.asarray(values), unit)
+
+@_implements(np.linalg.norm)
+def _norm(x, ord=None, axis=None, keepdims=False) -> Quantity | NDArray[Any]:
+    values = np.linalg.norm(x.view(np.ndarray), ord, axis, keepdims)
+    if ord == 0:    # the number of nonzero elements
+        return values
+    return Quantity._wrap(np.asarray(values), x.unit)
 
 # %% _eq
-@overload
+_eq = BinaryDispatch('_eq')
+
+def _unit_quantity(unit: UnitBase) -> Quantity:
+    # units mixed with quantities take part in numpy arithmetic as one of themselves
+    return Quantity._wrap(np.asarray(1), unit)
+
+@_eq.register
 def _eq(a: ComplexUnit, b: Number) -> bool:
     if a.multiplier == 0:
         return b == 0
@@ -853,7 +1537,7 @@ def _eq(a: ComplexUnit, b: Number) -> bool:
     else:
         return NotImplemented
 
-@overload
+@_eq.register
 def _eq(a: FixedUnit, b: Number) -> bool:
     if a.multiplier == 0:
         return b == 0
@@ -862,7 +1546,7 @@ def _eq(a: FixedUnit, b: Number) -> bool:
     else:
         return NotImplemented
 
-@overload
+@_eq.register
 def _eq(a: UnitBase, b: Number) -> bool:
     if a.multiplier == 0:
         return b == 0
@@ -871,54 +1555,66 @@ def _eq(a: UnitBase, b: Number) -> bool:
     else:
         return NotImplemented
 
-@overload
+@_eq.register
 def _eq(a: Number, b: UnitBase) -> bool:
     return _eq(b, a)
 
-@overload
+def _same_canonical(a: UnitBase, b: UnitBase) -> bool:
+    a_, b_ = a._canonical(), b._canonical()
+    if a_ is not None and b_ is not None:
+        return a_ is b_
+
+    # the scale is not hashable (e.g. an array multiplier), so compare the SI forms directly
+    a_, b_ = a.si() ** 1, b.si() ** 1
+    return a.dimension == b.dimension and a.offset == b.offset and a_.multiplier == b_.multiplier and a_.terms == b_.terms
+
+@_eq.register
 def _eq(a: ComplexUnit, b: ComplexUnit, except_multiplier=False) -> bool:
-    if except_multiplier:
-        return a.dimension == b.dimension and a.offset == b.offset and a.si().records == b.si().records
+    if a is b:
+        return True
+    elif except_multiplier:
+        return a.dimension == b.dimension and a.offset == b.offset and (a.si() ** 1).terms == (b.si() ** 1).terms
     elif a.multiplier == 0 or b.multiplier == 0:   # todo: offset 고려
         return a.multiplier == b.multiplier
     else:
-        return a.dimension == b.dimension and a.offset == b.offset and a.multiplier == b.multiplier and a.si().records == b.si().records
+        return _same_canonical(a, b)
 
-@overload
+@_eq.register
 def _eq(a: ComplexUnit, b: Unit, except_multiplier=False) -> bool:
-    return _eq(a.si(), (b**1).si(), except_multiplier)
+    if except_multiplier:
+        return _eq(a.si(), (b**1).si(), except_multiplier)
+    elif a.multiplier == 0 or b.multiplier == 0:   # todo: offset 고려
+        return a.multiplier == b.multiplier
+    else:
+        return _same_canonical(a, b)
 
-@overload
+@_eq.register
 def _eq(a: Unit, b: ComplexUnit, except_multiplier=False) -> bool:
-    return _eq(b, a)
+    return _eq(b, a, except_multiplier)
 
-@overload
-def _eq(a: Unit, b: Unit, except_multiplier=False) -> bool:    
-    if except_multiplier:
+@_eq.register
+def _eq(a: Unit, b: Unit, except_multiplier=False) -> bool:
+    if a is b:
+        return True
+    elif except_multiplier:
         return a.dimension == b.dimension and a.offset == b.offset
     elif a.multiplier == 0 or b.multiplier == 0:   # todo: offset 고려
         return a.multiplier == b.multiplier
     else:
-        return a.dimension == b.dimension and a.offset == b.offset and a.multiplier == b.multiplier
-
-@overload
-def _eq(a: Quantity, b: Quantity) -> bool:
-    return _eq(a.to_complex_unit(), b.to_complex_unit())
+        return _same_canonical(a, b)
 
-@overload
-def _eq(a: Quantity, b: UnitBase | Number) -> bool:
-    return _eq(a.to_complex_unit(), b)
+@_eq.register
+def _eq(a: UnitBase, b: Quantity) -> NDArray[np.bool_]:
+    return np.equal(b, _unit_quantity(a))
 
-@overload
+@_eq.register
 def _eq(a, b, except_multiplier=False) -> bool:
     return NotImplemented
 
-@dispatch
-def _eq(a, b, except_multiplier=False):
-    pass
-
 # %% _add
-@overload
+_add = BinaryDispatch('_add')
+
+@_add.register
 def _add(a: ComplexUnit, b: ComplexUnit) -> ComplexUnit:
     if a.dimension != b.dimension:
         raise DimensionError(a.dimension, b.dimension, "Cannot add units with different dimensions")
@@ -927,36 +1623,30 @@ def _add(a: ComplexUnit, b: ComplexUnit) -> ComplexUnit:
         a, b = b, a
     
     a_, b_ = a.si(), b.si()
-    ret = ComplexUnit(ArithmeticDict(a.records))
-    ret.multiplier = (a_.multiplier + b_.multiplier) / (a_.multiplier / a.multiplier if a.multiplier != 0 else 1)
-    ret.depth = max(a.depth, b.depth) + 1
-    return ret
+    multiplier = (a_.multiplier + b_.multiplier) / (a_.multiplier / a.multiplier if a.multiplier != 0 else 1)
+    return ComplexUnit(ArithmeticDict(a.records), multiplier=multiplier, depth=max(a.depth, b.depth) + 1)
 
-@overload
+@_add.register
 def _add(a: ComplexUnit, b: Unit) -> ComplexUnit:
     if a.dimension != b.dimension:
         raise DimensionError(a.dimension, b.dimension, "Cannot add units with different dimensions")
 
     # TODO: offset
     a_, b_ = a.si(), b.si()
-    ret = ComplexUnit(ArithmeticDict({b: 1}))
-    ret.multiplier = (a_.multiplier + b_.multiplier) / (b_.multiplier / b.multiplier)   # TEST 필요
-    ret.depth = max(a.depth, b.depth) + 1
-    return ret
+    multiplier = (a_.multiplier + b_.multiplier) / (b_.multiplier / b.multiplier)   # TEST 필요
+    return ComplexUnit(ArithmeticDict({b: 1}), multiplier=multiplier, depth=max(a.depth, b.depth) + 1)
 
-@overload
+@_add.register
 def _add(a: Unit, b: ComplexUnit) -> ComplexUnit:
     if a.dimension != b.dimension:
         raise DimensionError(a.dimension, b.dimension, "Cannot add units with different dimensions")
 
     # TODO: offset
     a_, b_ = a.si(), b.si()
-    ret = ComplexUnit(ArithmeticDict({a: 1}))
-    ret.multiplier = (a_.multiplier + b_.multiplier) / (a_.multiplier / a.multiplier if a.multiplier != 0 else 1)   # TEST 필요
-    ret.depth = max(a.depth, b.depth) + 1
-    return ret
+    multiplier = (a_.multiplier + b_.multiplier) / (a_.multiplier / a.multiplier if a.multiplier != 0 else 1)   # TEST 필요
+    return ComplexUnit(ArithmeticDict({a: 1}), multiplier=multiplier, depth=max(a.depth, b.depth) + 1)
 
-@overload
+@_add.register
 def _add(a: Unit, b: Unit) -> ComplexUnit:
     if a.dimension != b.dimension:
         raise DimensionError(a.dimension, b.dimension, "Cannot add units with different dimensions")
@@ -966,36 +1656,21 @@ def _add(a: Unit, b: Unit) -> ComplexUnit:
         a, b = b, a
     
     a_, b_ = a.si(), b.si()
-    ret = ComplexUnit(ArithmeticDict({a: 1}))
-    ret.multiplier = (a_.multiplier + b_.multiplier) / (a_.multiplier / a.multiplier if a.multiplier != 0 else 1)   # TEST 필요
-    ret.depth = max(a.depth, b.depth) + 1
-    return ret
-
-@overload
-def _add(a: Quantity, b: Quantity) -> Quantity:
-    return Quantity(1, _add(a.to_complex_unit(), b.to_complex_unit()))
-
-@overload
-def _add(a: Quantity, b: UnitBase) -> Quantity:
-    return Quantity(1, _add(a.to_complex_unit(), b))
-
-@overload
-def _add(a: Quantity, b: Number) -> Quantity:
-    if b == 0:
-        return a
-    else:
-        return NotImplemented
+    multiplier = (a_.multiplier + b_.multiplier) / (a_.multiplier / a.multiplier if a.multiplier != 0 else 1)   # TEST 필요
+    return ComplexUnit(ArithmeticDict({a: 1}), multiplier=multiplier, depth=max(a.depth, b.depth) + 1)
 
-@overload
-def _add(a, b):
-    return NotImplemented
+@_add.register
+def _add(a: UnitBase, b: Quantity) -> Quantity:
+    return np.add(b, _unit_quantity(a))
 
-@dispatch
+@_add.register
 def _add(a, b):
-    pass
+    return NotImplemented
 
 # %% _sub
-@overload
+_sub = BinaryDispatch('_sub')
+
+@_sub.register
 def _sub(a: ComplexUnit, b: ComplexUnit) -> ComplexUnit:
     if a.dimension != b.dimension:
         raise DimensionError(a.dimension, b.dimension, "Cannot subtract units with different dimensions")
@@ -1006,37 +1681,31 @@ def _sub(a: ComplexUnit, b: ComplexUnit) -> ComplexUnit:
         swap = True
 
     a_, b_ = a.si(), b.si()
-    ret = ComplexUnit(ArithmeticDict(a.records))
-    ret.multiplier = (a_.multiplier - b_.multiplier) / (a_.multiplier / a.multiplier if a.multiplier != 0 else 1)
+    multiplier = (a_.multiplier - b_.multiplier) / (a_.multiplier / a.multiplier if a.multiplier != 0 else 1)
     if swap:
-        ret.multiplier *= -1
+        multiplier *= -1
 
-    ret.depth = max(a.depth, b.depth) + 1
-    return ret
+    return ComplexUnit(ArithmeticDict(a.records), multiplier=multiplier, depth=max(a.depth, b.depth) + 1)
 
-@overload
+@_sub.register
 def _sub(a: ComplexUnit, b: Unit) -> ComplexUnit:
     if a.dimension != b.dimension:
         raise DimensionError(a.dimension, b.dimension, "Cannot subtract units with different dimensions")
 
     a_, b_ = a.si(), b.si()
-    ret = ComplexUnit(ArithmeticDict({b: 1}))
-    ret.multiplier = (a_.multiplier - b_.multiplier) / (b_.multiplier / b.multiplier if b.multiplier != 0 else 1)
-    ret.depth = max(a.depth, b.depth) + 1
-    return ret
+    multiplier = (a_.multiplier - b_.multiplier) / (b_.multiplier / b.multiplier if b.multiplier != 0 else 1)
+    return ComplexUnit(ArithmeticDict({b: 1}), multiplier=multiplier, depth=max(a.depth, b.depth) + 1)
 
-@overload
+@_sub.register
 def _sub(a: Unit, b: ComplexUnit) -> ComplexUnit:
     if a.dimension != b.dimension:
         raise DimensionError(a.dimension, b.dimension, "Cannot subtract units with different dimensions")
 
     a_, b_ = a.si(), b.si()
-    ret = ComplexUnit(ArithmeticDict({a: 1}))
-    ret.multiplier = (a_.multiplier - b_.multiplier) / (a_.multiplier / a.multiplier if a.multiplier != 0 else 1)
-    ret.depth = max(a.depth, b.depth) + 1
-    return ret
+    multiplier = (a_.multiplier - b_.multiplier) / (a_.multiplier / a.multiplier if a.multiplier != 0 else 1)
+    return ComplexUnit(ArithmeticDict({a: 1}), multiplier=multiplier, depth=max(a.depth, b.depth) + 1)
 
-@overload
+@_sub.register
 def _sub(a: Unit, b: Unit) -> ComplexUnit:
     if a.dimension != b.dimension:
         raise DimensionError(a.dimension, b.dimension, "Cannot subtract units with different dimensions")
@@ -1046,71 +1715,72 @@ def _sub(a: Unit, b: Unit) -> ComplexUnit:
         a, b = b, a
         swap = True
 
-    ret = ComplexUnit(ArithmeticDict({a: 1}))
-    ret.multiplier = (a.multiplier - b.multiplier) / (a.multiplier / b.multiplier if b.multiplier != 0 else 1)
+    multiplier = (a.multiplier - b.multiplier) / (a.multiplier / b.multiplier if b.multiplier != 0 else 1)
     if swap:
-        ret.multiplier *= -1
-
-    ret.depth = max(a.depth, b.depth) + 1
-    return ret
-
-@overload
-def _sub(a: Quantity, b: Quantity) -> Quantity:
-    return Quantity(1, _sub(a.to_complex_unit(), b.to_complex_unit()))
+        multiplier *= -1
 
-@overload
-def _sub(a: Quantity, b: UnitBase) -> Quantity:
-    return Quantity(1, _sub(a.to_complex_unit(), b))
+    return ComplexUnit(ArithmeticDict({a: 1}), multiplier=multiplier, depth=max(a.depth, b.depth) + 1)
 
-@overload
-def _sub(a: Quantity, b: Number) -> Quantity:
-    if b == 0:
-        return a
-    else:
-        return NotImplemented
+@_sub.register
+def _sub(a: UnitBase, b: Quantity) -> Quantity:
+    return np.subtract(_unit_quantity(a), b)
 
-@overload
+@_sub.register
 def _sub(a, b):
     return NotImplemented
 
-@dispatch
-def _sub(a, b):
-    pass
-
 # %% _mul
-@overload
-def _mul(a: ComplexUnit, b: ComplexUnit) -> ComplexUnit:
-    merged_records = deepcopy(a.records)
-    for key, value in b.records.items():
-        merged_records[key] += value
+_mul = BinaryDispatch('_mul')
+
+def _terms(unit: UnitBase) -> tuple:
+    return unit.terms if isinstance(unit, ComplexUnit) else ((unit.ordinal, 1),)
+
+def _merge_terms(a: tuple, b: tuple) -> tuple:
+    """Merges two term tuples sorted by ordinal, adding the exponents and dropping the ones that cancel out."""
+
+    merged = []
+    i, j = 0, 0
+    while i < len(a) and j < len(b):
+        ordinal_a, exponent_a = a[i]
+        ordinal_b, exponent_b = b[j]
+        if ordinal_a < ordinal_b:
+            merged.append(a[i])
+            i += 1
+        elif ordinal_a > ordinal_b:
+            merged.append(b[j])
+            j += 1
+        else:
+            exponent = exponent_a + exponent_b
+            if exponent != 0:
+                merged.append((ordinal_a, exponent))
+            i += 1
+            j += 1
 
-    ret = ComplexUnit(ArithmeticDict(merged_records))
-    ret.multiplier = a.multiplier * b.multiplier
-    ret.depth = max(a.depth, b.depth) + 1
-    return ret
+    merged.extend(a[i:])
+    merged.extend(b[j:])
+    return tuple(merged)
+
+@_mul.register
+def _mul(a: ComplexUnit, b: ComplexUnit) -> ComplexUnit:
+    return ComplexUnit._from_terms(
+        _merge_terms(a.terms, b.terms), a.dimension + b.dimension, 0, a.multiplier * b.multiplier,
+        max(a.depth, b.depth) + 1
+    )
 
 # TODO: offset
-@overload
+@_mul.register
 def _mul(a: ComplexUnit, b: Unit) -> ComplexUnit:
-    merged_records = deepcopy(a.records)
-    merged_records[b] += 1
-
-    ret = ComplexUnit(ArithmeticDict(merged_records))
-    ret.multiplier = a.multiplier * b.multiplier
-    ret.depth = max(a.depth, b.depth) + 1
-    return ret
+    b_ = b ** 1 if b.multiplier != 1 else b    # folds the multiplier of b, if any
+    return ComplexUnit._from_terms(
+        _merge_terms(a.terms, _terms(b_)), a.dimension + b.dimension, 0, a.multiplier * b_.multiplier,
+        max(a.depth, b.depth) + 1
+    )
 
-@overload
+@_mul.register
 def _mul(a: Unit, b: ComplexUnit) -> ComplexUnit:
-    merged_records = deepcopy(b.records)
-    merged_records[a] += 1
+    return _mul(b, a)
 
-    ret = ComplexUnit(ArithmeticDict(merged_records))
-    ret.multiplier = a.multiplier * b.multiplier
-    ret.depth = max(a.depth, b.depth) + 1
-    return ret
-
-@overload
+@_mul.register
 def _mul(a: Unit, b: Unit) -> ComplexUnit:
     # if _eq(a, b):
     #     ret = ComplexUnit(ArithmeticDict({a: 2}))
@@ -1120,19 +1790,19 @@ def _mul(a: Unit, b: Unit) -> ComplexUnit:
     # else:
     #     ret = ComplexUnit(ArithmeticDict({a: 1, b: 1}))
 
-    d = ArithmeticDict[Unit]()
-    d[a] += 1
-    d[b] += 1
-
-    ret = ComplexUnit(d)    # multiplier 계산은 생성자에서 자동으로 처리
-    ret.depth = max(a.depth, b.depth) + 1
-    return ret
+    # folds the multipliers of a and b, if any
+    a_ = a ** 1 if a.multiplier != 1 else a
+    b_ = b ** 1 if b.multiplier != 1 else b
+    return ComplexUnit._from_terms(
+        _merge_terms(_terms(a_), _terms(b_)), a.dimension + b.dimension, 0, a_.multiplier * b_.multiplier,
+        max(a.depth, b.depth) + 1
+    )
 
-@overload
+@_mul.register
 def _mul(a: UnitBase, b: ArrayLike | Number) -> Quantity:
     return Quantity(b, a)
 
-@overload
+@_mul.register
 def _mul(a: ArrayLike | Number, b: UnitBase) -> Quantity:
     return Quantity(a, b)
 
@@ -1150,36 +1820,26 @@ def _mul(a: ArrayLike | Number, b: UnitBase) -> Quantity:
 #     else:
 #         return [i * b for i in a]
 
-@overload
-def _mul(a: Quantity, b: Quantity) -> Quantity:
-    return Quantity(1, _mul(a.to_complex_unit(), b.to_complex_unit()))
-
-@overload
-def _mul(a: Quantity, b: UnitBase) -> Quantity:
-    return Quantity(1, _mul(a.to_complex_unit(), b))
+@_mul.register
+def _mul(a: UnitBase, b: Quantity) -> Quantity:
+    return np.multiply(_unit_quantity(a), b)
 
-@overload
-def _mul(a: Quantity, b: Number) -> Quantity:
-    return Quantity(a.value * b, a.unit)
-
-@overload
+@_mul.register
 def _mul(a, b):
     return NotImplemented
 
-@dispatch
-def _mul(a, b):
-    pass
-
 # %% _div
-@overload
+_div = BinaryDispatch('_div')
+
+@_div.register
 def _div(a: ComplexUnit | Unit, b: ComplexUnit | Unit) -> ComplexUnit:
     return a * b ** -1
 
-@overload
+@_div.register
 def _div(a: UnitBase, b: ArrayLike | Number) -> Quantity:
     return Quantity(1 / b, a)
 
-@overload
+@_div.register
 def _div(a: ArrayLike | Number, b: UnitBase) -> Quantity:
     return Quantity(a, b ** -1)
 
@@ -1190,53 +1850,44 @@ def _div(a: ArrayLike | Number, b: UnitBase) -> Quantity:
 #     else:
 #         return [i / b for i in a]
 
-@overload
-def _div(a: Quantity, b: Quantity) -> Quantity:
-    return Quantity(1, _div(a.to_complex_unit(), b.to_complex_unit()))
+@_div.register
+def _div(a: UnitBase, b: Quantity) -> Quantity:
+    return np.divide(_unit_quantity(a), b)
 
-@overload
+@_div.register
 def _div(a: Quantity, b: UnitBase) -> Quantity:
-    return Quantity(1, _div(a.to_complex_unit(), b))
-
-@overload
-def _div(a: Quantity, b: Number) -> Quantity:
-    return Quantity(a.value / b, a.unit)
+    return np.divide(a, _unit_quantity(b))
 
-@overload
+@_div.register
 def _div(a, b):
     return NotImplemented
 
-@dispatch
-def _div(a, b):
-    pass
-
 # %% _pow
-@overload
+_pow = BinaryDispatch('_pow')
+
+# only the first power of an offset unit keeps its offset; in any other power or product it stands for a difference
+
+@_pow.register
 def _pow(a: ComplexUnit, exponent: Number) -> ComplexUnit:
-    ret = ComplexUnit(ArithmeticDict({unit: exp * exponent for unit, exp in a.records.items()}))
-    ret.multiplier = a.multiplier ** exponent
-    ret.depth = a.depth + 1
-    return ret
+    terms = tuple((ordinal, exp * exponent) for ordinal, exp in a.terms) if exponent != 0 else ()
+    offset = a.offset if exponent == 1 else 0
+    return ComplexUnit._from_terms(terms, a.dimension * exponent, offset, a.multiplier ** exponent, a.depth + 1)
 
-@overload
+@_pow.register
 def _pow(a: Unit, exponent: Number) -> ComplexUnit:
-    ret = ComplexUnit(ArithmeticDict({a: exponent}))
-    ret.multiplier = a.multiplier ** exponent
-    ret.depth = a.depth + 1
-    return ret
+    offset = a.offset if exponent == 1 else 0
+    if a.multiplier != 1:
+        return ComplexUnit(ArithmeticDict({a: exponent}), offset, depth=a.depth + 1)    # multiplier 계산은 생성자에서 자동으로 처리
 
-@overload
-def _pow(a: Quantity, exponent: Number) -> Quantity:
-    return Quantity(1, _pow(a.to_complex_unit(), exponent))
+    terms = ((a.ordinal, exponent),) if exponent != 0 else ()
+    return ComplexUnit._from_terms(terms, a.dimension * exponent, offset, 1, a.depth + 1)
 
-@overload
+@_pow.register
 def _pow(a, exponent):
     return NotImplemented
 
-@dispatch
-def _pow(a, exponent):
-    pass
-
-# %%
+# the jump tables of the operators fill in as type pairs are first used, so importing does not resolve all of them
 
-__all__ = ['UnitBase', 'Unit', 'ComplexUnit', 'FixedUnit']
+__all__ = [
+    'UnitBase', 'Unit', 'ComplexUnit', 'FixedUnit', 'OffsetUnitError', 'SICacheInfo', 'si_cache_info', 'si_cache_clear'
+]
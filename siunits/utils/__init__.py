@@ -1,3 +1,5 @@
 from .functions import *
+from .dispatch import *
+from .cache import *
 from .types import *
 from .string import *
@@ -0,0 +1,81 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, NamedTuple
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+# stands for a missing entry, since `None` may be a cached value
+_MISSING = object()
+
+class LRUCache[K, V]:
+    """A bounded mapping that evicts the least recently used entry once it holds more than `maxsize` entries.
+
+    Unlike `functools.lru_cache`, the cache is keyed explicitly, so a value can be computed from objects that are not
+    part of its key.
+
+    The cache is safe to share between threads. Lookups, reordering and eviction happen under one lock; on a miss, the
+    value is computed without it and the first value stored for a key wins.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        if maxsize < 0:
+            raise ValueError("maxsize must be non-negative")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._data
+
+    def get(self, key: K, compute: Callable[[], V]) -> V:
+        """Returns the value for `key`, calling `compute` and storing its result on a miss."""
+
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is not _MISSING:
+                self.hits += 1
+                self._data.move_to_end(key)
+                return value
+            self.misses += 1
+
+        value = compute()
+        with self._lock:
+            value = self._data.setdefault(key, value)
+            self._evict()
+        return value
+
+    def _evict(self) -> None:
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def resize(self, maxsize: int) -> None:
+        """Changes the capacity, evicting the least recently used entries that no longer fit."""
+
+        if maxsize < 0:
+            raise ValueError("maxsize must be non-negative")
+
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+__all__ = ['CacheInfo', 'LRUCache']
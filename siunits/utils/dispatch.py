@@ -0,0 +1,88 @@
+from types import GenericAlias, UnionType
+from typing import Any, Callable, Union, get_args, get_origin, get_type_hints
+
+def _flatten(annotation: Any) -> tuple[type, ...]:
+    """Turns a type annotation into the tuple of classes it accepts."""
+
+    if annotation is Any or annotation is object:
+        return (object,)
+    elif isinstance(annotation, tuple):
+        return tuple(c for a in annotation for c in _flatten(a))
+    elif isinstance(annotation, UnionType) or get_origin(annotation) is Union:
+        return tuple(c for a in get_args(annotation) for c in _flatten(a))
+    elif isinstance(annotation, GenericAlias) or get_origin(annotation) is not None:
+        # parametrized generics such as `list[Number]` are dispatched on their origin
+        return _flatten(get_origin(annotation))
+    elif isinstance(annotation, type):
+        return (annotation,)
+    else:
+        raise TypeError(f"Cannot dispatch on annotation '{annotation}'")
+
+def _accepts(types: tuple[type, ...], cls: type) -> bool:
+    return any(issubclass(cls, t) for t in types)
+
+def _narrower(a: tuple[type, ...], b: tuple[type, ...]) -> bool:
+    return all(_accepts(b, cls) for cls in a)
+
+class BinaryDispatch:
+    """A function of two arguments dispatched on their concrete types.
+
+    Implementations are registered with type annotations on their first two parameters, in the same way as with
+    `plum.dispatch`. The most specific implementation is resolved the first time a concrete `(type(a), type(b))`
+    pair is called, and stored in a jump table, so every later call with that pair costs a single dictionary lookup.
+
+    The decorator returns the dispatcher itself, so every implementation can be defined under the dispatcher's name:
+
+        _add = BinaryDispatch('_add')
+
+        @_add.register
+        def _add(a: int, b: int) -> int:
+            return a + b
+    """
+
+    def __init__(self, name: str):
+        self.__name__ = name
+        self._methods: list[tuple[tuple[type, ...], tuple[type, ...], Callable]] = []
+        self._table: dict[tuple[type, type], Callable] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.__name__} with {len(self._methods)} method(s)>"
+
+    def register(self, func: Callable) -> 'BinaryDispatch':
+        hints = get_type_hints(func)
+        params = func.__code__.co_varnames[:2]
+
+        left = _flatten(hints.get(params[0], object))
+        right = _flatten(hints.get(params[1], object))
+
+        self._methods.append((left, right, func))
+        self._table.clear()
+        return self
+
+    def resolve(self, left: type, right: type) -> Callable:
+        """Returns the most specific implementation for the given argument types, and stores it in the jump table."""
+
+        candidates = [(l, r, f) for l, r, f in self._methods if _accepts(l, left) and _accepts(r, right)]
+        best = [
+            (l, r, f) for l, r, f in candidates
+            if all(_narrower(l, l2) and _narrower(r, r2) for l2, r2, _ in candidates)
+        ]
+
+        if len(best) == 0:
+            raise TypeError(f"{self.__name__}: no implementation for ({left.__name__}, {right.__name__})")
+        elif len(best) > 1:
+            raise TypeError(f"{self.__name__}: ambiguous implementations for ({left.__name__}, {right.__name__})")
+
+        impl = best[0][2]
+        self._table[(left, right)] = impl
+        return impl
+
+    def __call__(self, a, b, *args):
+        try:
+            impl = self._table[(type(a), type(b))]
+        except KeyError:
+            impl = self.resolve(type(a), type(b))
+
+        return impl(a, b, *args)
+
+__all__ = ['BinaryDispatch']
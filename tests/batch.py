@@ -0,0 +1,62 @@
+import pytest
+import numpy as np
+import siunits
+from siunits import m, s, K
+from siunits.predefined import cm, mm, h, degC, degF
+from siunits.batch import BatchPlan, convert_many
+from siunits.dimension import DimensionError
+
+def test_convert_many():
+    columns = {
+        'x': ([1., 2.] * m, cm),
+        'y': ([3., 4.] * m, cm),
+        'v': ([36., 72.] * (m / h), m / s),
+        't': ([0., 100.] * degC, degF),
+    }
+    results, plan = convert_many(columns)
+    assert list(results) == ['x', 'y', 'v', 't']
+    assert np.allclose(results['x'].value, [100, 200])
+    assert np.allclose(results['y'].value, [300, 400])
+    assert np.allclose(results['v'].value, [0.01, 0.02])
+    assert np.allclose(results['t'].value, [32, 212])
+    assert results['x'].unit == cm
+    assert siunits.convert_many is convert_many
+
+def test_batch_plan_shares_identical_pairs():
+    _, plan = convert_many({'x': ([1.] * m, cm), 'y': ([2.] * m, cm), 'z': ([3.] * m, mm)})
+    assert len(plan) == 3
+    assert plan.columns['x'][2] is plan.columns['y'][2]
+    assert plan.columns['x'][2] is not plan.columns['z'][2]
+
+def test_batch_plan_reuse():
+    _, plan = convert_many({'x': ([1.] * m, cm), 't': ([1.] * degC, K)})
+    results = plan({'x': [5., 6.] * m, 't': np.array([10., 20.])})
+    assert np.allclose(results['x'].value, [500, 600])
+    assert np.allclose(results['t'].value, [283.15, 293.15])
+
+    # a column that arrives in another unit is converted from that unit
+    assert np.allclose(plan({'x': [5.] * mm})['x'].value, [0.5])
+
+def test_batch_plan_out():
+    plan = BatchPlan.resolve({'x': (m, cm)})
+    buffer = np.empty(2)
+    results = plan({'x': np.array([1., 2.])}, out={'x': buffer})
+    assert np.shares_memory(results['x'], buffer)
+    assert np.allclose(buffer, [100, 200])
+
+def test_batch_plan_out_integer():
+    plan = BatchPlan.resolve({'x': (m, cm), 'y': (m, mm)})
+    x, y = np.zeros(2), np.zeros(2, dtype=np.int64)
+    with pytest.raises(TypeError, match="dtype int64 for column 'y'"):
+        plan({'x': np.array([1., 2.]), 'y': np.array([1., 2.])}, out={'x': x, 'y': y})
+    assert not x.any() and not y.any()
+
+    # an integer array holds integers that need no conversion
+    BatchPlan.resolve({'y': (m, m)})({'y': np.array([1, 2])}, out={'y': y})
+    assert list(y) == [1, 2]
+
+def test_convert_many_errors():
+    with pytest.raises(DimensionError):
+        convert_many({'x': ([1.] * m, s)})
+    with pytest.raises(TypeError):
+        convert_many({'x': ([1.], m)})
@@ -0,0 +1,22 @@
+import pytest
+from siunits.benchmarks import Change, compare, run_suite
+
+def test_compare_pairs_common_metrics():
+    baseline = {'results': {'algebra': {'m * s': {'time_us': 10.0}, 'm / s': {'time_us': 5.0}}}}
+    current = {'results': {'algebra': {'m * s': {'time_us': 15.0}, 'N + N': {'time_us': 1.0}}}}
+
+    changes = compare(current, baseline)
+    assert changes == [Change('algebra', 'm * s', 'time_us', 10.0, 15.0)]
+    assert changes[0].ratio == 1.5
+
+def test_run_suite_unknown():
+    with pytest.raises(ValueError):
+        run_suite(('nonexistent',))
+
+def test_main_unknown_suite(capsys):
+    from siunits.benchmarks.__main__ import main
+
+    with pytest.raises(SystemExit) as error:
+        main(['algebra', 'nonexistent'])
+    assert error.value.code == 2
+    assert "unknown suite(s): nonexistent" in capsys.readouterr().err
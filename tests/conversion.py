@@ -0,0 +1,176 @@
+import gc
+
+import pytest
+import numpy as np
+from siunits import m, s, kg
+from siunits.predefined import cm, mm, h, K, degC, degF
+from siunits.types import ComplexUnit, OffsetUnitError
+from siunits.dimension import DimensionError
+from siunits.conversion import (
+    ConversionPlan, conversion_plan, converter, conversion_cache_info, conversion_cache_clear, set_conversion_cache_size
+)
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    conversion_cache_clear()
+    yield
+    set_conversion_cache_size(1024)
+    conversion_cache_clear()
+
+def test_conversion_plan():
+    plan = conversion_plan(m, cm)
+    assert plan == ConversionPlan(100, 0)
+    assert plan(2) == 200
+    assert conversion_plan(cm / h, m / s).scale == pytest.approx(0.01 / 3600)
+
+def test_conversion_plan_cached_by_canonical_form():
+    conversion_plan(cm / h, m / s)
+    conversion_plan(ComplexUnit({m: 1, h: -1}, multiplier=0.01), m / s)
+    assert conversion_cache_info().hits == 1
+    assert conversion_cache_info().misses == 1
+
+def test_conversion_cache_eviction():
+    set_conversion_cache_size(2)
+    conversion_plan(mm, m)
+    conversion_plan(cm, m)
+    conversion_plan(mm, m)
+    conversion_plan(m, mm)
+    assert conversion_cache_info().currsize == 2
+
+    conversion_plan(cm, m)     # evicted as the least recently used
+    assert conversion_cache_info().misses == 4
+
+def test_canonical_forms_released():
+    from siunits.types import _canonical_forms
+    known = len(_canonical_forms)
+
+    for i in range(1, 101):
+        conversion_plan((m ** 1)._with_multiplier(1 + i / 1000), m)
+    assert len(_canonical_forms) > known
+    assert conversion_cache_info().currsize == 100
+
+    # once neither a unit nor a cached plan uses a scale, its form goes away
+    conversion_cache_clear()
+    gc.collect()
+    assert len(_canonical_forms) <= known
+
+def test_converter():
+    to_cm = converter(m, cm)
+    assert to_cm(2.5) == pytest.approx(250)
+    assert np.allclose(to_cm([1, 2]), [100, 200])
+    assert np.allclose(to_cm((1, 2)), [100, 200])
+
+    out = np.empty(2)
+    assert to_cm(np.array([3., 4.]), out=out) is out
+    assert np.allclose(out, [300, 400])
+
+    assert converter(degC, degF)(100.) == pytest.approx(212)
+    with pytest.raises(DimensionError):
+        converter(m, s)
+
+def test_conversion_plan_dimension_mismatch():
+    with pytest.raises(DimensionError):
+        conversion_plan(m, kg)
+
+def test_quantity_to():
+    q = [1., 2.] * m
+    assert np.allclose(q.to(cm).value, [100, 200])
+    assert np.allclose(q.to(mm).to(m).value, [1, 2])
+    assert np.allclose(q.to([1., 1.] * cm).value, [100, 200])
+
+def test_quantity_to_inplace():
+    q = np.array([1., 2.]) * m
+    buffer = q.value
+    ret = q.to(cm, inplace=True)
+    assert ret is q
+    assert q.unit is cm
+    assert np.shares_memory(q, buffer)
+    assert np.allclose(q.value, [100, 200])
+
+def test_quantity_to_inplace_integer():
+    q = np.array([1, 2], dtype=np.int64) * m
+    with pytest.raises(TypeError, match='dtype int64'):
+        q.to(cm, inplace=True)
+    assert q.unit is m
+    assert q.to(m, inplace=True) is q
+
+def test_quantity_to_out():
+    q = [1., 2.] * m
+    out = np.empty(2)
+    ret = q.to(mm, out=out)
+    assert np.shares_memory(ret, out)
+    assert np.allclose(out, [1000, 2000])
+    assert np.allclose(q.value, [1, 2])
+
+def test_offset_conversion():
+    t = np.array([-40., 0., 100.]) * degC
+    assert np.allclose(t.to(K).value, [233.15, 273.15, 373.15])
+    assert np.allclose(t.to(degF).value, [-40, 32, 212])
+    assert np.allclose((t.to(degF)).to(degC).value, t.value)
+    assert conversion_plan(degC, K) == ConversionPlan(1, 273.15)
+
+def test_offset_difference():
+    d = 30 * degC - 20 * degC
+    assert d.unit == degC.delta
+    assert d.to(K).value == pytest.approx(10)
+    assert degC.delta == K
+    assert (degF.delta ** 1).si().multiplier == pytest.approx(5 / 9)
+
+def test_offset_add_difference():
+    assert (20 * degC + 5 * K).unit == degC ** 1
+    assert (20 * degC + 5 * K).value == pytest.approx(25)
+    assert (20 * degC + 9 * degF.delta).value == pytest.approx(25)
+    assert (5 * K + 20 * degC).value == pytest.approx(25)
+    assert (20 * degC - 9 * degF.delta).value == pytest.approx(15)
+
+def test_offset_invalid_arithmetic():
+    with pytest.raises(OffsetUnitError):
+        20 * degC + 30 * degC
+    with pytest.raises(OffsetUnitError):
+        5 * K - 20 * degC
+    with pytest.raises(OffsetUnitError):
+        (20 * degC) * (2 * m)
+    with pytest.raises(OffsetUnitError):
+        (20 * degC) ** 2
+
+def test_offset_scaling():
+    t = np.array([20.]) * degC
+    for scale in (lambda t: t * 2, lambda t: 2 * t, lambda t: t / 2, lambda t: t // 2, lambda t: 2 / t,
+                  lambda t: t @ np.ones(1), lambda t: -t, lambda t: abs(t), np.fabs):
+        with pytest.raises(OffsetUnitError):
+            scale(t)
+
+    # differences scale like any other quantity
+    d = np.array([20.]) * degC.delta
+    assert np.allclose((d * 2).value, [40])
+    assert np.allclose((d / 2).value, [10])
+    assert np.allclose((d // 3).value, [6])
+    assert (d @ np.ones(1)).unit == degC.delta
+    assert np.allclose((-d).value, [-20])
+    assert abs(-d).unit == degC.delta
+
+def test_offset_si_and_decompose():
+    for q in [20 * degC, 68 * degF, [20., 30.] * degC]:
+        for result in (q.si(), q.decompose()):
+            assert result.unit == K
+            assert np.allclose(result.value, q.to(K).value)
+    assert (20 * degC).si().value == pytest.approx(293.15)
+    assert (68 * degF).decompose().value == pytest.approx(293.15)
+    assert (5 * degC.delta).si().value == pytest.approx(5)
+
+def test_offset_mean():
+    t = [10., 20., 30.] * degC
+    assert np.mean(t).unit == degC ** 1
+    assert np.mean(t).value == pytest.approx(20)
+    assert t.mean().value == pytest.approx(20)
+    assert np.std(t).unit == degC.delta
+    assert t.var().value == pytest.approx(200 / 3)
+
+def test_offset_sum():
+    t = [20., 30.] * degC
+    for reduce in (np.sum, np.cumsum, lambda t: t.sum(), lambda t: np.add.reduceat(t, [0])):
+        with pytest.raises(OffsetUnitError):
+            reduce(t)
+
+    assert np.sum((t - 20 * degC)).value == pytest.approx(10)
+    assert np.max(t).value == 30
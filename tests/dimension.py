@@ -1,4 +1,7 @@
 import pytest
+import pickle
+from copy import deepcopy
+from fractions import Fraction
 from siunits.dimension import Dimension
 
 def test_dimension_initialization():
@@ -46,3 +49,29 @@ def test_dimension_scalar_division():
     scalar = 2
     result = dim / scalar
     assert result == Dimension(length=5, mass=10, time=15, current=20, temperature=25, amount=30, intensity=35)
+
+def test_dimension_interning():
+    dim1 = Dimension(length=1, time=-2)
+    dim2 = Dimension(1, 0, -2)
+    assert dim1 is dim2
+    assert hash(dim1) == hash(dim2)
+    assert Dimension(length=1) + Dimension(time=-2) is dim1
+    assert Dimension(length=2.0) is Dimension(length=2)
+
+def test_dimension_rational_exponents():
+    dim = Dimension(length=1) * 0.5
+    assert dim.length == Fraction(1, 2)
+    assert dim is Dimension(length=Fraction(1, 2))
+    assert dim * 2 is Dimension(length=1)
+    assert Dimension(length=1) / 3 is Dimension(length=Fraction(1, 3))
+    assert str(dim) == 'L^0.5'
+
+def test_dimension_immutable():
+    dim = Dimension(length=1)
+    with pytest.raises(AttributeError):
+        dim.length = 2
+
+def test_dimension_copy_and_pickle():
+    dim = Dimension(length=1, mass=2)
+    assert deepcopy(dim) is dim
+    assert pickle.loads(pickle.dumps(dim)) is dim
@@ -0,0 +1,43 @@
+import pytest
+from siunits import unit, m, s, minute, ohm
+from siunits.types import Unit, FixedUnit
+from siunits.dimension import Dimension
+
+def test_find():
+    assert unit.find('m') is m
+    assert unit['s'] is s
+    assert unit.find('min') is minute
+
+    with pytest.raises(KeyError):
+        unit.find('no such unit')
+
+def test_find_by_alias():
+    assert unit.find('minute') is minute
+    assert unit['ohm'] is ohm
+    assert unit.find('Ω') is ohm
+
+def test_find_all_keeps_creation_order():
+    first = Unit('Zz', Dimension(length=1, time=1))
+    second = FixedUnit('Zz', m * s, multiplier=2)
+
+    assert unit.find('Zz') is first
+    assert unit.find_all('Zz') == [first, second]
+    assert unit['Zz'] == [first, second]
+
+def test_alias():
+    zq = unit.set('Zq', m / s)
+    assert unit.alias('zq-speed', zq) is zq
+    assert unit.alias('zq-speed', zq) is zq
+    assert unit.find_all('zq-speed') == [zq]
+
+    with pytest.raises(TypeError):
+        unit.alias('x', m / s)
+
+def test_lookup_does_not_scan_instances():
+    before = len(Unit._instances)
+    for i in range(1000):
+        Unit(f'_scratch{i}', Dimension(length=i))
+    assert len(Unit._instances) >= before + 1000
+
+    assert unit.find('m') is m
+    assert unit.find('_scratch999').dimension == Dimension(length=999)
@@ -0,0 +1,114 @@
+import pytest
+import numpy as np
+from siunits.measure import Measure, Variable, Constant, Affine, Apply
+
+@pytest.fixture
+def C():
+    return Measure()
+
+def test_measure_values(C):
+    assert C(100) == 100
+    assert (C + 273.15)(100) == pytest.approx(373.15)
+    assert (9/5 * C + 32)(100) == pytest.approx(212)
+    assert (10 * np.log10(C))(100) == pytest.approx(20)
+    assert (-np.log10(C))(4.5e-4) == pytest.approx(3.3468, abs=1e-4)
+    assert (np.exp(C) + 1)(1) == pytest.approx(np.e + 1)
+    assert (1 / C)(4) == 0.25
+    assert (2 ** C)(3) == 8
+    assert (C * C - C)(3) == 6
+
+def test_affine_chains_fold(C):
+    F = 9/5 * C + 32
+    assert F.node == Affine(Variable(), 9/5, 32)
+
+    K = (F - 32) * 5/9 + 273.15
+    assert isinstance(K.node, Affine) and isinstance(K.node.operand, Variable)
+    assert K(100) == pytest.approx(373.15)
+
+    assert ((C + 1) + (2 * C + 3)).node == Affine(Variable(), 3, 4)
+    assert (-(-C)).node == Variable()
+    assert (C * 2 / 4).node == Affine(Variable(), 0.5, 0)
+
+def test_constants_fold(C):
+    assert (C * 0 + 1).node == Affine(Variable(), 0, 1)
+    assert Measure(Constant(2)).node == Constant(2)
+    assert isinstance(np.log10(C).node, Apply)
+    assert str(10 * np.log10(C) + 1) == '10 * log10(x) + 1'
+
+def test_evaluate_arrays(C):
+    x = np.linspace(1, 100, 11)
+    original = x.copy()
+
+    dB = 10 * np.log10(C * 2) + 1
+    np.testing.assert_allclose(dB(x), 10 * np.log10(x * 2) + 1)
+    np.testing.assert_array_equal(x, original)
+
+    np.testing.assert_allclose((9/5 * C + 32)(np.arange(3)), [32, 33.8, 35.6])
+
+def test_comparisons_are_not_written_into_temporaries(C):
+    x = np.array([0., 1., 5.])
+    less = np.less(C + 1, 3)(x)
+    assert less.dtype == bool
+    assert less.tolist() == [True, True, False]
+
+    finite = np.isfinite(C * 2)(np.array([1., np.inf]))
+    assert finite.dtype == bool
+    assert finite.tolist() == [True, False]
+
+def test_measure_from_function():
+    double = Measure(lambda x: x * 2)
+    assert double(3) == 6
+    assert (double + 1)(3) == 7
+    assert double.converter(2) == 4
+    assert Measure(converter=lambda x: x * 3)(2) == 6
+
+    x = np.arange(3)
+    assert (Measure(lambda v: v) + 1)(x).tolist() == [1, 2, 3]
+    assert x.tolist() == [0, 1, 2]
+
+@pytest.mark.parametrize('build', [
+    lambda C: 9/5 * C + 32,
+    lambda C: 10 * np.log10(C / 1e-3),
+    lambda C: -np.log10(C),
+    lambda C: np.exp(C) + 1,
+    lambda C: C**2,
+    lambda C: 2**C,
+    lambda C: 1 / C,
+    lambda C: np.cbrt(3 * C),
+])
+def test_inverse_closed_form(C, build):
+    measure = build(C)
+    inverse = measure.inverse()
+
+    x = np.array([0.5, 3.0, 7.0])
+    np.testing.assert_allclose(inverse(measure(x)), x)
+    assert inverse(measure(3.0)) == pytest.approx(3.0)
+
+def test_inverse_of_affine_is_affine(C):
+    F = 9/5 * C + 32
+    assert F.inverse().node == Affine(Variable(), 5/9, -32 * 5/9)
+
+def test_numerical_inverse(C):
+    cubic = C**3 + C
+    with pytest.raises(ValueError):
+        cubic.inverse()
+
+    inverse = cubic.inverse(domain=(-10, 10))
+    x = np.linspace(-9.5, 9.5, 101)
+    np.testing.assert_allclose(inverse(cubic(x)), x, atol=1e-12)
+    assert inverse(cubic(2.0)) == pytest.approx(2.0)
+    assert inverse.inverse()(2.0) == 10.0
+
+    table = inverse.node.func.table()
+    inverse(cubic(x))
+    assert inverse.node.func.table() is table
+
+    with pytest.raises(ValueError):
+        inverse(cubic(11.0))
+
+    with pytest.raises(ValueError):
+        (C * C).inverse(domain=(-1, 1))(0.5)
+
+def test_inverse_of_function():
+    cube = Measure(lambda v: v**3)
+    assert cube.inverse(domain=(0, 4))(27.0) == pytest.approx(3.0)
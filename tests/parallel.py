@@ -0,0 +1,65 @@
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+import numpy as np
+from siunits import m, s
+from siunits.predefined import cm, km
+from siunits.parallel import map_chunks
+
+def _speed(distance):
+    return distance / (2 * s)
+
+def _to_cm(distance):
+    return distance.to(cm)
+
+def _norm(points):
+    return np.sqrt(np.sum(points.value ** 2, axis=1))
+
+def _shrink(points):
+    return points[:0]
+
+@pytest.fixture(scope='module', params=['fork', 'spawn'])
+def context(request):
+    return multiprocessing.get_context(request.param)
+
+def test_map_chunks(context):
+    q = np.arange(1000.) * km
+    result = map_chunks(_speed, q, workers=2, chunks=7, mp_context=context)
+    assert result.unit == km / s
+    assert np.allclose(result.value, np.arange(1000.) / 2)
+
+def test_map_chunks_converts_into_the_first_unit(context):
+    q = np.arange(10.) * m
+    result = map_chunks(_to_cm, q, workers=2, mp_context=context)
+    assert result.unit == cm
+    assert np.allclose(result.value, np.arange(10.) * 100)
+
+def test_map_chunks_plain_result(context):
+    points = np.arange(12.).reshape(6, 2) * m
+    result = map_chunks(_norm, points, workers=2, chunks=3, mp_context=context)
+    assert type(result) is np.ndarray
+    assert np.allclose(result, np.hypot(points.value[:, 0], points.value[:, 1]))
+
+def test_map_chunks_errors():
+    with pytest.raises(TypeError):
+        map_chunks(_speed, np.arange(3.))
+    with pytest.raises(ValueError):
+        map_chunks(_shrink, np.arange(3.).reshape(3, 1) * m, workers=1)
+
+def test_map_chunks_releases_the_source_when_the_target_fails(monkeypatch):
+    from siunits import parallel
+    created = []
+
+    class Failing(SharedMemory):
+        def __init__(self, *args, **kwargs):
+            if created:
+                raise OSError("no space left for the target block")
+            super().__init__(*args, **kwargs)
+            created.append(self.name)
+
+    monkeypatch.setattr(parallel, 'SharedMemory', Failing)
+    with pytest.raises(OSError, match='no space'):
+        map_chunks(_speed, np.arange(3.) * m, workers=1)
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=created[0])
@@ -0,0 +1,61 @@
+import pytest
+from siunits import kg, m, s, mol, K, J, N, L, parse, parse_many, UnitParseError
+from siunits.predefined import mg
+from siunits.types import ComplexUnit
+from siunits.parser import parse_cache_info, parse_cache_clear
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    parse_cache_clear()
+    yield
+    parse_cache_clear()
+
+@pytest.mark.parametrize('expression', ['kg*m/s^2', 'kg⋅m/s^2', 'kg·m·s^-2', 'kg m/s²', 'kg*m*s**-2', '(kg*m)/(s*s)'])
+def test_parse(expression):
+    assert parse(expression) == kg * m / s**2
+    assert parse(expression) is parse('kg*m/s^2')
+
+def test_parse_returns_complex_unit():
+    assert isinstance(parse('m'), ComplexUnit)
+    assert parse('m') is m**1
+    assert parse('1/s') == s**-1
+
+def test_parse_is_left_associative():
+    assert parse('J/mol/K') == J / (mol * K)
+    assert parse('J/(mol⋅K)') is parse('J/mol/K')
+
+def test_parse_exponents():
+    assert parse('m^(1/2)').dimension == (m**0.5).dimension
+    assert parse('m¹⸍²') is parse('m^(1/2)')
+    assert parse('m⁻²') is m**-2
+    assert parse('m^-(1/2)') == parse('m^(1/2)')**-1
+
+def test_parse_prefixes():
+    assert parse('mg') is mg**1
+    assert parse('kN·m').dimension == (N * m).dimension
+    assert parse('kN·m').si().multiplier == 1000
+    assert parse('μmol/L') is parse('µmol/L')
+    assert parse('μmol/L').si().multiplier == pytest.approx(1e-3)
+
+def test_parse_delta_units():
+    from siunits.predefined import degC
+    assert parse('Δ°C/s') is degC.delta / s
+    with pytest.raises(UnitParseError):
+        parse('Δm')
+
+@pytest.mark.parametrize('expression', ['', 'kg*', '(m', 'm)', 'foo', '2 m', 'kkg', 'm^', 'm-s', 'm^(1/0)'])
+def test_parse_errors(expression):
+    with pytest.raises(UnitParseError):
+        parse(expression)
+
+def test_parse_cache():
+    parse('kg*m/s^2')
+    parse('kg*m/s^2')
+
+    info = parse_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+def test_parse_many():
+    units = parse_many(['kN·m', 'm²/s', 'kN·m', 'L'])
+    assert units == [parse('kN·m'), parse('m²/s'), parse('kN·m'), L**1]
+    assert parse_cache_info().misses == 3
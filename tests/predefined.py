@@ -0,0 +1,25 @@
+import subprocess
+import sys
+
+import siunits
+from siunits import predefined
+
+def _run(code: str) -> str:
+    return subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout.strip()
+
+def test_import_is_lazy():
+    assert _run("import sys, siunits; print('numpy' in sys.modules, 'siunits.types' in sys.modules)") == 'False False'
+
+def test_derived_units_are_built_on_first_use():
+    code = "import siunits.predefined as p; print('Pa' in vars(p)); p.Pa; print('Pa' in vars(p), 'N' in vars(p))"
+    assert _run(code).split() == ['False', 'True', 'True']
+
+def test_registry_builds_derived_units():
+    code = "from siunits import unit; print(unit.find('ohm').symbol, unit.find('min').symbol, unit.find('kPa').symbol)"
+    assert _run(code) == "Ω min kPa"
+
+def test_exports():
+    assert set(predefined.__all__) <= set(siunits.__all__)
+    assert {'unit', 'parse', 'parse_many', 'UnitParseError'} <= set(siunits.__all__)
+    assert siunits.N is predefined.N
+    assert siunits.km is predefined.km
@@ -0,0 +1,49 @@
+import pytest
+import siunits
+from siunits import unit, kg, g, m, s, N, Pa, ohm, minute, parse
+from siunits.types import FixedUnit
+from siunits.prefixes import PREFIXES, prefixed, prefixable, resolve_prefixed, _generated
+
+def test_prefix_factors():
+    assert PREFIXES['k'] == 1e3
+    assert PREFIXES['c'] == 1e-2
+    assert PREFIXES['μ'] == 1e-6
+    assert PREFIXES['q'] == 1e-30
+
+def test_prefixed():
+    km = prefixed('k', m)
+    assert isinstance(km, FixedUnit)
+    assert km.symbol == 'km'
+    assert km.base.multiplier == 1000
+    assert prefixed('k', m) is km
+    assert prefixed('u', s) is prefixed('µ', s) is prefixed('μ', s)
+
+def test_prefixed_grams():
+    assert prefixed('k', g) is kg
+    assert prefixed('m', g) is siunits.mg
+    assert siunits.mg.base.multiplier == 1e-6
+    assert prefixed('M', g).si().multiplier == 1000
+
+def test_unprefixable():
+    assert not prefixable(kg)
+    assert not prefixable(minute)
+    assert not prefixable(prefixed('k', m))
+    with pytest.raises(ValueError):
+        prefixed('k', kg)
+    with pytest.raises(KeyError):
+        prefixed('x', m)
+
+def test_prefixed_units_are_created_on_demand():
+    assert ('G', Pa.ordinal) not in _generated
+
+    assert unit.find('GPa') is prefixed('G', Pa)
+    assert siunits.kN is prefixed('k', N)
+    assert siunits.predefined.ns is prefixed('n', s)
+    assert parse('kohm') is prefixed('k', ohm)**1
+
+    assert parse('GHz') is prefixed('G', siunits.Hz)**1
+    assert (parse('GHz') * s).si().multiplier == 1e9
+
+    assert resolve_prefixed('kmin') is None
+    with pytest.raises(AttributeError):
+        siunits.kmin
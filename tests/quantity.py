@@ -0,0 +1,90 @@
+import pytest
+import numpy as np
+from siunits import m, s, kg
+from siunits.predefined import cm, g, N
+from siunits.types import Quantity
+from siunits.dimension import DimensionError
+
+def test_array_times_unit():
+    q = np.arange(3) * m
+    assert isinstance(q, Quantity)
+    assert q.dtype != object
+    assert q.unit is m
+    assert isinstance([1, 2] * m, Quantity)
+
+def test_scalar_quantity():
+    q = 2 * kg
+    assert isinstance(q, Quantity) and q.ndim == 0
+    assert str(q) == '2\u2009kg'
+    assert str(2 * kg + 3 * g) == '2.003\u2009kg'
+    assert isinstance(([1., 2.] * m)[0], Quantity)
+
+def test_ufunc_converts_units():
+    a = [1., 2.] * m
+    b = [100., 300.] * cm
+    assert np.allclose((a + b).value, [2, 5])
+    assert (a + b).unit is m
+    assert np.allclose((b - a).value, [0, 100])
+    assert list(a < b) == [False, True]
+
+def test_ufunc_result_unit():
+    a = [1., 2.] * m
+    assert (a * a).unit == m ** 2
+    assert (a / ([1., 2.] * s)).unit == m / s
+    assert np.sqrt(a ** 2).unit == m
+    assert (-a).unit is m
+    assert np.allclose(((a * N) * 2).to(N * m).value, [2, 4])
+
+def test_ufunc_dimension_mismatch():
+    a = [1., 2.] * m
+    with pytest.raises(DimensionError):
+        a + [1., 2.] * s
+    with pytest.raises(DimensionError):
+        a + 1
+    with pytest.raises(DimensionError):
+        np.exp(a)
+
+def test_ufunc_out():
+    a = [1., 2.] * m
+    a += [100., 100.] * cm
+    assert np.allclose(a.value, [2, 3])
+    assert a.unit is m
+
+def test_reductions():
+    a = [1., 2., 3.] * m
+    assert np.sum(a) == 6 * m
+    assert a.max().unit is m
+    assert np.isclose(np.mean(a).value, 2)
+
+def test_product_reductions():
+    a = [1., 2., 3.] * m
+    assert np.prod(a) == 6 * m**3
+    assert a.prod().unit == m**3
+    assert np.prod(np.stack([a, a]), axis=0).unit == m**2
+    assert np.allclose(np.cumprod([1., 2.] * (m / m)), [1, 2])
+    with pytest.raises(TypeError, match='different unit'):
+        np.cumprod(a)
+
+def test_dot_and_norm():
+    a = [3., 4.] * m
+    assert np.dot(a, a) == 25 * m**2
+    assert a.dot(a) == 25 * m**2
+    assert (a @ a).unit == m**2
+    assert np.linalg.norm(a) == 5 * m
+    assert np.linalg.norm(a, ord=0) == 2
+
+def test_array_functions():
+    a = [1., 2.] * m
+    b = [100., 200.] * cm
+    c = np.concatenate([a, b])
+    assert c.unit is m
+    assert np.allclose(c.value, [1, 2, 1, 2])
+    assert np.allclose(a, b)
+    assert np.stack([a, b]).shape == (2, 2)
+    with pytest.raises(DimensionError):
+        np.concatenate([a, [1., 2.] * s])
+    assert np.allclose(np.clip(a, 150 * cm, 3 * m).value, [1.5, 2])
+
+def test_unsupported_array_function():
+    with pytest.raises(TypeError, match='not supported'):
+        np.trace(np.eye(2) * m)
@@ -0,0 +1,63 @@
+import io
+
+import pytest
+import numpy as np
+from siunits import m, s, K
+from siunits.predefined import kPa, Pa, degC, cm
+from siunits.reader import read_csv, read_lines
+
+def test_read_csv_units_in_cells():
+    text = 'p,x\n12.5 kPa,1 m\n13 kPa,2 m\n14 kPa,3 m\n'
+    chunks = list(read_csv(io.StringIO(text)))
+    assert len(chunks) == 1
+    assert chunks[0]['p'].unit == kPa ** 1
+    assert np.allclose(chunks[0]['p'].value, [12.5, 13, 14])
+    assert np.allclose(chunks[0]['x'].value, [1, 2, 3])
+
+def test_read_csv_units_in_header():
+    text = ['time [s],temperature (°C)', '0,20.5', '1,21', '2,']
+    chunk, = read_csv(text)
+    assert chunk['time'].unit == s ** 1
+    assert chunk['temperature'].unit == degC ** 1
+    assert np.isnan(chunk['temperature'].value[2])
+
+def test_read_csv_header_parenthetical():
+    chunk, = read_csv(['temperature (outdoor),id (internal),p (kPa)', '20 °C,7,1'])
+    assert chunk['temperature (outdoor)'].unit == degC ** 1
+    assert chunk['id (internal)'].unit == (m / m)
+    assert chunk['p'].unit == kPa ** 1
+
+def test_read_csv_chunks():
+    lines = ['v [m/s]'] + [f'{i}' for i in range(10)]
+    chunks = [chunk['v'] for chunk in read_csv(lines, chunk_size=4)]
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert np.allclose(np.concatenate([chunk.value for chunk in chunks]), np.arange(10))
+
+def test_read_csv_mixed_units():
+    chunk, = read_csv(['p [kPa]', '1', '500 Pa', '2 kPa'])
+    assert np.allclose(chunk['p'].value, [1, 0.5, 2])
+
+def test_read_csv_targets():
+    chunk, = read_csv(['p,t', '1 kPa,0 °C', '2 kPa,100 °C'], to={'p': Pa, 't': K})
+    assert chunk['p'].unit == Pa
+    assert np.allclose(chunk['p'].value, [1000, 2000])
+    assert np.allclose(chunk['t'].value, [273.15, 373.15])
+
+def test_read_csv_without_header():
+    chunk, = read_csv(['1 m;2', '3 m;4 s'], delimiter=';', header=False, columns=[1], units={1: 'ms'})
+    assert list(chunk) == [1]
+    assert np.allclose(chunk[1].to(s).value, [0.002, 4])
+
+def test_read_csv_errors():
+    with pytest.raises(ValueError, match='line 2'):
+        list(read_csv(['x', 'twelve']))
+    with pytest.raises(KeyError):
+        list(read_csv(['x', '1'], columns=['y']))
+
+def test_read_lines(tmp_path):
+    path = tmp_path / 'sensor.txt'
+    path.write_text('12.5 cm\n13 cm\n0.14 m\n')
+    chunks = list(read_lines(path, to=m))
+    assert len(chunks) == 1
+    assert chunks[0].unit == m
+    assert np.allclose(chunks[0].value, [0.125, 0.13, 0.14])
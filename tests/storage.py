@@ -0,0 +1,76 @@
+import subprocess
+import sys
+
+import pytest
+import numpy as np
+from siunits import m, s, kg
+from siunits.predefined import kPa, degC, degF, ohm, J, mol, K
+from siunits.types import Quantity
+from siunits.storage import unit_expression, save, load
+
+def test_unit_expression():
+    assert unit_expression(m) == 'm'
+    assert unit_expression(kg * m / s**2) == 'kg*m*s^-2'
+    assert unit_expression(m**0.5) == 'm^(1/2)'
+    assert unit_expression(m / m) == '1'
+
+@pytest.mark.parametrize('unit', [m, kg * m / s**2, kPa, degC, ohm, J / (mol * K), m / m])
+def test_save_load(tmp_path, unit):
+    path = tmp_path / 'q.npy'
+    q = np.arange(6.).reshape(2, 3) * unit
+    q.save(path)
+
+    loaded = Quantity.load(path)
+    assert loaded.unit == q.unit
+    assert loaded.shape == (2, 3)
+    assert np.array_equal(loaded.value, q.value)
+
+def test_load_delta_in_fresh_interpreter(tmp_path):
+    # the delta units are not predefined; a process that has not built them finds them by their symbol
+    for name, q in [('c.npy', np.std([20., 30.] * degC)), ('f.npy', [1., 2.] * degF.delta)]:
+        q.save(tmp_path / name)
+        code = f"from siunits import Quantity; q = Quantity.load({str(tmp_path / name)!r}); print(q.unit, q.value.tolist())"
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, check=True, text=True)
+        assert result.stdout.strip() == f"{q.unit} {q.value.tolist()}"
+
+def test_load_is_memory_mapped(tmp_path):
+    path = tmp_path / 'q.npy'
+    save(path, np.arange(10.) * m)
+
+    def mapped(array):
+        while array is not None and not isinstance(array, np.memmap):
+            array = array.base
+        return array is not None
+
+    loaded = load(path)
+    assert mapped(loaded)
+    assert not loaded.flags.writeable
+    assert not mapped(load(path, mmap_mode=None))
+
+def test_load_writes_through(tmp_path):
+    path = tmp_path / 'q.npy'
+    save(path, np.zeros(3) * m)
+    q = load(path, mmap_mode='r+')
+    q[1] = 5 * m
+    del q
+    assert np.array_equal(load(path).value, [0, 5, 0])
+
+def test_saved_file_is_plain_npy(tmp_path):
+    path = tmp_path / 'q.npy'
+    q = np.asfortranarray(np.arange(6.).reshape(2, 3)) * m
+    q.save(path)
+    assert np.array_equal(np.load(path), q.value)
+
+    q[:, ::2].save(path)
+    assert np.array_equal(np.load(path), q.value[:, ::2])
+
+def test_load_without_unit(tmp_path):
+    path = tmp_path / 'plain.npy'
+    np.save(path, np.arange(3.))
+    with pytest.raises(ValueError, match='no unit'):
+        load(path)
+
+def test_quantity_without_copy():
+    array = np.arange(3.)
+    assert np.shares_memory(Quantity(array, m, copy=False), array)
+    assert not np.shares_memory(Quantity(array, m), array)
@@ -1,5 +1,15 @@
+import pickle
+import subprocess
+import sys
+import threading
+
 import pytest
-from siunits.types import Unit, ComplexUnit, Dimension, DimensionError, ArithmeticDict
+import numpy as np
+from copy import copy, deepcopy
+from siunits.types import (
+    Unit, ComplexUnit, FixedUnit, Quantity, Dimension, DimensionError, ArithmeticDict, si_cache_info, si_cache_clear
+)
+from siunits.predefined import m, s, kg, N, ohm, km
 
 @pytest.fixture
 def A():
@@ -199,3 +209,192 @@ def test_complex_operations(A, B, C, A2, C_A, C_B, C_C, C_A2, C_1, C_2):
     assert C_1 * C_2 * C_1 == ComplexUnit(ArithmeticDict({A: 7, B: 8, C: 3}))
     assert C_1 / (C_2 / C_1) == ComplexUnit(ArithmeticDict({A: 1, B: 4, C: 1}))
     assert (C_1 ** 2) ** 2 == ComplexUnit(ArithmeticDict({A: 8, B: 12, C: 4}))
+
+# Canonical form Tests
+def test_complex_unit_interning(A, B, C_1, C_2):
+    assert A * B is A * B
+    assert ComplexUnit(ArithmeticDict({A: 1, B: -1})) is ComplexUnit({B: -1, A: 1})
+    assert C_1 * C_2 is C_1 * C_2
+
+def test_complex_unit_hash(A, B, C, C_1, C_2):
+    product = ComplexUnit(ArithmeticDict({A: 5, B: 5, C: 2}))
+    assert hash(C_1 * C_2) == hash(product)
+    assert {C_1 * C_2: 'product'}[product] == 'product'
+
+def test_fixed_unit_canonical_equality(A, B):
+    D = FixedUnit("D", A * B)
+    E = FixedUnit("E", A**1, multiplier=1000)
+    assert D == A * B
+    assert D**1 == A * B
+    assert hash(D**1) == hash(A * B)
+    assert E != A
+    assert E**1 != A**1
+    assert E**1 == ComplexUnit(ArithmeticDict({A: 1}), multiplier=1000)
+
+def test_unit_hash_follows_equality(A):
+    for unit, same in [(N, kg * m / s**2), (N, N**1), (A, A**1), (km, ComplexUnit({m: 1}, multiplier=1000))]:
+        assert unit == same
+        assert hash(unit) == hash(same)
+    assert {N: 'force'}[kg * m / s**2] == 'force'
+    assert {kg * m / s**2: 'force'}[N] == 'force'
+
+def test_complex_unit_immutable(C_1):
+    with pytest.raises(AttributeError):
+        C_1.multiplier = 2
+
+def test_units_copy_to_themselves(A, C_1):
+    D = FixedUnit("D", A * A)
+    for unit in (A, C_1, D):
+        assert copy(unit) is unit
+        assert deepcopy(unit) is unit
+
+# Record storage Tests
+def test_complex_unit_terms(A, B, C, C_1):
+    assert C_1.terms == tuple(sorted([(A.ordinal, 2), (B.ordinal, 3), (C.ordinal, 1)]))
+    assert list(C_1.records.items()) == sorted(C_1.records.items())
+    with pytest.raises(TypeError):
+        C_1.records[A] = 3
+
+def test_complex_unit_merge_drops_zero_exponents(A, B, C_1, C_2):
+    assert (C_1 / C_2).terms == tuple(sorted([(A.ordinal, -1), (B.ordinal, 1)]))
+    assert (C_1 / C_1).terms == ()
+    assert (C_1 ** 0).terms == ()
+
+# SI cache Tests
+def test_si_cache_statistics(A, B):
+    X = FixedUnit("X", A * B)
+    si_cache_clear()
+    X.si()
+    X.si()
+    info = si_cache_info()
+    assert info.misses >= 1
+    assert info.hits >= 1
+
+def test_si_cache_invalidated_on_redefinition(A, A2, B):
+    X = FixedUnit("X", A * B)
+    assert (X**2).si() == ComplexUnit(ArithmeticDict({A: 2, B: 2}))
+    generation = si_cache_info().generation
+
+    FixedUnit("X", A2 * B)
+    assert si_cache_info().generation > generation
+    assert (X**2).si() == ComplexUnit(ArithmeticDict({A2: 2, B: 2}))
+
+def test_si_cache_invalidation_threads():
+    from concurrent.futures import ThreadPoolExecutor
+    from siunits.types import _si_cache
+
+    generation = si_cache_info().generation
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda _: [_si_cache.invalidate() for _ in range(1000)], range(8)))
+    assert si_cache_info().generation == generation + 8000
+
+def test_offset_and_latex_redefinition(A):
+    X = FixedUnit("X_offset", A**1, offset=1)
+    generation = si_cache_info().generation
+
+    assert FixedUnit("X_offset", A**1, offset=2) is X
+    assert X.offset == 2
+    assert (X**1).offset == 2
+    assert si_cache_info().generation > generation
+
+    assert FixedUnit("X_offset", A**1, offset=2, latex_symbol='\\chi') is X
+    assert X.latex_symbol == '\\chi'
+    assert X._repr_latex_() == '$\\mathrm {\\chi}$'
+
+    # a LaTeX symbol that is not given is kept
+    assert FixedUnit("X_offset", A**1, offset=2) is X
+    assert X.latex_symbol == '\\chi'
+
+def test_pickle_units():
+    from siunits.predefined import degC
+    for unit in [m, N, kg * m / s**2, degC, degC.delta, km, ohm**2]:
+        assert pickle.loads(pickle.dumps(unit)) is unit
+
+def test_pickled_units_are_compact():
+    from siunits.predefined import kPa
+    for unit in [ohm, kPa, ohm / s, N * km / s**2]:
+        assert len(pickle.dumps(unit)) < 150
+
+    custom = Unit('custom', Dimension(length=1), multiplier=3)
+    assert pickle.loads(pickle.dumps(custom / s)) is custom / s
+
+def test_pickle_quantity():
+    q = np.arange(6.).reshape(2, 3) * N
+    buffers = []
+    data = pickle.dumps(q, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 1
+
+    loaded = pickle.loads(data, buffers=buffers)
+    assert type(loaded) is Quantity
+    assert loaded.unit is q.unit
+    assert np.shares_memory(loaded, q)
+
+    loaded = pickle.loads(pickle.dumps(q[:, ::2]))
+    assert loaded.unit is q.unit
+    assert np.array_equal(loaded.value, q.value[:, ::2])
+
+def test_pickle_in_fresh_interpreter():
+    # the units are looked up in a process that has not built them yet, or defined there when they are not predefined
+    custom = Unit('custom', Dimension(length=1), multiplier=3)
+    q = np.arange(3.) * (N * km / custom)
+    code = (
+        "import pickle, sys\n"
+        "import siunits\n"
+        "q = pickle.loads(sys.stdin.buffer.read())\n"
+        "print(q.unit, q.unit == siunits.N * siunits.km / siunits.unit['custom'], q.value.tolist())\n"
+    )
+    result = subprocess.run([sys.executable, '-c', code], input=pickle.dumps(q), capture_output=True, check=True)
+    assert result.stdout.decode().splitlines()[0] == f"{q.unit} True {q.value.tolist()}"
+
+def test_concurrent_interning():
+    from concurrent.futures import ThreadPoolExecutor
+
+    dimension = Dimension(length=2, time=-3)
+    barrier = threading.Barrier(8)
+
+    def build(_):
+        barrier.wait()
+        unit = Unit('racy', dimension)
+        fixed = FixedUnit('racy_fixed', unit**2, aliases=('racy_alias',))
+        return unit, fixed, fixed * unit / s
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(build, range(8)))
+
+    for result in results:
+        assert all(a is b for a, b in zip(result, results[0]))
+    assert len(Unit._by_symbol['racy']) == 1
+    assert Unit._lookup('racy_alias') == [results[0][1]]
+
+def test_complex_unit_leaves_multiplier():
+    scaled = Unit('scaled', Dimension(length=1), multiplier=3)
+    unit = scaled * s
+    assert scaled.multiplier == 3
+    assert unit.multiplier == 3
+    assert (scaled * s).si() == unit.si()
+
+def test_units_immutable(A):
+    D = FixedUnit("D_immutable", A * A, latex_symbol='\\mathcal{D}')
+    for unit in (A, D):
+        with pytest.raises(AttributeError):
+            unit.multiplier = 2
+        with pytest.raises(AttributeError):
+            unit.symbol = 'other'
+
+    # constructing it again returns it unchanged
+    assert FixedUnit("D_immutable", A * A) is D
+    assert D.latex_symbol == '\\mathcal{D}'
+
+def test_to_cached_and_invalidated(A, A2, B):
+    X = FixedUnit("X_to", A * B, multiplier=1000)
+    assert X.to(A * B) is X.to(A * B)
+    assert X.to(A * B).multiplier == 1000
+    assert X.to(A2 * B).multiplier == 1000
+
+    FixedUnit("X_to", A2 * B, multiplier=10)
+    assert X.to(A2 * B).multiplier == 10
+
+def test_format_memoized(C_1):
+    assert str(C_1) is str(C_1)
+    assert format(C_1, '.2f') == str(C_1)
+    assert C_1._repr_latex_() is C_1._repr_latex_()
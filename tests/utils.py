@@ -1,6 +1,6 @@
 import pytest
 from copy import deepcopy
-from siunits.utils import ArithmeticDict
+from siunits.utils import ArithmeticDict, BinaryDispatch, LRUCache, CacheInfo
 
 def test_arithmetic_dict_initialization():
     ad = ArithmeticDict()
@@ -150,3 +150,74 @@ def test_arithmetic_dict_deepcopy():
 #     args[1] = 3  # Mutate the argument list
 #     instance_a2 = TestClassA(1, 2)  # Use original arguments
 #     assert instance_a1 is instance_a2
+
+def test_binary_dispatch_most_specific():
+    f = BinaryDispatch('f')
+
+    @f.register
+    def f(a: int, b: int):
+        return 'int, int'
+    @f.register
+    def f(a: int | float, b: object):
+        return 'number, any'
+    @f.register
+    def f(a: object, b: object):
+        return 'any, any'
+
+    assert f(1, 2) == 'int, int'
+    assert f(1.0, 2) == 'number, any'
+    assert f(True, 'x') == 'number, any'
+    assert f('x', 1) == 'any, any'
+
+def test_binary_dispatch_ambiguous():
+    f = BinaryDispatch('f')
+
+    @f.register
+    def f(a: int, b: object):
+        return 1
+    @f.register
+    def f(a: object, b: int):
+        return 2
+
+    with pytest.raises(TypeError):
+        f(1, 1)
+    with pytest.raises(TypeError):
+        BinaryDispatch('g')(1, 1)
+
+def test_lru_cache():
+    cache = LRUCache(maxsize=2)
+    assert cache.get('a', lambda: 1) == 1
+    assert cache.get('b', lambda: 2) == 2
+    assert cache.get('a', lambda: 0) == 1
+    cache.get('c', lambda: 3)
+
+    assert 'b' not in cache and 'a' in cache
+    assert cache.info() == CacheInfo(hits=1, misses=3, maxsize=2, currsize=2)
+
+    cache.resize(1)
+    assert len(cache) == 1 and 'c' in cache
+
+def test_lru_cache_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = LRUCache(maxsize=16)
+
+    def work(offset):
+        return [cache.get(key % 32, lambda: key % 32) == key % 32 for key in range(offset, offset + 2000)]
+
+    with ThreadPoolExecutor(8) as pool:
+        assert all(all(results) for results in pool.map(work, range(8)))
+    assert len(cache) <= 16
+
+    # hits reorder under the same lock as eviction, so the statistics count every lookup
+    info = cache.info()
+    assert info.hits + info.misses == 8 * 2000
+
+    def churn(offset):
+        for key in range(offset, offset + 2000):
+            cache.get(key % 32, lambda: key % 32)
+            if key % 97 == 0:
+                cache.clear()
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(churn, range(8)))